@@ -13,11 +13,29 @@ from audiotsm.io.array import ArrayReader, ArrayWriter
 
 from .ffmpeg import get_ffprobe_path
 
+#: Samples reduced per block by :func:`get_max_volume`, so the minimum and
+#: maximum of each block are taken while it is still cached.
+_VOLUME_BLOCK_SAMPLES = 1 << 20
+
 
 def get_max_volume(samples: np.ndarray) -> float:
-    """Return the maximum absolute volume in the provided sample array."""
+    """Return the maximum absolute volume in the provided sample array.
+
+    Long recordings are reduced block by block: separate whole-array ``min`` and
+    ``max`` passes would stream a memory-mapped WAV from disk twice. Extremes
+    are converted to ``float`` before negation so ``-32768`` in 16-bit audio
+    does not overflow.
+    """
 
-    return float(max(-np.min(samples), np.max(samples)))
+    lowest = highest = 0.0
+    for start in range(0, max(len(samples), 1), _VOLUME_BLOCK_SAMPLES):
+        block = samples[start : start + _VOLUME_BLOCK_SAMPLES]
+        if start == 0:
+            lowest, highest = float(np.min(block)), float(np.max(block))
+        else:
+            lowest = min(lowest, float(np.min(block)))
+            highest = max(highest, float(np.max(block)))
+    return max(-lowest, highest)
 
 
 def is_valid_video_file(filename: str) -> bool:
@@ -135,12 +153,19 @@ def process_audio_chunks(
     blocking phase-vocoder pass; the callback is expected to raise when the user
     requested a stop, so cancellation is honored within a single chunk instead of
     only after the whole audio stage completes.
+
+    When ``audio_data`` is a single ``(samples, 1)`` column the result is returned
+    as a contiguous 1-D array, ready for :func:`talks_reducer.wav_io.write`,
+    instead of a ``(samples, 1)`` array that would need a strided column copy
+    before writing.
     """
 
     audio_buffers: List[np.ndarray] = []
     output_pointer = 0
     updated_chunks: List[List[int]] = [list(chunk) for chunk in chunks]
     normaliser = max(max_audio_volume, 1e-9)
+    source_channels = audio_data.shape[1] if audio_data.ndim > 1 else 1
+    flat_output = audio_data.ndim > 1 and source_channels == 1
 
     for batch_start in range(0, len(chunks), batch_size):
         batch_chunks = chunks[batch_start : batch_start + batch_size]
@@ -155,8 +180,7 @@ def process_audio_chunks(
             source_samples = max(0, end - start)
 
             if audio_chunk.size == 0:
-                channels = audio_data.shape[1] if audio_data.ndim > 1 else 1
-                batch_audio.append(np.zeros((0, channels)))
+                batch_audio.append(np.zeros((0, source_channels)))
                 if progress_callback is not None:
                     progress_callback(source_samples)
                 continue
@@ -177,7 +201,13 @@ def process_audio_chunks(
                 altered_audio_data[:audio_fade_envelope_size] *= mask
                 altered_audio_data[-audio_fade_envelope_size:] *= 1 - mask
 
-            batch_audio.append(altered_audio_data / normaliser)
+            # Normalise in place: the vocoder output is a fresh float buffer, so
+            # a divided copy would only add another chunk-sized temporary.
+            if altered_audio_data.dtype.kind == "f":
+                np.divide(altered_audio_data, normaliser, out=altered_audio_data)
+            else:
+                altered_audio_data = altered_audio_data / normaliser
+            batch_audio.append(altered_audio_data)
 
             if progress_callback is not None:
                 progress_callback(source_samples)
@@ -196,10 +226,22 @@ def process_audio_chunks(
             ]
             output_pointer = end_pointer
 
-    if audio_buffers:
-        output_audio_data = np.concatenate(audio_buffers)
+    if not audio_buffers:
+        if flat_output:
+            return np.zeros(0), updated_chunks
+        return np.zeros((0, source_channels)), updated_chunks
+
+    if flat_output:
+        # Promote the distinct buffer dtypes only; passing every buffer would
+        # exceed numpy's argument limit on long recordings.
+        output_dtype = np.result_type(*{buffer.dtype for buffer in audio_buffers})
+        output_audio_data = np.empty(output_pointer, dtype=output_dtype)
+        write_pointer = 0
+        for buffer in audio_buffers:
+            length = buffer.shape[0]
+            output_audio_data[write_pointer : write_pointer + length] = buffer[:, 0]
+            write_pointer += length
     else:
-        channels = audio_data.shape[1] if audio_data.ndim > 1 else 1
-        output_audio_data = np.zeros((0, channels))
+        output_audio_data = np.concatenate(audio_buffers)
 
     return output_audio_data, updated_chunks
@@ -6,7 +6,9 @@ from typing import List, Sequence, Tuple
 
 import numpy as np
 
-from .audio import get_max_volume
+#: Samples scanned per block by :func:`detect_loud_frames` (rounded down to
+#: whole frames), bounding its temporaries for memory-mapped recordings.
+_LOUDNESS_BLOCK_SAMPLES = 1 << 20
 
 
 def detect_loud_frames(
@@ -16,77 +18,126 @@ def detect_loud_frames(
     max_audio_volume: float,
     silent_threshold: float,
 ) -> np.ndarray:
-    """Return a boolean array indicating which frames contain loud audio."""
+    """Return a boolean array indicating which frames contain loud audio.
 
-    normaliser = max(max_audio_volume, 1e-9)
-    has_loud_audio = np.zeros(audio_frame_count, dtype=bool)
+    Per-frame peaks are computed with ``np.minimum.reduceat`` and
+    ``np.maximum.reduceat`` over the frame boundaries, so long recordings need
+    no Python-level loop per frame. The audio is scanned in blocks of whole
+    frames, keeping temporaries bounded when ``audio_data`` is memory-mapped.
+    Frames that cover no samples are silent.
+    """
 
-    for frame_index in range(audio_frame_count):
-        start = int(frame_index * samples_per_frame)
-        end = min(int((frame_index + 1) * samples_per_frame), audio_data.shape[0])
-        audio_chunk = audio_data[start:end]
-        chunk_max_volume = float(get_max_volume(audio_chunk)) / normaliser
-        if chunk_max_volume >= silent_threshold:
-            has_loud_audio[frame_index] = True
+    has_loud_audio = np.zeros(audio_frame_count, dtype=bool)
+    sample_count = audio_data.shape[0]
+    if audio_frame_count <= 0 or sample_count == 0:
+        return has_loud_audio
+
+    frame_positions = np.arange(audio_frame_count, dtype=np.float64)
+    starts = (frame_positions * samples_per_frame).astype(np.int64)
+    ends = np.minimum(
+        ((frame_positions + 1) * samples_per_frame).astype(np.int64), sample_count
+    )
+    frame_indices = np.flatnonzero(starts < ends)
+    frame_peaks = np.empty(len(frame_indices), dtype=np.float64)
+    frames_per_block = max(1, int(_LOUDNESS_BLOCK_SAMPLES // max(samples_per_frame, 1)))
+
+    for block_start in range(0, len(frame_indices), frames_per_block):
+        block = frame_indices[block_start : block_start + frames_per_block]
+        # Non-empty frames are contiguous, so each reduceat segment ends where
+        # the next frame starts and the block slice bounds the last one.
+        first_sample = int(starts[block[0]])
+        samples = audio_data[first_sample : int(ends[block[-1]])]
+        if samples.ndim > 1:
+            sample_min = samples.min(axis=1)
+            sample_max = samples.max(axis=1)
+        else:
+            sample_min = sample_max = samples
+        offsets = starts[block] - first_sample
+        # Widen before negating so a 16-bit ``-32768`` peak cannot overflow.
+        lows = np.minimum.reduceat(sample_min, offsets).astype(np.float64)
+        frame_peaks[block_start : block_start + len(block)] = np.maximum(
+            -lows, np.maximum.reduceat(sample_max, offsets)
+        )
 
+    normaliser = max(max_audio_volume, 1e-9)
+    has_loud_audio[frame_indices] = frame_peaks / normaliser >= silent_threshold
     return has_loud_audio
 
 
 def build_chunks(
     has_loud_audio: np.ndarray, frame_spreadage: int
 ) -> Tuple[List[List[int]], np.ndarray]:
-    """Return chunks describing which frame ranges should be retained."""
-
-    audio_frame_count = len(has_loud_audio)
-    chunks: List[List[int]] = [[0, 0, 0]]
-    should_include_frame = np.zeros(audio_frame_count, dtype=bool)
-
-    for frame_index in range(audio_frame_count):
-        start = int(max(0, frame_index - frame_spreadage))
-        end = int(min(audio_frame_count, frame_index + 1 + frame_spreadage))
-        should_include_frame[frame_index] = np.any(has_loud_audio[start:end])
-        if (
-            frame_index >= 1
-            and should_include_frame[frame_index]
-            != should_include_frame[frame_index - 1]
-        ):
-            chunks.append(
-                [chunks[-1][1], frame_index, int(should_include_frame[frame_index - 1])]
-            )
-
-    chunks.append(
-        [
-            chunks[-1][1],
-            audio_frame_count,
-            int(should_include_frame[audio_frame_count - 1]),
-        ]
+    """Return chunks describing which frame ranges should be retained.
+
+    A frame is kept when any loud frame lies within ``frame_spreadage`` frames
+    of it. The widened mask is built in one pass with a difference array (+1
+    where a loud frame's window opens, -1 where it closes, then a cumulative
+    sum), and chunk boundaries are read from the positions where it changes.
+    """
+
+    loud = np.asarray(has_loud_audio, dtype=bool)
+    audio_frame_count = len(loud)
+
+    spread = int(frame_spreadage)
+    # A negative margin leaves every frame's window empty, so nothing is kept.
+    loud_frames = np.flatnonzero(loud) if spread >= 0 else np.empty(0, np.int64)
+    window_edges = np.zeros(audio_frame_count + 1, dtype=np.int64)
+    np.add.at(window_edges, np.maximum(loud_frames - spread, 0), 1)
+    np.add.at(window_edges, np.minimum(loud_frames + spread + 1, audio_frame_count), -1)
+    should_include_frame = np.cumsum(window_edges[:-1]) > 0
+
+    transitions = (
+        np.flatnonzero(should_include_frame[1:] != should_include_frame[:-1]) + 1
     )
-    return chunks[1:], should_include_frame
-
-
-def get_tree_expression(chunks: Sequence[Sequence[int]]) -> str:
-    """Return the FFmpeg expression needed to map chunk timing updates."""
-
-    return "{}/TB/FR".format(_get_tree_expression_rec(chunks))
-
-
-def _get_tree_expression_rec(chunks: Sequence[Sequence[int]]) -> str:
-    if len(chunks) > 1:
-        split_index = int(len(chunks) / 2)
-        center = chunks[split_index]
-        return "if(lt(N,{}),{},{})".format(
-            center[0],
-            _get_tree_expression_rec(chunks[:split_index]),
-            _get_tree_expression_rec(chunks[split_index:]),
-        )
-    chunk = chunks[0]
+    boundaries = [0, *transitions.tolist(), audio_frame_count]
+    chunks: List[List[int]] = [
+        [start, stop, int(should_include_frame[stop - 1])]
+        for start, stop in zip(boundaries[:-1], boundaries[1:])
+    ]
+    return chunks, should_include_frame
+
+
+def get_tree_expression(chunks: Sequence[Sequence[int]], separator: str = ",") -> str:
+    """Return the FFmpeg expression needed to map chunk timing updates.
+
+    ``separator`` is placed between function arguments. Pass ``"\\,"`` to get
+    an expression that is already escaped for an FFmpeg filter graph, where a
+    bare comma would end the filter. The expression is assembled as a flat list
+    of fragments and joined once, instead of re-copying every nested
+    sub-expression at each level of the tree.
+    """
+
+    parts: List[str] = []
+    _append_tree_expression(chunks, 0, len(chunks), separator, parts)
+    parts.append("/TB/FR")
+    return "".join(parts)
+
+
+def _append_tree_expression(
+    chunks: Sequence[Sequence[int]],
+    start: int,
+    stop: int,
+    separator: str,
+    parts: List[str],
+) -> None:
+    if stop - start > 1:
+        split_index = start + (stop - start) // 2
+        parts.append(f"if(lt(N{separator}{chunks[split_index][0]}){separator}")
+        _append_tree_expression(chunks, start, split_index, separator, parts)
+        parts.append(separator)
+        _append_tree_expression(chunks, split_index, stop, separator, parts)
+        parts.append(")")
+        return
+
+    chunk = chunks[start]
     chunk_duration = chunk[1] - chunk[0]
     if chunk_duration == 0:
         # If chunk has zero duration, use identity transformation
-        return "PTS"
+        parts.append("PTS")
+        return
     local_speedup = (chunk[3] - chunk[2]) / chunk_duration
     offset = -chunk[0] * local_speedup + chunk[2]
-    return "N*{}{:+}".format(local_speedup, offset)
+    parts.append("N*{}{:+}".format(local_speedup, offset))
 
 
 __all__ = [
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import ipaddress
 import socket
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import closing
 from http.client import HTTPConnection
 from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Set
@@ -12,7 +12,10 @@ from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Set
 DEFAULT_PORT = 9005
 DEFAULT_TIMEOUT = 0.4
 
-_EXCLUDED_HOSTS = {"127.0.0.1", "localhost", "0.0.0.0"}
+#: Concurrent probes; enough to sweep a /24 in a few timeout windows.
+_MAX_PROBE_WORKERS = 64
+
+_EXCLUDED_HOSTS = frozenset({"127.0.0.1", "localhost", "0.0.0.0"})
 
 
 AddressSource = Callable[[], Iterable[str]]
@@ -170,36 +173,33 @@ def discover_servers(
     """
 
     if hosts is None:
-        candidates = sorted(
-            {
-                host
-                for host in _build_default_host_candidates(
-                    address_sources=address_sources
-                )
-                if _should_include_host(host)
-            }
-        )
+        # Already filtered, de-duplicated, and sorted.
+        candidates = _build_default_host_candidates(address_sources=address_sources)
     else:
         candidates = sorted({host for host in hosts if _should_include_host(host)})
 
-    results: List[str] = []
     total = len(candidates)
+    found: List[Optional[str]] = [None] * total
 
     if progress_callback is not None:
         progress_callback(0, total)
 
     probe_fn: ProbeHost = _probe_host if probe_host is None else probe_host
 
-    with ThreadPoolExecutor(max_workers=32) as executor:
-        scanned = 0
-        for url in executor.map(lambda host: probe_fn(host, port, timeout), candidates):
-            if url and url not in results:
-                results.append(url)
-            scanned += 1
+    with ThreadPoolExecutor(max_workers=_MAX_PROBE_WORKERS) as executor:
+        futures = {
+            executor.submit(probe_fn, host, port, timeout): index
+            for index, host in enumerate(candidates)
+        }
+        # Count probes as they finish so one slow host does not stall the
+        # progress of every host queued behind it.
+        for scanned, future in enumerate(as_completed(futures), start=1):
+            found[futures[future]] = future.result()
             if progress_callback is not None:
                 progress_callback(scanned, total)
 
-    return results
+    # Report servers in candidate order, not completion or URL string order.
+    return list(dict.fromkeys(url for url in found if url))
 
 
 __all__ = ["discover_servers"]
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import contextlib
+import io
 import os
+import queue
 import re
+import shlex
+import signal
 import subprocess
 import sys
+import threading
+import time
 from shutil import which as _shutil_which
-from typing import List, Optional, Sequence, Tuple
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple
 
 from .progress import ProgressReporter, TqdmProgressReporter
 
@@ -208,6 +215,21 @@ def get_ffprobe_path(prefer_global: bool = False) -> str:
     return cached
 
 
+def _clear_ffmpeg_path_cache() -> None:
+    """Forget resolved FFmpeg/ffprobe locations so the next lookup searches again.
+
+    Paths are resolved once per process because each search walks ``PATH`` and
+    the common install folders; tests use this to start from a clean slate.
+    """
+
+    global _GLOBAL_FFMPEG_AVAILABLE
+
+    for cache in (_FFMPEG_PATH_CACHE, _FFPROBE_PATH_CACHE):
+        for prefer_global in cache:
+            cache[prefer_global] = None
+    _GLOBAL_FFMPEG_AVAILABLE = None
+
+
 def _normalize_executable_path(candidate: Optional[str]) -> Optional[str]:
     """Return an absolute path for *candidate* when it can be resolved."""
 
@@ -254,6 +276,7 @@ def is_global_ffmpeg_available() -> bool:
 
 _ENCODER_LISTING: dict[str, str] = {}
 _ENCODER_OPTIONS: dict[tuple[str, str], str] = {}
+_HWACCEL_LISTING: dict[str, str] = {}
 
 
 def _probe_ffmpeg_output(args: List[str]) -> Optional[str]:
@@ -302,6 +325,35 @@ def _get_encoder_listing(ffmpeg_path: Optional[str] = None) -> Optional[str]:
     return normalized
 
 
+def _get_hwaccel_listing(ffmpeg_path: Optional[str] = None) -> Optional[str]:
+    """Return the cached FFmpeg ``-hwaccels`` output for *ffmpeg_path*."""
+
+    ffmpeg_path = ffmpeg_path or get_ffmpeg_path()
+    cache_key = os.path.abspath(ffmpeg_path)
+    if cache_key in _HWACCEL_LISTING:
+        return _HWACCEL_LISTING[cache_key]
+
+    output = _probe_ffmpeg_output([ffmpeg_path, "-hide_banner", "-hwaccels"])
+    if output is None:
+        return None
+
+    normalized = output.lower()
+    _HWACCEL_LISTING[cache_key] = normalized
+    return normalized
+
+
+def _clear_hardware_probe_cache() -> None:
+    """Forget cached hwaccel/encoder probes so the next check re-runs FFmpeg.
+
+    The probes are per-process constants for a given binary; tests use this to
+    start from a clean slate.
+    """
+
+    _HWACCEL_LISTING.clear()
+    _ENCODER_LISTING.clear()
+    _ENCODER_OPTIONS.clear()
+
+
 def encoder_available(encoder_name: str, ffmpeg_path: Optional[str] = None) -> bool:
     """Return True if ``encoder_name`` is listed in the FFmpeg encoder catalog."""
 
@@ -344,12 +396,17 @@ def encoder_supports_option(
 
 
 def check_cuda_available(ffmpeg_path: Optional[str] = None) -> bool:
-    """Return whether CUDA hardware encoders are usable in the FFmpeg build."""
+    """Return whether CUDA hardware encoders are usable in the FFmpeg build.
+
+    The ``-hwaccels`` and ``-encoders`` listings are cached per binary, so only
+    the first call in a process spawns FFmpeg; see
+    :func:`_clear_hardware_probe_cache` to force a re-probe.
+    """
 
     ffmpeg_path = ffmpeg_path or get_ffmpeg_path()
 
-    hwaccels_output = _probe_ffmpeg_output([ffmpeg_path, "-hide_banner", "-hwaccels"])
-    if not hwaccels_output or "cuda" not in hwaccels_output.lower():
+    hwaccels_output = _get_hwaccel_listing(ffmpeg_path)
+    if not hwaccels_output or "cuda" not in hwaccels_output:
         return False
 
     encoder_output = _get_encoder_listing(ffmpeg_path)
@@ -374,8 +431,8 @@ def check_videotoolbox_available(ffmpeg_path: Optional[str] = None) -> bool:
 
     ffmpeg_path = ffmpeg_path or get_ffmpeg_path()
 
-    hwaccels_output = _probe_ffmpeg_output([ffmpeg_path, "-hide_banner", "-hwaccels"])
-    if not hwaccels_output or "videotoolbox" not in hwaccels_output.lower():
+    hwaccels_output = _get_hwaccel_listing(ffmpeg_path)
+    if not hwaccels_output or "videotoolbox" not in hwaccels_output:
         return False
 
     return any(
@@ -421,9 +478,6 @@ def _videotoolbox_encoder_args(
 def _force_kill_process(process: subprocess.Popen) -> None:
     """Terminate an FFmpeg process forcefully, including its process group."""
 
-    import signal
-    import time
-
     if process.poll() is not None:
         return
 
@@ -471,7 +525,10 @@ def run_timed_ffmpeg_command(
     process_callback: Optional[callable] = None,
     stop_requested: Optional[callable] = None,
     stall_timeout: float = DEFAULT_STALL_TIMEOUT,
-) -> None:
+    capture_stdout: bool = False,
+    duration_callback: Optional[Callable[[float], None]] = None,
+    stdin_chunks: Optional[Iterable[bytes]] = None,
+) -> Optional[bytes]:
     """Execute an FFmpeg command while streaming progress information.
 
     Args:
@@ -479,13 +536,18 @@ def run_timed_ffmpeg_command(
         stop_requested: Optional callable returning True when processing should abort
         stall_timeout: Seconds to wait for new output before aborting. Set to 0 to
             disable the watchdog.
+        capture_stdout: Read FFmpeg's stdout as raw bytes (for ``pipe:1``
+            outputs) and return them once the command succeeds. Otherwise the
+            function returns ``None``.
+        duration_callback: Optional callback that receives the last ``time=``
+            position FFmpeg reported, in seconds, once the command succeeds.
+            This is the duration of the written output, so callers can skip
+            re-probing the file. It is not called when no time was reported.
+        stdin_chunks: Optional byte chunks written to FFmpeg's stdin from a
+            background thread (for ``-i pipe:0`` inputs). Stdin is closed once
+            the chunks are exhausted or FFmpeg stops reading.
     """
 
-    import queue
-    import shlex
-    import threading
-    import time
-
     try:
         args = shlex.split(command)
     except Exception as exc:  # pragma: no cover - defensive logging
@@ -503,14 +565,17 @@ def run_timed_ffmpeg_command(
     if sys.platform != "win32":
         popen_kwargs["start_new_session"] = True
 
+    # Piped input and output must stay binary, so only stderr is decoded then.
+    binary_pipes = capture_stdout or stdin_chunks is not None
+    if not binary_pipes:
+        popen_kwargs.update(universal_newlines=True, bufsize=1, errors="replace")
+
     try:
         process = subprocess.Popen(
             args,
+            stdin=subprocess.PIPE if stdin_chunks is not None else None,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            universal_newlines=True,
-            bufsize=1,
-            errors="replace",
             creationflags=creationflags,
             **popen_kwargs,
         )
@@ -522,13 +587,17 @@ def run_timed_ffmpeg_command(
     if process_callback:
         process_callback(process)
 
+    stderr_stream = process.stderr
+    if binary_pipes:
+        stderr_stream = io.TextIOWrapper(process.stderr, errors="replace")
+
     # Feed stderr lines into a queue so the main loop can poll with a timeout
     # instead of blocking indefinitely on readline().
     line_queue: queue.Queue[Optional[str]] = queue.Queue()
 
     def _reader() -> None:
         try:
-            for ln in iter(process.stderr.readline, ""):
+            for ln in iter(stderr_stream.readline, ""):
                 line_queue.put(ln)
         finally:
             line_queue.put(None)  # sentinel: EOF
@@ -536,12 +605,37 @@ def run_timed_ffmpeg_command(
     reader_thread = threading.Thread(target=_reader, daemon=True)
     reader_thread.start()
 
+    # Drain piped stdout concurrently so FFmpeg never blocks on a full pipe.
+    stdout_chunks: List[bytes] = []
+    stdout_thread: Optional[threading.Thread] = None
+    if capture_stdout:
+        stdout_thread = threading.Thread(
+            target=lambda: stdout_chunks.append(process.stdout.read()), daemon=True
+        )
+        stdout_thread.start()
+
+    if stdin_chunks is not None:
+
+        def _feed_stdin() -> None:
+            try:
+                for chunk in stdin_chunks:
+                    process.stdin.write(chunk)
+            except (OSError, ValueError):
+                # FFmpeg exited or stopped reading; its exit code reports why.
+                pass
+            finally:
+                with contextlib.suppress(OSError, ValueError):
+                    process.stdin.close()
+
+        threading.Thread(target=_feed_stdin, daemon=True).start()
+
     progress_reporter = reporter or TqdmProgressReporter()
     task_manager = progress_reporter.task(desc=desc, total=total, unit=unit)
     with task_manager as progress:
         last_output_time = time.monotonic()
         last_logged_percent = -1
         last_milestone_time = 0.0
+        last_output_seconds: Optional[float] = None
 
         while True:
             # Check stop flag
@@ -602,6 +696,11 @@ def run_timed_ffmpeg_command(
             ):
                 progress_reporter.log(line.strip())
 
+            if duration_callback is not None:
+                seconds = _parse_ffmpeg_time(line)
+                if seconds is not None:
+                    last_output_seconds = seconds
+
             match = re.search(r"frame=\s*(\d+)", line)
             if match:
                 try:
@@ -621,9 +720,11 @@ def run_timed_ffmpeg_command(
                     pass
 
         process.wait()
+        if stdout_thread is not None:
+            stdout_thread.join()
 
         if process.returncode != 0:
-            error_output = process.stderr.read()
+            error_output = stderr_stream.read()
             print(
                 f"\nFFmpeg error (return code {process.returncode}):", file=sys.stderr
             )
@@ -632,6 +733,28 @@ def run_timed_ffmpeg_command(
 
         progress.finish()
 
+    if duration_callback is not None and last_output_seconds is not None:
+        duration_callback(last_output_seconds)
+
+    return b"".join(stdout_chunks) if capture_stdout else None
+
+
+_FFMPEG_TIME_PATTERN = re.compile(r"time=\s*(-?)(\d+):(\d{2}):(\d{2}(?:\.\d+)?)")
+
+
+def _parse_ffmpeg_time(line: str) -> Optional[float]:
+    """Return the ``time=HH:MM:SS.xx`` position in *line* as seconds.
+
+    Returns ``None`` when the line has no time stamp (or reports ``N/A``).
+    """
+
+    match = _FFMPEG_TIME_PATTERN.search(line)
+    if match is None:
+        return None
+    sign, hours, minutes, seconds = match.groups()
+    value = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+    return -value if sign else value
+
 
 def build_trim_input_args(
     cut_start_seconds: float = 0.0,
@@ -753,6 +876,41 @@ def build_extract_audio_command(
     return " ".join(command_parts)
 
 
+def build_extract_audio_pipe_command(
+    input_file: str,
+    sample_rate: int,
+    hwaccel: Optional[List[str]] = None,
+    ffmpeg_path: Optional[str] = None,
+    cut_start_seconds: float = 0.0,
+    cut_end_seconds: float = 0.0,
+    channels: int = 2,
+) -> str:
+    """Build the FFmpeg command that streams raw 16-bit PCM audio to stdout.
+
+    The output is headerless interleaved little-endian ``s16le`` samples at
+    *sample_rate* with *channels* channels, meant to be read with
+    ``run_timed_ffmpeg_command(..., capture_stdout=True)`` instead of a
+    temporary WAV file.
+    """
+
+    hwaccel = hwaccel or []
+    ffmpeg_path = ffmpeg_path or get_ffmpeg_path()
+    command_parts: List[str] = [f'"{ffmpeg_path}"']
+    command_parts.extend(hwaccel)
+    command_parts.extend(build_trim_input_args(cut_start_seconds, cut_end_seconds))
+    command_parts.extend(
+        [
+            f'-i "{input_file}"',
+            f"-ac {channels}",
+            f"-ar {sample_rate}",
+            "-vn",
+            "-f s16le -acodec pcm_s16le pipe:1",
+            "-hide_banner -loglevel warning -stats",
+        ]
+    )
+    return " ".join(command_parts)
+
+
 def build_audio_only_command(
     input_file: str,
     audio_file: Optional[str],
@@ -795,6 +953,18 @@ def build_audio_only_command(
     return " ".join(command_parts)
 
 
+def build_raw_audio_input_args(
+    sample_format: str, sample_rate: int, channels: int
+) -> str:
+    """Return the input flags describing raw PCM samples fed through a pipe.
+
+    ``sample_format`` is an FFmpeg raw format name such as ``"f64le"`` or
+    ``"s16le"``; the rate and channel count must match the piped samples.
+    """
+
+    return f"-f {sample_format} -ar {int(sample_rate)} -ac {int(channels)}"
+
+
 def build_video_commands(
     input_file: str,
     audio_file: Optional[str],
@@ -812,6 +982,7 @@ def build_video_commands(
     keep_input_audio: bool = False,
     cut_start_seconds: float = 0.0,
     cut_end_seconds: float = 0.0,
+    audio_stdin_format: Optional[str] = None,
 ) -> Tuple[str, Optional[str], bool]:
     """Create the FFmpeg command strings used to render the final video output.
 
@@ -830,6 +1001,9 @@ def build_video_commands(
         keep_input_audio: When True and ``audio_file`` is None, map the audio
             track from the input file directly into the output using stream
             copy (``-c:a copy``) instead of disabling audio.
+        audio_stdin_format: Raw input flags from :func:`build_raw_audio_input_args`.
+            When given, the processed audio is read from ``pipe:0`` instead of
+            ``audio_file``, so no intermediate WAV has to be written.
     """
 
     ffmpeg_path = ffmpeg_path or get_ffmpeg_path()
@@ -842,11 +1016,13 @@ def build_video_commands(
 
     trim_args = build_trim_input_args(cut_start_seconds, cut_end_seconds)
     input_parts = trim_args + [f'-i "{input_file}"']
-    if audio_file:
+    if audio_stdin_format:
+        input_parts.append(f"{audio_stdin_format} -i pipe:0")
+    elif audio_file:
         input_parts.append(f'-i "{audio_file}"')
 
     output_parts: List[str] = []
-    if audio_file:
+    if audio_file or audio_stdin_format:
         output_parts.append("-map 0:v:0 -map 1:a")
     elif keep_input_audio:
         output_parts.append("-map 0:v:0 -map 0:a?")
@@ -1042,7 +1218,7 @@ def build_video_commands(
     use_gpu_encoder = primary_uses_gpu
 
     audio_parts: List[str] = []
-    if audio_file:
+    if audio_file or audio_stdin_format:
         audio_parts.append("-c:a aac")
     elif keep_input_audio:
         audio_parts.append("-c:a copy")
@@ -1093,6 +1269,8 @@ __all__ = [
     "run_timed_ffmpeg_command",
     "build_trim_input_args",
     "build_extract_audio_command",
+    "build_extract_audio_pipe_command",
+    "build_raw_audio_input_args",
     "get_video_duration",
     "build_video_commands",
     "shutil_which",
@@ -135,6 +135,11 @@ except ModuleNotFoundError:  # pragma: no cover - runtime dependency
     DND_FILES = None  # type: ignore[assignment]
     TkinterDnD = None  # type: ignore[assignment]
 
+# Status lines such as ``0:42 / 3:10 ... 2.5x`` report an in-flight encode.
+_ENCODE_STATUS_PATTERN = re.compile(
+    r"\d+:\d{2}(?::\d{2})?(?: / \d+:\d{2}(?::\d{2})?)?.*\d+\.?\d*x"
+)
+
 
 def _format_seed_number(value: object) -> str:
     """Render a numeric CLI value for a ``StringVar`` without a trailing ``.0``.
@@ -2004,10 +2009,7 @@ class TalksReducerGUI:
         if "extracting audio" in status_lower:
             return STATUS_COLORS["processing"]
 
-        if re.search(
-            r"\d+:\d{2}(?::\d{2})?(?: / \d+:\d{2}(?::\d{2})?)?.*\d+\.?\d*x",
-            status,
-        ):
+        if _ENCODE_STATUS_PATTERN.search(status):
             return STATUS_COLORS["processing"]
 
         if "time:" in status_lower and "size:" in status_lower:
@@ -21,6 +21,24 @@ _TASK_PERCENT_PATTERN = re.compile(
     re.IGNORECASE,
 )
 
+# Compiled once: these run against every streamed log line and FFmpeg status
+# update during a job.
+_SUMMARY_PERCENT_PATTERN = re.compile(r"\(([0-9]+(?:\.[0-9]+)?)%\)")
+_SOURCE_DURATION_PATTERN = re.compile(
+    r"source metadata: duration:\s*([\d.]+)s", re.IGNORECASE
+)
+_ENCODE_TOTAL_FRAMES_PATTERN = re.compile(
+    r"Final encode target frames(?: \(fallback\))?:\s*(\d+)"
+)
+_CURRENT_FRAME_PATTERN = re.compile(r"frame=\s*(\d+)")
+_ENCODE_TARGET_DURATION_PATTERN = re.compile(
+    r"Final encode target duration(?: \(fallback\))?:\s*([\d.]+)s"
+)
+_VIDEO_DURATION_PATTERN = re.compile(r"Duration:\s*(\d{2}):(\d{2}):(\d{2}\.\d+)")
+_FFMPEG_TIME_PATTERN = re.compile(r"time=(\d{2}):(\d{2}):(\d{2})\.\d+")
+_FFMPEG_SPEED_PATTERN = re.compile(r"speed=\s*([\d.]+)x")
+_NEW_JOB_PATTERN = re.compile(r"processing \d+/\d+:")
+
 
 def default_remote_destination(
     input_file: Path,
@@ -57,14 +75,14 @@ def parse_ratios_from_summary(summary: str) -> Tuple[Optional[float], Optional[f
 
     for line in summary.splitlines():
         if "**Duration:**" in line:
-            match = re.search(r"\(([0-9]+(?:\.[0-9]+)?)%\)", line)
+            match = _SUMMARY_PERCENT_PATTERN.search(line)
             if match:
                 try:
                     time_ratio = float(match.group(1)) / 100
                 except ValueError:
                     time_ratio = None
         elif "**Size:**" in line:
-            match = re.search(r"\(([0-9]+(?:\.[0-9]+)?)%\)", line)
+            match = _SUMMARY_PERCENT_PATTERN.search(line)
             if match:
                 try:
                     size_ratio = float(match.group(1)) / 100
@@ -77,11 +95,7 @@ def parse_ratios_from_summary(summary: str) -> Tuple[Optional[float], Optional[f
 def parse_source_duration_seconds(message: str) -> tuple[bool, Optional[float]]:
     """Return whether *message* includes source duration metadata."""
 
-    metadata_match = re.search(
-        r"source metadata: duration:\s*([\d.]+)s",
-        message,
-        re.IGNORECASE,
-    )
+    metadata_match = _SOURCE_DURATION_PATTERN.search(message)
     if not metadata_match:
         return False, None
 
@@ -94,9 +108,7 @@ def parse_source_duration_seconds(message: str) -> tuple[bool, Optional[float]]:
 def parse_encode_total_frames(message: str) -> tuple[bool, Optional[int]]:
     """Extract final encode frame totals from *message* when present."""
 
-    frame_total_match = re.search(
-        r"Final encode target frames(?: \(fallback\))?:\s*(\d+)", message
-    )
+    frame_total_match = _ENCODE_TOTAL_FRAMES_PATTERN.search(message)
     if not frame_total_match:
         return False, None
 
@@ -118,7 +130,7 @@ def is_encode_total_frames_unknown(normalized_message: str) -> bool:
 def parse_current_frame(message: str) -> tuple[bool, Optional[int]]:
     """Extract the current encode frame from *message* when available."""
 
-    frame_match = re.search(r"frame=\s*(\d+)", message)
+    frame_match = _CURRENT_FRAME_PATTERN.search(message)
     if not frame_match:
         return False, None
 
@@ -131,10 +143,7 @@ def parse_current_frame(message: str) -> tuple[bool, Optional[int]]:
 def parse_encode_target_duration(message: str) -> tuple[bool, Optional[float]]:
     """Extract encode target duration from *message* if reported."""
 
-    encode_duration_match = re.search(
-        r"Final encode target duration(?: \(fallback\))?:\s*([\d.]+)s",
-        message,
-    )
+    encode_duration_match = _ENCODE_TARGET_DURATION_PATTERN.search(message)
     if not encode_duration_match:
         return False, None
 
@@ -156,7 +165,7 @@ def is_encode_target_duration_unknown(normalized_message: str) -> bool:
 def parse_video_duration_seconds(message: str) -> tuple[bool, Optional[float]]:
     """Parse the input video duration from *message* when FFmpeg prints it."""
 
-    duration_match = re.search(r"Duration:\s*(\d{2}):(\d{2}):(\d{2}\.\d+)", message)
+    duration_match = _VIDEO_DURATION_PATTERN.search(message)
     if not duration_match:
         return False, None
 
@@ -174,8 +183,8 @@ def parse_video_duration_seconds(message: str) -> tuple[bool, Optional[float]]:
 def parse_ffmpeg_progress(message: str) -> tuple[bool, Optional[tuple[int, str]]]:
     """Parse FFmpeg progress information from *message* if available."""
 
-    time_match = re.search(r"time=(\d{2}):(\d{2}):(\d{2})\.\d+", message)
-    speed_match = re.search(r"speed=\s*([\d.]+)x", message)
+    time_match = _FFMPEG_TIME_PATTERN.search(message)
+    speed_match = _FFMPEG_SPEED_PATTERN.search(message)
 
     if not (time_match and speed_match):
         return False, None
@@ -482,7 +491,7 @@ class SummaryManager:
             return False
 
         if normalized_message.startswith("processing"):
-            is_new_job = bool(re.match(r"processing \d+/\d+:", normalized_message))
+            is_new_job = bool(_NEW_JOB_PATTERN.match(normalized_message))
             should_reset = self.gui._status_state.lower() != "processing" or is_new_job
             if should_reset:
                 # Re-base the monotonic floor along with the visible bar. Zeroing
@@ -20,6 +20,11 @@ __all__ = ["TaskbarProgress", "create_taskbar_progress"]
 _TBPF_NOPROGRESS = 0x0
 _TBPF_NORMAL = 0x2
 _TBPF_ERROR = 0x4
+_STATE_FLAGS = {
+    "normal": _TBPF_NORMAL,
+    "error": _TBPF_ERROR,
+    "none": _TBPF_NOPROGRESS,
+}
 
 # ``ITaskbarList3`` vtable slots, counting the three inherited ``IUnknown``
 # entries: HrInit(3), AddTab, DeleteTab, ActivateTab, SetActiveAlt,
@@ -36,11 +41,31 @@ _COINIT_APARTMENTTHREADED = 0x2
 _S_OK = 0x00000000
 _S_FALSE = 0x00000001
 _RPC_E_CHANGED_MODE = 0x80010106
+# ``CoInitializeEx`` results that leave COM usable on this thread, as the
+# signed values ``ole32`` returns: ``S_FALSE`` means COM was already initialized
+# here and ``RPC_E_CHANGED_MODE`` that another apartment model won.
+_COM_READY_RESULTS = (_S_OK, _S_FALSE, ctypes.c_int32(_RPC_E_CHANGED_MODE).value)
+
+if sys.platform == "win32":  # pragma: no cover - Windows-only COM prototypes
+    # Built once at import: each takes the interface pointer as ``this`` first.
+    _HR_INIT_PROTOTYPE = ctypes.WINFUNCTYPE(ctypes.c_long, ctypes.c_void_p)
+    _SET_PROGRESS_VALUE_PROTOTYPE = ctypes.WINFUNCTYPE(
+        ctypes.c_long,
+        ctypes.c_void_p,
+        ctypes.c_void_p,
+        ctypes.c_ulonglong,
+        ctypes.c_ulonglong,
+    )
+    _SET_PROGRESS_STATE_PROTOTYPE = ctypes.WINFUNCTYPE(
+        ctypes.c_long, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_int
+    )
 
 
 class _NullBackend:
     """Backend used when no taskbar indicator is available."""
 
+    __slots__ = ()
+
     def set_value(self, percent: float) -> None:
         """Ignore the requested progress value."""
 
@@ -63,6 +88,8 @@ class TaskbarProgress:
     :meth:`begin` reactivates value updates.
     """
 
+    __slots__ = ("_backend", "_active", "_held", "_value")
+
     def __init__(self, backend: Any) -> None:
         self._backend = backend
         self._active = False
@@ -99,7 +126,10 @@ class TaskbarProgress:
 
         if self._held or not self._active:
             return
-        self._value = max(0.0, min(100.0, float(percent)))
+        value = float(percent)
+        # Conditional expressions avoid two builtin calls per progress tick; a
+        # NaN still lands on 100 exactly as ``min``/``max`` would put it.
+        self._value = 0.0 if value < 0.0 else value if value <= 100.0 else 100.0
         self._backend.set_value(self._value)
 
     def finish(self) -> None:
@@ -164,45 +194,82 @@ class _GUID(ctypes.Structure):
         )
 
 
+# Parsed once at import; ``CoCreateInstance`` only reads these structures.
+_CLSID_TASKBAR_LIST_GUID = _GUID.from_string(_CLSID_TASKBAR_LIST)
+_IID_ITASKBAR_LIST3_GUID = _GUID.from_string(_IID_ITASKBAR_LIST3)
+
+
 class _Win32Backend:
-    """Drive ``ITaskbarList3`` on the thread that initialized COM."""
+    """Drive ``ITaskbarList3`` on the thread that initialized COM.
+
+    The indicator only resolves whole percents, so updates that would repaint
+    the value or state already shown are skipped instead of crossing into COM
+    for every progress callback.
+    """
+
+    __slots__ = (
+        "_hwnd",
+        "_hwnd_arg",
+        "_ptr",
+        "_last_value",
+        "_last_flags",
+        "_set_progress_value",
+        "_set_progress_state",
+    )
 
     def __init__(self, hwnd: int, taskbar_ptr: ctypes.c_void_p) -> None:
         self._hwnd = hwnd
+        # Passing ready-made ``c_void_p`` arguments spares ctypes converting the
+        # handle on every call.
+        self._hwnd_arg = ctypes.c_void_p(hwnd)
         self._ptr = taskbar_ptr
+        self._last_value: Optional[int] = None
+        self._last_flags: Optional[int] = None
+        # A live COM object's vtable never changes, so the progress methods are
+        # bound once instead of on every update.
+        self._set_progress_value = self._vtable_entry(
+            _VTBL_SET_PROGRESS_VALUE, _SET_PROGRESS_VALUE_PROTOTYPE
+        )
+        self._set_progress_state = self._vtable_entry(
+            _VTBL_SET_PROGRESS_STATE, _SET_PROGRESS_STATE_PROTOTYPE
+        )
 
-    def _vtable_entry(self, index: int, *argtypes: Any) -> Any:
-        """Return a callable bound to vtable slot *index* of the COM object."""
+    def _vtable_entry(self, index: int, prototype: Any) -> Any:
+        """Return a callable bound to vtable slot *index* of the COM object.
 
-        vtable = ctypes.cast(
-            self._ptr, ctypes.POINTER(ctypes.POINTER(ctypes.c_void_p))
-        )[0]
-        prototype = ctypes.WINFUNCTYPE(ctypes.c_long, ctypes.c_void_p, *argtypes)
-        return prototype(vtable[index])
+        The object's first word points at its vtable; both reads go straight to
+        memory instead of casting through ``POINTER(POINTER(c_void_p))``.
+        """
+
+        vtable = ctypes.c_void_p.from_address(self._ptr.value).value
+        slot = vtable + index * ctypes.sizeof(ctypes.c_void_p)
+        return prototype(ctypes.c_void_p.from_address(slot).value)
 
     def set_value(self, percent: float) -> None:
         """Set the indicator to *percent* of a 0-100 range."""
 
-        with suppress(Exception):
-            self._vtable_entry(
-                _VTBL_SET_PROGRESS_VALUE,
-                ctypes.c_void_p,
-                ctypes.c_ulonglong,
-                ctypes.c_ulonglong,
-            )(self._ptr, self._hwnd, int(round(percent)), 100)
+        completed = int(round(percent))
+        if completed == self._last_value:
+            return
+        try:
+            self._set_progress_value(self._ptr, self._hwnd_arg, completed, 100)
+        except Exception:
+            return
+        self._last_value = completed
 
     def set_state(self, state: str) -> None:
         """Switch the indicator between ``normal``, ``error``, and ``none``."""
 
-        flags = {
-            "normal": _TBPF_NORMAL,
-            "error": _TBPF_ERROR,
-            "none": _TBPF_NOPROGRESS,
-        }.get(state, _TBPF_NOPROGRESS)
-        with suppress(Exception):
-            self._vtable_entry(_VTBL_SET_PROGRESS_STATE, ctypes.c_void_p, ctypes.c_int)(
-                self._ptr, self._hwnd, flags
-            )
+        flags = _STATE_FLAGS.get(state, _TBPF_NOPROGRESS)
+        if flags == self._last_flags:
+            return
+        try:
+            self._set_progress_state(self._ptr, self._hwnd_arg, flags)
+        except Exception:
+            return
+        self._last_flags = flags
+        # Leaving a state can reset the bar, so the next value is always sent.
+        self._last_value = None
 
 
 def _resolve_hwnd(root: Any) -> Optional[int]:
@@ -225,18 +292,15 @@ def _create_win32_backend(root: Any) -> Optional[_Win32Backend]:
     """Instantiate ``ITaskbarList3`` for *root*, or return ``None`` on failure."""
 
     ole32 = ctypes.windll.ole32
-    result = ole32.CoInitializeEx(None, _COINIT_APARTMENTTHREADED)
-    # ``S_FALSE`` means COM was already initialized on this thread and
-    # ``RPC_E_CHANGED_MODE`` that another apartment model won; both are usable.
-    if result not in (_S_OK, _S_FALSE, ctypes.c_long(_RPC_E_CHANGED_MODE).value):
+    if ole32.CoInitializeEx(None, _COINIT_APARTMENTTHREADED) not in _COM_READY_RESULTS:
         return None
 
     taskbar_ptr = ctypes.c_void_p()
     hresult = ole32.CoCreateInstance(
-        ctypes.byref(_GUID.from_string(_CLSID_TASKBAR_LIST)),
+        ctypes.byref(_CLSID_TASKBAR_LIST_GUID),
         None,
         _CLSCTX_INPROC_SERVER,
-        ctypes.byref(_GUID.from_string(_IID_ITASKBAR_LIST3)),
+        ctypes.byref(_IID_ITASKBAR_LIST3_GUID),
         ctypes.byref(taskbar_ptr),
     )
     if hresult != _S_OK or not taskbar_ptr:
@@ -247,7 +311,7 @@ def _create_win32_backend(root: Any) -> Optional[_Win32Backend]:
         return None
 
     backend = _Win32Backend(hwnd, taskbar_ptr)
-    if backend._vtable_entry(_VTBL_HR_INIT)(taskbar_ptr) != _S_OK:
+    if backend._vtable_entry(_VTBL_HR_INIT, _HR_INIT_PROTOTYPE)(taskbar_ptr) != _S_OK:
         return None
     return backend
 
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import json
 import math
 import os
-import re
 import subprocess
+import sys
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Dict
+from typing import Callable, Dict, Iterator
 
 import numpy as np
 
@@ -21,6 +25,8 @@ from . import wav_io as wavfile
 from .ffmpeg import (
     build_audio_only_command,
     build_extract_audio_command,
+    build_extract_audio_pipe_command,
+    build_raw_audio_input_args,
     build_video_commands,
     check_cuda_available,
     check_videotoolbox_available,
@@ -30,6 +36,15 @@ from .ffmpeg import (
 from .models import ProcessingOptions, ProcessingResult
 from .progress import NullProgressReporter, ProgressReporter
 
+#: Channel count the audio extraction commands downmix to.
+_EXTRACT_CHANNELS = 2
+
+#: Largest decoded 16-bit PCM buffer, in bytes, that is piped from FFmpeg
+#: straight into memory (~23 minutes of 48 kHz stereo). Longer recordings are
+#: extracted to ``audio.wav`` and memory-mapped instead, so a multi-hour talk
+#: never has to be resident in full.
+_PIPE_AUDIO_MAX_BYTES = 256 * 1024 * 1024
+
 
 class ProcessingAborted(RuntimeError):
     """Raised when processing is cancelled by the caller."""
@@ -43,11 +58,14 @@ class PipelineDependencies:
     check_cuda_available: Callable[[str], bool] = check_cuda_available
     check_videotoolbox_available: Callable[[str], bool] = check_videotoolbox_available
     build_extract_audio_command: Callable[..., str] = build_extract_audio_command
+    build_extract_audio_pipe_command: Callable[..., str] = (
+        build_extract_audio_pipe_command
+    )
     build_video_commands: Callable[..., tuple[str, str | None, bool]] = (
         build_video_commands
     )
     build_audio_only_command: Callable[..., str] = build_audio_only_command
-    run_timed_ffmpeg_command: Callable[..., None] = run_timed_ffmpeg_command
+    run_timed_ffmpeg_command: Callable[..., bytes | None] = run_timed_ffmpeg_command
     create_path: Callable[[Path], None] | None = None
     delete_path: Callable[[Path], None] | None = None
 
@@ -156,8 +174,7 @@ def _build_scale_only_filter_graph(
         return None
 
     filter_graph_path = job_temp_path / "filterGraph.txt"
-    with open(filter_graph_path, "w", encoding="utf-8") as filter_graph_file:
-        filter_graph_file.write(",".join(filter_parts))
+    filter_graph_path.write_text(",".join(filter_parts), encoding="utf-8")
     return filter_graph_path
 
 
@@ -292,6 +309,15 @@ def speed_up_video(
     dependencies.create_path(base_temp_path)
     job_temp_path = Path(tempfile.mkdtemp(prefix="job_", dir=os.fspath(base_temp_path)))
 
+    # The audio-stream probe is an independent ffprobe run, so it proceeds in
+    # the background while the metadata probe runs here; its result is only
+    # collected where it is needed, keeping the validation order unchanged.
+    probe_executor = ThreadPoolExecutor(max_workers=1)
+    has_audio_future = probe_executor.submit(
+        audio_utils.has_audio_stream, os.fspath(input_path)
+    )
+    probe_executor.shutdown(wait=False)
+
     metadata = _extract_video_metadata(input_path, options.frame_rate)
     frame_rate = metadata["frame_rate"]
     original_duration = metadata["duration"]
@@ -363,7 +389,7 @@ def speed_up_video(
         )
 
     # Check if the video has an audio stream
-    has_audio = audio_utils.has_audio_stream(os.fspath(input_path))
+    has_audio = has_audio_future.result()
     if not has_audio:
         if is_mp3_output:
             dependencies.delete_path(job_temp_path)
@@ -388,6 +414,8 @@ def speed_up_video(
         estimated_total_frames = int(math.ceil(effective_duration * frame_rate))
 
     audio_new_path: Path | None = None
+    piped_audio: np.ndarray | None = None
+    audio_stdin_format: str | None = None
     filter_graph_path: Path | None = None
     updated_chunks: list[list[int]] = []
     max_audio_volume = 0.0
@@ -398,16 +426,34 @@ def speed_up_video(
         audio_wav = job_temp_path / "audio.wav"
         extraction_sample_rate = options.sample_rate
 
-        extract_command = dependencies.build_extract_audio_command(
-            os.fspath(input_path),
-            os.fspath(audio_wav),
-            extraction_sample_rate,
-            audio_bitrate,
-            hwaccel,
-            ffmpeg_path=ffmpeg_path,
-            cut_start_seconds=cut_start_seconds,
-            cut_end_seconds=cut_end_seconds,
+        # Short inputs skip the audio.wav round trip and decode straight into
+        # memory; long ones keep the file so it can be memory-mapped.
+        estimated_pcm_bytes = int(
+            effective_duration * extraction_sample_rate * _EXTRACT_CHANNELS * 2
         )
+        pipe_audio = 0 < estimated_pcm_bytes <= _PIPE_AUDIO_MAX_BYTES
+
+        if pipe_audio:
+            extract_command = dependencies.build_extract_audio_pipe_command(
+                os.fspath(input_path),
+                extraction_sample_rate,
+                hwaccel,
+                ffmpeg_path=ffmpeg_path,
+                cut_start_seconds=cut_start_seconds,
+                cut_end_seconds=cut_end_seconds,
+                channels=_EXTRACT_CHANNELS,
+            )
+        else:
+            extract_command = dependencies.build_extract_audio_command(
+                os.fspath(input_path),
+                os.fspath(audio_wav),
+                extraction_sample_rate,
+                audio_bitrate,
+                hwaccel,
+                ffmpeg_path=ffmpeg_path,
+                cut_start_seconds=cut_start_seconds,
+                cut_end_seconds=cut_end_seconds,
+            )
 
         _raise_if_stopped(reporter, temp_path=job_temp_path, dependencies=dependencies)
         reporter.log("Extracting audio...")
@@ -417,7 +463,7 @@ def speed_up_video(
         else:
             reporter.log("Extract audio target frames: unknown")
 
-        dependencies.run_timed_ffmpeg_command(
+        raw_audio = dependencies.run_timed_ffmpeg_command(
             extract_command,
             reporter=reporter,
             total=estimated_total_frames if estimated_total_frames > 0 else None,
@@ -425,87 +471,124 @@ def speed_up_video(
             desc="Extracting audio:",
             process_callback=process_callback,
             stop_requested=stop_cb,
+            capture_stdout=pipe_audio,
         )
 
-        wav_sample_rate, audio_data = wavfile.read(os.fspath(audio_wav))
-        audio_data = _ensure_two_dimensional(audio_data)
-        audio_sample_count = audio_data.shape[0]
-        max_audio_volume = audio_utils.get_max_volume(audio_data)
-
-        reporter.log(f"Max Audio Volume: {max_audio_volume}")
-
-        samples_per_frame = wav_sample_rate / frame_rate
-        audio_frame_count = int(math.ceil(audio_sample_count / samples_per_frame))
-
-        _raise_if_stopped(reporter, temp_path=job_temp_path, dependencies=dependencies)
-
-        has_loud_audio = chunk_utils.detect_loud_frames(
-            audio_data,
-            audio_frame_count,
-            samples_per_frame,
-            max_audio_volume,
-            options.silent_threshold,
-        )
+        if pipe_audio:
+            wav_sample_rate = extraction_sample_rate
+            audio_data = _pcm_to_array(raw_audio or b"", _EXTRACT_CHANNELS)
+            del raw_audio
+        else:
+            try:
+                wav_sample_rate, audio_data = wavfile.read(
+                    os.fspath(audio_wav), mmap=True
+                )
+            except ValueError:
+                # Files the reader cannot map (e.g. an empty data chunk) are
+                # loaded into memory as before.
+                wav_sample_rate, audio_data = wavfile.read(os.fspath(audio_wav))
+        # Stop checks in this stage leave the temp folder alone: the source
+        # samples may be memory-mapped from it, and Windows refuses to delete a
+        # mapped file. The folder is removed below once they are released.
+        aborted = False
+        try:
+            audio_data = _ensure_two_dimensional(audio_data)
+            audio_sample_count = audio_data.shape[0]
+            max_audio_volume = audio_utils.get_max_volume(audio_data)
 
-        chunks, _ = chunk_utils.build_chunks(has_loud_audio, options.frame_spreadage)
+            reporter.log(f"Max Audio Volume: {max_audio_volume}")
 
-        reporter.log(f"Processing {len(chunks)} chunks...")
+            samples_per_frame = wav_sample_rate / frame_rate
+            audio_frame_count = int(math.ceil(audio_sample_count / samples_per_frame))
 
-        _raise_if_stopped(reporter, temp_path=job_temp_path, dependencies=dependencies)
+            _raise_if_stopped(reporter)
 
-        new_speeds = [options.silent_speed, options.sounded_speed]
-        audio_sample_total = audio_sample_count if audio_sample_count > 0 else None
-        with reporter.task(
-            desc="Audio processing:",
-            total=audio_sample_total,
-            unit="samples",
-        ) as audio_task:
-            output_audio_data, updated_chunks = audio_utils.process_audio_chunks(
+            has_loud_audio = chunk_utils.detect_loud_frames(
                 audio_data,
-                chunks,
+                audio_frame_count,
                 samples_per_frame,
-                new_speeds,
-                options.audio_fade_envelope_size,
                 max_audio_volume,
-                progress_callback=audio_task.advance,
-                check_stop=lambda: _raise_if_stopped(
-                    reporter, temp_path=job_temp_path, dependencies=dependencies
-                ),
+                options.silent_threshold,
+            )
+
+            chunks, _ = chunk_utils.build_chunks(
+                has_loud_audio, options.frame_spreadage
             )
 
-        audio_new_path = job_temp_path / "audioNew.wav"
+            reporter.log(f"Processing {len(chunks)} chunks...")
+
+            _raise_if_stopped(reporter)
+
+            new_speeds = [options.silent_speed, options.sounded_speed]
+            audio_sample_total = audio_sample_count if audio_sample_count > 0 else None
+            with reporter.task(
+                desc="Audio processing:",
+                total=audio_sample_total,
+                unit="samples",
+            ) as audio_task:
+                output_audio_data, updated_chunks = audio_utils.process_audio_chunks(
+                    audio_data,
+                    chunks,
+                    samples_per_frame,
+                    new_speeds,
+                    options.audio_fade_envelope_size,
+                    max_audio_volume,
+                    progress_callback=audio_task.advance,
+                    check_stop=lambda: _raise_if_stopped(reporter),
+                )
+        except ProcessingAborted:
+            aborted = True
+
+        # Release the source samples before the temp folder is removed.
+        del audio_data
+        if aborted:
+            dependencies.delete_path(job_temp_path)
+            raise ProcessingAborted("Processing aborted by user request.")
+
         # Use the sample rate that was actually used for processing
         output_sample_rate = extraction_sample_rate
-        wavfile.write(
-            os.fspath(audio_new_path),
-            output_sample_rate,
-            _prepare_output_audio(output_audio_data),
-        )
+        if is_mp3_output:
+            audio_new_path = job_temp_path / "audioNew.wav"
+            wavfile.write(
+                os.fspath(audio_new_path), output_sample_rate, output_audio_data
+            )
+        else:
+            # Video renders read the processed samples from the encoder's stdin,
+            # so the audio never makes a round trip through ``audioNew.wav``.
+            piped_audio = np.ascontiguousarray(output_audio_data, dtype="<f4")
+            audio_stdin_format = build_raw_audio_input_args(
+                "f32le",
+                output_sample_rate,
+                piped_audio.shape[1] if piped_audio.ndim == 2 else 1,
+            )
+        del output_audio_data
 
         _raise_if_stopped(reporter, temp_path=job_temp_path, dependencies=dependencies)
 
-        expression = chunk_utils.get_tree_expression(updated_chunks)
+        # Emit the expression with pre-escaped commas so it can go straight
+        # into the filter graph without a second full-length copy.
+        escaped_expression = chunk_utils.get_tree_expression(
+            updated_chunks, separator="\\,"
+        )
+        filter_parts = []
+        if options.small:
+            target_height = options.small_target_height or 720
+            if target_height <= 0:
+                target_height = 720
+            # Only scale down if the original height is greater than or equal to target
+            if original_height > 0 and original_height >= target_height:
+                filter_parts.append(f"scale=-2:{target_height}")
+                reporter.log(
+                    f"Scaling down from {int(original_height)}p to {target_height}p"
+                )
+            else:
+                reporter.log(
+                    f"Keeping original resolution {int(original_height)}p (smaller than target {target_height}p)"
+                )
+        filter_parts.append(f"fps={frame_rate}")
+        filter_parts.append(f"setpts={escaped_expression}")
         filter_graph_path = job_temp_path / "filterGraph.txt"
-        with open(filter_graph_path, "w", encoding="utf-8") as filter_graph_file:
-            filter_parts = []
-            if options.small:
-                target_height = options.small_target_height or 720
-                if target_height <= 0:
-                    target_height = 720
-                # Only scale down if the original height is greater than or equal to target
-                if original_height > 0 and original_height >= target_height:
-                    filter_parts.append(f"scale=-2:{target_height}")
-                    reporter.log(
-                        f"Scaling down from {int(original_height)}p to {target_height}p"
-                    )
-                else:
-                    reporter.log(
-                        f"Keeping original resolution {int(original_height)}p (smaller than target {target_height}p)"
-                    )
-            filter_parts.append(f"fps={frame_rate}")
-            escaped_expression = expression.replace(",", "\\,")
-            filter_parts.append(f"setpts={escaped_expression}")
-            filter_graph_file.write(",".join(filter_parts))
+        filter_graph_path.write_text(",".join(filter_parts), encoding="utf-8")
     else:
         if has_audio and neutral_speeds:
             reporter.log(
@@ -551,6 +634,7 @@ def speed_up_video(
                 keep_input_audio=keep_input_audio,
                 cut_start_seconds=cut_start_seconds,
                 cut_end_seconds=cut_end_seconds,
+                audio_stdin_format=audio_stdin_format,
             )
         )
     # Logged only once the plan is known: a backend can be available yet unused,
@@ -588,6 +672,11 @@ def speed_up_video(
 
     _raise_if_stopped(reporter, temp_path=job_temp_path, dependencies=dependencies)
 
+    # The encoder's last reported ``time=`` is the output duration, which saves
+    # probing the freshly written file with another ffprobe run.
+    encoded_durations: list[float] = []
+    encode_finished = False
+    cleanup_thread: threading.Thread | None = None
     try:
         if has_audio and updated_chunks:
             final_total_frames = updated_chunks[-1][3] if updated_chunks else 0
@@ -625,7 +714,10 @@ def speed_up_video(
             desc="Generating final:",
             process_callback=process_callback,
             stop_requested=stop_cb,
+            duration_callback=encoded_durations.append,
+            stdin_chunks=_iter_pcm_chunks(piped_audio),
         )
+        encode_finished = True
     except subprocess.CalledProcessError:
         if fallback_command_str:
             _raise_if_stopped(
@@ -665,22 +757,40 @@ def speed_up_video(
                 desc="Generating final (fallback):",
                 process_callback=process_callback,
                 stop_requested=stop_cb,
+                duration_callback=encoded_durations.append,
+                stdin_chunks=_iter_pcm_chunks(piped_audio),
             )
             # The fallback plan is always the CPU encoder, so the reported
             # backend must not keep claiming the GPU was used.
             use_gpu_encoder = False
             gpu_backend = None
+            encode_finished = True
         else:
             raise
     finally:
-        dependencies.delete_path(job_temp_path)
+        if encode_finished:
+            # Removing a multi-GB temp folder can take seconds, so it runs while
+            # the output is measured and is joined before returning.
+            cleanup_thread = threading.Thread(
+                target=dependencies.delete_path, args=(job_temp_path,), daemon=True
+            )
+            cleanup_thread.start()
+        else:
+            dependencies.delete_path(job_temp_path)
 
-    output_metadata = _extract_video_metadata(output_path, frame_rate)
-    output_duration = output_metadata.get("duration", 0.0)
-    time_ratio = output_duration / original_duration if original_duration > 0 else None
+    try:
+        if encoded_durations and encoded_durations[-1] > 0:
+            output_duration = encoded_durations[-1]
+        else:
+            output_metadata = _extract_video_metadata(output_path, frame_rate)
+            output_duration = output_metadata.get("duration", 0.0)
+        input_size = input_path.stat().st_size if input_path.exists() else 0
+        output_size = output_path.stat().st_size if output_path.exists() else 0
+    finally:
+        if cleanup_thread is not None:
+            cleanup_thread.join()
 
-    input_size = input_path.stat().st_size if input_path.exists() else 0
-    output_size = output_path.stat().st_size if output_path.exists() else 0
+    time_ratio = output_duration / original_duration if original_duration > 0 else None
     size_ratio = (output_size / input_size) if input_size > 0 else None
 
     return ProcessingResult(
@@ -725,7 +835,6 @@ def _input_to_output_filename(
     sounded_speed: float | None = None,
     prefer_clean_audio_name: bool = False,
 ) -> Path:
-    dot_index = filename.name.rfind(".")
     normalized_silent = _normalize_speed(silent_speed, _DEFAULT_SILENT_SPEED)
     normalized_sounded = _normalize_speed(sounded_speed, _DEFAULT_SOUNDED_SPEED)
     neutral_silent = math.isclose(normalized_silent, 1.0, rel_tol=1e-9, abs_tol=1e-9)
@@ -760,7 +869,7 @@ def _input_to_output_filename(
 
     suffix = f"_{'_'.join(suffix_tokens)}" if suffix_tokens else ""
     extension = ".mp3" if is_audio_only else ".mp4"
-    stem = filename.name[:dot_index] if dot_index != -1 else filename.name
+    stem = filename.stem
 
     if prefer_clean_audio_name and is_audio_only and suffix_tokens:
         # Audio extraction keeps the input's clean name when it is not taken;
@@ -783,7 +892,13 @@ def _create_path(path: Path) -> None:
 
 
 def _delete_path(path: Path) -> None:
-    import time
+    """Remove *path* recursively, tolerating slow handle release on Windows.
+
+    ``rmtree`` is synchronous on POSIX, so a successful call returns at once.
+    On Windows, antivirus and indexer handles can keep the folder visible for
+    a moment after deletion, so the existence check is retried briefly.
+    """
+
     from shutil import rmtree
 
     if not path.exists():
@@ -791,6 +906,9 @@ def _delete_path(path: Path) -> None:
 
     try:
         rmtree(path, ignore_errors=False)
+        if os.name != "nt":
+            return
+
         for i in range(5):
             if not path.exists():
                 return
@@ -800,7 +918,43 @@ def _delete_path(path: Path) -> None:
         print(exc)
 
 
-def _extract_video_metadata(input_file: Path, frame_rate: float) -> Dict[str, float]:
+# Bounded so a long-running server, which probes a fresh temp upload per job,
+# does not keep one entry per file for the life of the process.
+_VIDEO_METADATA_CACHE_SIZE = 32
+_VIDEO_METADATA_CACHE: Dict[tuple[str, int, int], Dict[str, float]] = {}
+# The server runs several pipelines at once; ffprobe itself runs outside it.
+_VIDEO_METADATA_CACHE_LOCK = threading.Lock()
+
+
+def _metadata_cache_key(input_file: Path) -> tuple[str, int, int] | None:
+    """Return a cache key that changes whenever *input_file* is rewritten."""
+
+    try:
+        stat = input_file.stat()
+    except OSError:
+        return None
+    return (os.path.abspath(input_file), stat.st_mtime_ns, stat.st_size)
+
+
+def _parse_frame_rate(value: object) -> float:
+    """Return the rate encoded in an ffprobe ``num/den`` string, or ``0.0``."""
+
+    numerator, _, denominator = str(value or "").partition("/")
+    try:
+        rate = float(numerator) / float(denominator or 1)
+    except (ValueError, ZeroDivisionError):
+        return 0.0
+    return rate if rate > 0 else 0.0
+
+
+def _probe_video_metadata(input_file: Path) -> Dict[str, float] | None:
+    """Run ffprobe on *input_file* and return its parsed metadata.
+
+    Returns ``None`` when ffprobe fails (its stderr is echoed to the console)
+    or produced no parseable JSON, so the failure is not cached. A missing frame
+    rate is reported as ``0.0`` and resolved by the caller's fallback.
+    """
+
     from .ffmpeg import get_ffprobe_path
 
     ffprobe_path = get_ffprobe_path()
@@ -815,48 +969,117 @@ def _extract_video_metadata(input_file: Path, frame_rate: float) -> Dict[str, fl
         "v",
         "-show_entries",
         "format=duration:stream=avg_frame_rate,nb_frames,width,height",
+        "-of",
+        "json",
     ]
-    process = subprocess.Popen(
-        command,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        bufsize=1,
-        universal_newlines=True,
+    result = subprocess.run(command, capture_output=True, text=True, check=False)
+    if result.returncode != 0:
+        print(
+            f"ffprobe failed (return code {result.returncode}) for {input_file}:",
+            file=sys.stderr,
+        )
+        print((result.stderr or "").strip(), file=sys.stderr)
+        return None
+
+    try:
+        data = json.loads(result.stdout or "")
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+
+    format_info = data.get("format") or {}
+    streams = data.get("streams") or []
+    stream = streams[0] if streams else {}
+
+    def _number(value: object, cast: Callable[[str], float]) -> float:
+        try:
+            return cast(str(value))
+        except (TypeError, ValueError):
+            return 0
+
+    return {
+        "frame_rate": _parse_frame_rate(stream.get("avg_frame_rate")),
+        "duration": float(_number(format_info.get("duration"), float)),
+        "frame_count": int(_number(stream.get("nb_frames"), int)),
+        "width": float(_number(stream.get("width"), int)),
+        "height": float(_number(stream.get("height"), int)),
+    }
+
+
+def _extract_video_metadata(input_file: Path, frame_rate: float) -> Dict[str, float]:
+    """Return duration, frame rate, frame count and size for *input_file*.
+
+    Probe results are cached per file path, modification time and size, so
+    re-processing an unchanged input skips the ffprobe subprocess. Only the
+    most recently used ``_VIDEO_METADATA_CACHE_SIZE`` files are kept.
+    *frame_rate* is used when the file reports no usable rate.
+    """
+
+    cache_key = _metadata_cache_key(Path(input_file))
+    probed = None
+    if cache_key is not None:
+        with _VIDEO_METADATA_CACHE_LOCK:
+            # Re-inserting a hit moves it to the end, so the dict's insertion
+            # order doubles as least-recently-used order for eviction.
+            probed = _VIDEO_METADATA_CACHE.pop(cache_key, None)
+            if probed is not None:
+                _VIDEO_METADATA_CACHE[cache_key] = probed
+    if probed is None:
+        probed = _probe_video_metadata(input_file)
+        if probed is not None and cache_key is not None:
+            with _VIDEO_METADATA_CACHE_LOCK:
+                _VIDEO_METADATA_CACHE[cache_key] = probed
+                while len(_VIDEO_METADATA_CACHE) > _VIDEO_METADATA_CACHE_SIZE:
+                    del _VIDEO_METADATA_CACHE[next(iter(_VIDEO_METADATA_CACHE))]
+
+    metadata = dict(
+        probed
+        or {
+            "frame_rate": 0.0,
+            "duration": 0.0,
+            "frame_count": 0,
+            "width": 0.0,
+            "height": 0.0,
+        }
     )
-    stdout, _ = process.communicate()
+    if not metadata["frame_rate"]:
+        metadata["frame_rate"] = frame_rate
+    return metadata
 
-    match_frame_rate = re.search(r"frame_rate=(\d*)/(\d*)", str(stdout))
-    if match_frame_rate is not None:
-        frame_rate = float(match_frame_rate.group(1)) / float(match_frame_rate.group(2))
 
-    match_duration = re.search(r"duration=([\d.]*)", str(stdout))
-    original_duration = float(match_duration.group(1)) if match_duration else 0.0
+def _pcm_to_array(raw: bytes, channels: int) -> np.ndarray:
+    """Return piped ``s16le`` PCM bytes as a ``(frames, channels)`` array.
 
-    match_frames = re.search(r"nb_frames=(\d+)", str(stdout))
-    frame_count = int(match_frames.group(1)) if match_frames else 0
+    A trailing partial frame (possible when FFmpeg is stopped mid-write) is
+    dropped so the reshape always succeeds.
+    """
 
-    match_width = re.search(r"width=(\d+)", str(stdout))
-    width = int(match_width.group(1)) if match_width else 0
+    frame_count = len(raw) // (2 * channels)
+    samples = np.frombuffer(raw, dtype="<i2", count=frame_count * channels)
+    return samples.reshape(frame_count, channels)
 
-    match_height = re.search(r"height=(\d+)", str(stdout))
-    height = int(match_height.group(1)) if match_height else 0
 
-    return {
-        "frame_rate": frame_rate,
-        "duration": original_duration,
-        "frame_count": frame_count,
-        "width": float(width),
-        "height": float(height),
-    }
+def _iter_pcm_chunks(
+    samples: np.ndarray | None, chunk_bytes: int = 1024 * 1024
+) -> Iterator[memoryview] | None:
+    """Yield *samples* as raw byte slices for an FFmpeg stdin pipe.
+
+    Returns ``None`` when there is nothing to pipe, so the encode runs with its
+    stdin untouched. Each call returns a fresh iterator, letting the fallback
+    encode replay the same audio.
+    """
+
+    if samples is None:
+        return None
+    buffer = memoryview(samples).cast("B")
+    return (
+        buffer[offset : offset + chunk_bytes]
+        for offset in range(0, len(buffer), chunk_bytes)
+    )
 
 
 def _ensure_two_dimensional(audio_data: np.ndarray) -> np.ndarray:
     if audio_data.ndim == 1:
         return audio_data[:, np.newaxis]
     return audio_data
-
-
-def _prepare_output_audio(output_audio_data: np.ndarray) -> np.ndarray:
-    if output_audio_data.ndim == 2 and output_audio_data.shape[1] == 1:
-        return output_audio_data[:, 0]
-    return output_audio_data
@@ -144,23 +144,33 @@ class CallbackProgressHandle(AbstractContextManager[ProgressHandle]):
         return False
 
 
-@dataclass
 class _TqdmProgressHandle(AbstractContextManager[ProgressHandle]):
-    """Wraps a :class:`tqdm.tqdm` instance to match :class:`ProgressHandle`."""
+    """Wraps a :class:`tqdm.tqdm` instance to match :class:`ProgressHandle`.
+
+    ``advance`` runs for every FFmpeg progress line, so the bound
+    ``bar.update`` and the current total are kept on the handle instead of
+    being looked up through the bar on each call.
+    """
 
-    bar: tqdm
+    __slots__ = ("bar", "_update", "_total")
+
+    def __init__(self, bar: tqdm) -> None:
+        self.bar = bar
+        self._update = bar.update
+        self._total: Optional[int] = bar.total
 
     @property
     def current(self) -> int:
         return int(self.bar.n)
 
     def ensure_total(self, total: int) -> None:
-        if self.bar.total is None or total > self.bar.total:
+        if self._total is None or total > self._total:
+            self._total = total
             self.bar.total = total
 
     def advance(self, amount: int) -> None:
         if amount > 0:
-            self.bar.update(amount)
+            self._update(amount)
 
     def finish(self) -> None:
         if self.bar.total is not None and self.bar.n < self.bar.total:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import atexit
+import functools
 import logging
 import subprocess
 import sys
@@ -115,6 +116,13 @@ _TEMPLATE_LUMINANCE_THRESHOLD = 110
 #: icon's transparent rounded corners fall below it and stay transparent.
 _TEMPLATE_ALPHA_THRESHOLD = 128
 
+#: First and maximum delay, in seconds, between checks for a Gradio share URL.
+_SHARE_URL_INITIAL_BACKOFF = 0.1
+_SHARE_URL_MAX_BACKOFF = 30.0
+
+#: Window, in seconds, in which repeated "Open" clicks for one URL are ignored.
+_OPEN_BROWSER_DEBOUNCE = 0.5
+
 
 def _iter_icon_candidates() -> Iterator[Path]:
     """Yield possible tray icon paths ordered from most to least specific."""
@@ -228,11 +236,13 @@ def _apply_macos_accessory_policy() -> None:
         )
 
 
+@functools.lru_cache(maxsize=1)
 def _load_icon() -> Image.Image:
     """Load the tray icon image, falling back to a generated placeholder.
 
     On macOS the loaded icon is converted into a monochrome template silhouette
-    so it matches the menu bar's native appearance.
+    so it matches the menu bar's native appearance. The result is memoized so
+    repeated tray launches skip the candidate scan and image decoding.
     """
 
     LOGGER.info("Attempting to load tray icon image.")
@@ -328,6 +338,8 @@ class _ServerTrayApplication:
         self._server_ready_event = threading.Event()
         self._ready_event = threading.Event()
         self._gui_lock = threading.Lock()
+        self._browser_lock = threading.Lock()
+        self._last_browser_open: Optional[tuple[str, float]] = None
 
         self._server_handle: Optional[Any] = None
         self._local_url: Optional[str] = None
@@ -369,13 +381,20 @@ class _ServerTrayApplication:
         self._server_ready_event.set()
         LOGGER.info("Server ready at %s", self._local_url)
 
-        # Keep checking for a share URL while the server is running.
-        while not self._stop_event.is_set():
+        if not self._share or self._share_url:
+            return
+
+        # Gradio can publish the share link shortly after ``launch`` returns, so
+        # wait for it with a capped backoff instead of polling for the lifetime
+        # of the process, and stop as soon as it appears.
+        backoff = _SHARE_URL_INITIAL_BACKOFF
+        while not self._stop_event.wait(timeout=backoff):
             share_url = _coerce_url(getattr(server, "share_url", None))
             if share_url:
                 self._share_url = share_url
                 LOGGER.info("Share URL available: %s", share_url)
-            time.sleep(0.5)
+                return
+            backoff = min(backoff * 2, _SHARE_URL_MAX_BACKOFF)
 
     # Tray helpers -----------------------------------------------------
 
@@ -390,11 +409,31 @@ class _ServerTrayApplication:
         _item: Optional[Any] = None,
     ) -> None:
         url = self._resolve_url()
-        if url:
-            self._open_browser(url)
-            LOGGER.info("Opened browser to %s", url)
-        else:
+        if not url:
             LOGGER.warning("Server URL not yet available; please try again.")
+            return
+
+        now = time.monotonic()
+        with self._browser_lock:
+            last = self._last_browser_open
+            if (
+                last is not None
+                and last[0] == url
+                and now - last[1] < _OPEN_BROWSER_DEBOUNCE
+            ):
+                LOGGER.info("Ignoring repeated request to open %s", url)
+                return
+            self._last_browser_open = (url, now)
+
+        # Launching the browser may fork a helper such as ``xdg-open``; keep it
+        # off the tray's event loop so the menu stays responsive.
+        threading.Thread(
+            target=self._open_browser,
+            args=(url,),
+            name="talks-reducer-open-browser",
+            daemon=True,
+        ).start()
+        LOGGER.info("Opened browser to %s", url)
 
     def _gui_is_running(self) -> bool:
         """Return whether the GUI subprocess is currently active."""
@@ -678,7 +717,7 @@ def create_tray_app(
         tray_mode=effective_mode,
         tray_backend=tray_backend,
         build_interface=build_interface,
-        open_browser_callback=webbrowser.open,
+        open_browser_callback=webbrowser.open_new_tab,
         launch_gui=launch_gui,
     )
 
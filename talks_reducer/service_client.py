@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import os
 import shutil
 import sys
 import threading
@@ -12,6 +13,7 @@ from contextlib import contextmanager, suppress
 from pathlib import Path
 from typing import Any, AsyncIterator, Callable, Iterator, Optional, Sequence, Tuple
 
+import httpx
 from gradio_client import Client
 
 try:  # ``handle_file`` replaces the deprecated ``file`` helper in newer releases.
@@ -32,6 +34,23 @@ except ImportError:  # pragma: no cover - allow running as script
 # or misattribute each other's hooks while a transfer is in flight.
 _TRANSFER_PATCH_LOCK = threading.Lock()
 
+# Building a gradio ``Client`` fetches the server's API schema over HTTP, which
+# can dominate the latency of small uploads. Idle clients are pooled per
+# ``(builder, server_url)`` so batch callers reuse them; a client is checked out
+# for the duration of one :func:`send_video` call because the transfer progress
+# hooks are installed on its endpoint. Each server keeps a few idle clients and
+# only the most recently used servers are kept at all.
+_CLIENT_CACHE: dict[Tuple[Any, str], list[Client]] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+_CLIENT_CACHE_MAX_IDLE = 4
+_CLIENT_CACHE_MAX_SERVERS = 8
+
+# Errors that show a pooled client could not reach its server at all (for
+# example after a restart), so no job was accepted and retrying on a fresh
+# client cannot process the video twice. Read, timeout and protocol errors may
+# arrive after the server took the job, so they are not retried.
+_STALE_CLIENT_ERRORS = (httpx.ConnectError, ConnectionRefusedError)
+
 
 class _ProgressFileReader:
     """Proxy a binary file object and report each chunk read to a callback.
@@ -233,8 +252,12 @@ def _install_transfer_progress(
     except Exception:  # pragma: no cover - defensive (stub clients, API changes)
         return False
 
+    # Reused clients still carry the hooks from a previous call; wrap the
+    # original methods rather than stacking progress reporters.
     original_upload = getattr(endpoint, "_upload_file", None)
+    original_upload = getattr(original_upload, "__wrapped__", original_upload)
     original_download = getattr(endpoint, "_download_file", None)
+    original_download = getattr(original_download, "__wrapped__", original_download)
     if not callable(original_upload) or not callable(original_download):
         return False
 
@@ -300,6 +323,8 @@ def _install_transfer_progress(
             finally:
                 gradio_client_module.httpx.stream = original_stream
 
+    upload_file.__wrapped__ = original_upload  # type: ignore[attr-defined]
+    download_file.__wrapped__ = original_download  # type: ignore[attr-defined]
     endpoint._upload_file = upload_file
     endpoint._download_file = download_file
     return True
@@ -402,6 +427,72 @@ def _build_client(client_builder: Callable[..., Client], server_url: str) -> Cli
             return client_builder(server_url)
 
 
+def _acquire_cached_client(
+    client_builder: Callable[..., Client], server_url: str
+) -> Tuple[Client, bool]:
+    """Return a client for *server_url* and whether it came from the pool."""
+
+    with _CLIENT_CACHE_LOCK:
+        idle = _CLIENT_CACHE.get((client_builder, server_url))
+        if idle:
+            return idle.pop(), True
+    return _build_client(client_builder, server_url), False
+
+
+def _release_cached_client(
+    client_builder: Callable[..., Client], server_url: str, client: Client
+) -> None:
+    """Return *client* to the idle pool so later calls can reuse it.
+
+    Clients beyond ``_CLIENT_CACHE_MAX_IDLE`` for one server are discarded, and
+    the least recently used server is dropped once more than
+    ``_CLIENT_CACHE_MAX_SERVERS`` have idle clients.
+    """
+
+    key = (client_builder, server_url)
+    with _CLIENT_CACHE_LOCK:
+        # Re-inserting the key keeps the dict in least-recently-used order.
+        idle = _CLIENT_CACHE.pop(key, [])
+        if len(idle) < _CLIENT_CACHE_MAX_IDLE:
+            idle.append(client)
+        _CLIENT_CACHE[key] = idle
+        while len(_CLIENT_CACHE) > _CLIENT_CACHE_MAX_SERVERS:
+            del _CLIENT_CACHE[next(iter(_CLIENT_CACHE))]
+
+
+def _link_or_copy(source: Path, destination: Path) -> None:
+    """Hardlink *source* to *destination*, copying when linking is impossible.
+
+    A local server's output usually lives on the same volume as the requested
+    destination, where a hardlink avoids rewriting the whole video. Linking
+    fails across filesystems (and on volumes without hardlink support), in
+    which case ``shutil.copy2`` is used as before. The file is staged under a
+    temporary name next to *destination* and then moved over it, so an existing
+    *destination* is only replaced once the new file is complete.
+    """
+
+    try:
+        if os.path.samefile(source, destination):
+            return
+    except OSError:
+        pass
+    staged = destination.with_name(
+        f".{destination.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    with suppress(FileNotFoundError):
+        staged.unlink()
+    try:
+        try:
+            os.link(source, staged)
+        except OSError:
+            shutil.copy2(source, staged)
+        os.replace(staged, destination)
+    except BaseException:
+        with suppress(OSError):
+            staged.unlink()
+        raise
+
+
 def _filedata_get(filedata: Any, key: str) -> Any:
     """Return *key* from a FileData mapping or object, or ``None``."""
 
@@ -541,6 +632,7 @@ def send_video(
     job_factory: Optional[
         Callable[[Client, Tuple[Any, ...], dict[str, Any]], Any]
     ] = None,
+    client: Optional[Client] = None,
 ) -> Tuple[Path, str, str]:
     """Upload *input_path* to the Gradio server and download the processed video.
 
@@ -549,13 +641,17 @@ def send_video(
     to switch to the fastest CUDA-oriented preset when available, and set
     *prefer_global_ffmpeg* when the PATH-provided FFmpeg offers hardware
     encoders that the bundled static build omits.
+
+    Pass *client* to reuse an existing gradio client. Otherwise clients built
+    by the default ``Client`` class are pooled per *server_url* and reused by
+    later calls, while a custom *client_factory* is invoked on every call. A
+    pooled client that cannot connect to its server is discarded and the job is
+    retried once on a freshly built client.
     """
 
     if not input_path.exists():
         raise FileNotFoundError(f"Input file does not exist: {input_path}")
 
-    client_builder = client_factory or Client
-    client = _build_client(client_builder, server_url)
     submit_args: Tuple[Any, ...] = (
         gradio_file(str(input_path)),
         bool(small),
@@ -571,6 +667,58 @@ def send_video(
         cut_start_seconds,
         cut_end_seconds,
     )
+
+    def _run(active_client: Client) -> Tuple[Path, str, str]:
+        return _run_send_video(
+            active_client,
+            server_url,
+            input_path,
+            output_path,
+            submit_args,
+            log_callback=log_callback,
+            stream_updates=stream_updates,
+            should_cancel=should_cancel,
+            progress_callback=progress_callback,
+            job_factory=job_factory,
+        )
+
+    if client is not None:
+        return _run(client)
+    if client_factory is not None:
+        return _run(_build_client(client_factory, server_url))
+
+    pooled_builder: Callable[..., Client] = Client
+    client, reused = _acquire_cached_client(pooled_builder, server_url)
+    try:
+        result = _run(client)
+    except _STALE_CLIENT_ERRORS:
+        if not reused:
+            raise
+        # The server may have restarted since this client was pooled; the
+        # failed client is dropped and the job retried once on a fresh one.
+        client = _build_client(pooled_builder, server_url)
+        result = _run(client)
+    _release_cached_client(pooled_builder, server_url, client)
+    return result
+
+
+def _run_send_video(
+    client: Client,
+    server_url: str,
+    input_path: Path,
+    output_path: Optional[Path],
+    submit_args: Tuple[Any, ...],
+    *,
+    log_callback: Optional[Callable[[str], None]],
+    stream_updates: bool,
+    should_cancel: Optional[Callable[[], bool]],
+    progress_callback: Optional[
+        Callable[[str, Optional[int], Optional[int], str], None]
+    ],
+    job_factory: Optional[Callable[[Client, Tuple[Any, ...], dict[str, Any]], Any]],
+) -> Tuple[Path, str, str]:
+    """Submit one ``/process_video`` job on *client* and fetch its output."""
+
     submit_kwargs: dict[str, Any] = {"api_name": "/process_video"}
 
     upload_total: Optional[int] = None
@@ -616,17 +764,29 @@ def send_video(
                 cancelled = True
             raise ProcessingAborted("Remote processing cancelled by user.")
 
-    printed_lines = 0
+    # The server resends its whole log on every update, so only the text after
+    # ``printed_chars`` is split instead of re-splitting the full log each time.
+    printed_chars = 0
+    partial_line = False
 
     def _emit_new_lines(log_text: str) -> None:
-        nonlocal printed_lines
+        nonlocal printed_chars, partial_line
         if log_callback is None or not log_text:
             return
-        lines = log_text.splitlines()
-        if printed_lines < len(lines):
-            for line in lines[printed_lines:]:
-                log_callback(line)
-            printed_lines = len(lines)
+        start = printed_chars
+        if 0 < start < len(log_text) and log_text[start - 1 : start + 1] == "\r\n":
+            start += 1  # A ``\r\n`` terminator was split across two updates.
+        chunks = log_text[start:].splitlines(keepends=True)
+        printed_chars = len(log_text)
+        if not chunks:
+            return
+        ends_open = chunks[-1] == chunks[-1].splitlines()[0]
+        if partial_line:
+            # The unterminated line was already reported when it first appeared.
+            chunks = chunks[1:]
+        for chunk in chunks:
+            log_callback(chunk.splitlines()[0])
+        partial_line = ends_open
 
     consumed_stream = False
 
@@ -684,11 +844,11 @@ def send_video(
     if isinstance(target, str) and Path(target).exists():
         # The ``/process_video`` API returns a bare server-side path string. When
         # the server shares this machine's filesystem the file is right here, so
-        # copy it directly instead of round-tripping through HTTP.
+        # link or copy it directly instead of round-tripping through HTTP.
         download_source = Path(target)
         destination.parent.mkdir(parents=True, exist_ok=True)
         if download_source.resolve() != destination.resolve():
-            shutil.copy2(download_source, destination)
+            _link_or_copy(download_source, destination)
     else:
         # A remote server hands back a path that does not exist on this machine
         # (or a FileData object). Download the single processed file over HTTP via
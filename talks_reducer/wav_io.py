@@ -58,11 +58,17 @@ def _read_chunk_header(stream: BinaryIO) -> Tuple[bytes, int]:
     return chunk_id, size
 
 
-def read(filename: str) -> Tuple[int, np.ndarray]:
+def read(filename: str, mmap: bool = False) -> Tuple[int, np.ndarray]:
     """Read a PCM or IEEE-float WAV file into ``(sample_rate, data)``.
 
     Mono files return a 1-D array and multi-channel files return a
     ``(frames, channels)`` array, mirroring ``scipy.io.wavfile.read``.
+
+    With ``mmap=True`` the samples are returned as a read-only
+    :class:`numpy.memmap` over the ``data`` chunk, so the OS pages audio in on
+    demand instead of the whole buffer being loaded up front. As in SciPy, a
+    ``ValueError`` is raised for files that cannot be mapped (an empty ``data``
+    chunk), leaving callers to fall back to a regular read.
     """
 
     with open(filename, "rb") as stream:
@@ -75,6 +81,8 @@ def read(filename: str) -> Tuple[int, np.ndarray]:
         sample_rate = 0
         bits_per_sample = 0
         data_bytes = b""
+        data_offset = None
+        data_size = 0
 
         while True:
             chunk_id, size = _read_chunk_header(stream)
@@ -95,7 +103,12 @@ def read(filename: str) -> Tuple[int, np.ndarray]:
                     # The real format lives in the first two bytes of the GUID.
                     (fmt_tag,) = struct.unpack("<H", fmt_body[24:26])
             elif chunk_id == b"data":
-                data_bytes = stream.read(size)
+                if mmap:
+                    data_offset = stream.tell()
+                    data_size = size
+                    stream.seek(size, 1)
+                else:
+                    data_bytes = stream.read(size)
             else:
                 stream.seek(size, 1)
 
@@ -112,7 +125,15 @@ def read(filename: str) -> Tuple[int, np.ndarray]:
         else:
             raise ValueError(f"Unsupported WAV format tag: {fmt_tag}")
 
-        samples = np.frombuffer(data_bytes, dtype=dtype)
+        if mmap:
+            count = data_size // dtype.itemsize
+            if data_offset is None or count == 0:
+                raise ValueError(f"Cannot memory-map empty WAV data: {filename!r}")
+            samples = np.memmap(
+                filename, dtype=dtype, mode="r", offset=data_offset, shape=(count,)
+            )
+        else:
+            samples = np.frombuffer(data_bytes, dtype=dtype)
         if channels > 1:
             samples = samples.reshape(-1, channels)
 
@@ -303,6 +303,24 @@ def test_get_max_volume_for_negative_samples(synthetic_audio_samples):
     )
 
 
+def test_get_max_volume_handles_int16_minimum():
+    """The most negative 16-bit sample must not overflow when negated."""
+
+    samples = np.array([[-32768, 100], [5, -7]], dtype=np.int16)
+    assert audio.get_max_volume(samples) == 32768.0
+
+
+def test_get_max_volume_blocks_do_not_change_result(monkeypatch):
+    rng = np.random.default_rng(3)
+    samples = rng.integers(-30000, 30000, size=(2_501, 2), dtype=np.int16)
+    expected = audio.get_max_volume(samples)
+
+    monkeypatch.setattr(audio, "_VOLUME_BLOCK_SAMPLES", 256)
+
+    assert audio.get_max_volume(samples) == expected
+    assert expected == float(np.abs(samples.astype(np.int32)).max())
+
+
 def test_is_valid_input_file_accepts_warnings(monkeypatch):
     """A warning written to stderr should not invalidate a valid audio file."""
 
@@ -396,3 +414,91 @@ def test_process_audio_chunks_returns_empty_output_for_empty_inputs():
     assert processed.shape == (0, 1)
     assert processed.size == 0
     assert updated_chunks == []
+
+
+def test_process_audio_chunks_emits_flat_output_for_mono(
+    prepared_chunks, fake_phase_vocoder
+):
+    """Mono processing should return a contiguous 1-D array ready for writing."""
+
+    mono_audio = np.arange(8, dtype=np.float32)[:, np.newaxis]
+    fake_phase_vocoder(
+        [
+            np.array([[1.0], [2.0], [3.0], [4.0]], dtype=np.float32),
+            np.array([[2.0]], dtype=np.float32),
+        ]
+    )
+
+    processed, _ = audio.process_audio_chunks(
+        mono_audio,
+        prepared_chunks,
+        samples_per_frame=2.0,
+        speeds=[1.0, 0.5],
+        audio_fade_envelope_size=2,
+        max_audio_volume=2.0,
+    )
+
+    assert processed.ndim == 1
+    assert processed.flags["C_CONTIGUOUS"]
+    np.testing.assert_allclose(processed, [0.0, 0.5, 1.5, 1.0, 0.0])
+
+
+def test_process_audio_chunks_zero_length_chunk_keeps_mono_output_flat(
+    fake_phase_vocoder,
+):
+    """A zero-length chunk in mono input must not turn the output 2-D."""
+
+    mono_audio = np.arange(8, dtype=np.float32)[:, np.newaxis]
+    fake_phase_vocoder(
+        [
+            np.array([[1.0], [2.0], [3.0], [4.0]], dtype=np.float32),
+            np.array([[2.0]], dtype=np.float32),
+        ]
+    )
+
+    processed, _ = audio.process_audio_chunks(
+        mono_audio,
+        [[0, 2, 0], [2, 3, 1], [3, 3, 0]],
+        samples_per_frame=2.0,
+        speeds=[1.0, 0.5],
+        audio_fade_envelope_size=2,
+        max_audio_volume=2.0,
+    )
+
+    assert processed.shape == (5,)
+    np.testing.assert_allclose(processed, [0.0, 0.5, 1.5, 1.0, 0.0])
+
+
+def test_process_audio_chunks_flattens_many_mono_chunks(fake_phase_vocoder):
+    """Mono output assembly should not be limited by numpy's argument count."""
+
+    chunk_count = 40
+    mono_audio = np.ones((chunk_count * 2, 1), dtype=np.float32)
+    fake_phase_vocoder([np.array([[2.0], [4.0]])] * chunk_count)
+
+    processed, _ = audio.process_audio_chunks(
+        mono_audio,
+        [[index, index + 1, 0] for index in range(chunk_count)],
+        samples_per_frame=2.0,
+        speeds=[1.0],
+        audio_fade_envelope_size=1,
+        max_audio_volume=2.0,
+    )
+
+    assert processed.shape == (chunk_count * 2,)
+    np.testing.assert_allclose(processed, [0.0, 2.0] * chunk_count)
+
+
+def test_process_audio_chunks_mono_empty_output_is_flat():
+    """Empty mono column inputs should still produce a 1-D output."""
+
+    processed, _ = audio.process_audio_chunks(
+        np.zeros((0, 1), dtype=np.float32),
+        [],
+        samples_per_frame=1.0,
+        speeds=[],
+        audio_fade_envelope_size=4,
+        max_audio_volume=1.0,
+    )
+
+    assert processed.shape == (0,)
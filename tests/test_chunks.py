@@ -5,6 +5,7 @@ from __future__ import annotations
 import numpy as np
 import pytest
 
+from talks_reducer import chunks
 from talks_reducer.chunks import build_chunks, detect_loud_frames, get_tree_expression
 
 
@@ -57,6 +58,62 @@ def test_detect_loud_frames_respects_thresholds():
     )
 
 
+@pytest.mark.parametrize("samples_per_frame", [1.0, 3.3, 1470.0])
+def test_detect_loud_frames_matches_per_frame_peaks(samples_per_frame: float):
+    """Vectorised detection should match a per-frame peak scan on stereo PCM."""
+
+    rng = np.random.default_rng(7)
+    audio_data = rng.integers(-8000, 8000, size=(10_000, 2), dtype=np.int16)
+    audio_data[2_000:5_000] //= 50
+    audio_frame_count = int(np.ceil(audio_data.shape[0] / samples_per_frame))
+    max_volume = float(np.abs(audio_data.astype(np.int32)).max())
+
+    expected = np.zeros(audio_frame_count, dtype=bool)
+    for frame_index in range(audio_frame_count):
+        start = int(frame_index * samples_per_frame)
+        end = min(int((frame_index + 1) * samples_per_frame), audio_data.shape[0])
+        peak = np.abs(audio_data[start:end].astype(np.int32)).max()
+        expected[frame_index] = peak / max_volume >= 0.1
+
+    result = detect_loud_frames(
+        audio_data, audio_frame_count, samples_per_frame, max_volume, 0.1
+    )
+
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_detect_loud_frames_blocks_do_not_change_result(monkeypatch):
+    """Scanning in small blocks must give the same mask as a single pass."""
+
+    rng = np.random.default_rng(3)
+    audio_data = rng.integers(-9000, 9000, size=(5_000, 2), dtype=np.int16)
+    audio_data[1_000:3_000] //= 40
+    args = (audio_data, 34, 147.0, 9000.0, 0.2)
+
+    single_pass = detect_loud_frames(*args)
+    monkeypatch.setattr(chunks, "_LOUDNESS_BLOCK_SAMPLES", 500)
+    blocked = detect_loud_frames(*args)
+
+    np.testing.assert_array_equal(blocked, single_pass)
+    assert single_pass.any() and not single_pass.all()
+
+
+def test_detect_loud_frames_treats_frames_past_the_audio_as_silent():
+    audio_data = np.array([0.9, 0.9, 0.9, 0.9], dtype=np.float32)
+
+    result = detect_loud_frames(audio_data, 4, 2, 0.9, 0.5)
+
+    np.testing.assert_array_equal(result, [True, True, False, False])
+
+
+def test_detect_loud_frames_handles_int16_minimum():
+    audio_data = np.array([[-32768, 0], [0, 0], [10, -10], [0, 0]], dtype=np.int16)
+
+    result = detect_loud_frames(audio_data, 2, 2, 32768.0, 0.5)
+
+    np.testing.assert_array_equal(result, [True, False])
+
+
 @pytest.mark.parametrize(
     "has_loud_audio, frame_spreadage, expected_chunks, expected_inclusion",
     [
@@ -78,6 +135,18 @@ def test_detect_loud_frames_respects_thresholds():
             [[0, 1, 0], [1, 2, 1], [2, 3, 0], [3, 4, 1], [4, 5, 0]],
             np.array([False, True, False, True, False], dtype=bool),
         ),
+        (
+            np.array([True, False, False, False, False, False, True], dtype=bool),
+            2,
+            [[0, 3, 1], [3, 4, 0], [4, 7, 1]],
+            np.array([True, True, True, False, True, True, True], dtype=bool),
+        ),
+        (
+            np.array([False, False, True, False, False], dtype=bool),
+            -1,
+            [[0, 5, 0]],
+            np.array([False, False, False, False, False], dtype=bool),
+        ),
     ],
 )
 def test_build_chunks_spread_and_transitions(
@@ -118,3 +187,18 @@ def test_get_tree_expression_balances_multiple_chunks() -> None:
     assert expression == "if(lt(N,3),N*1.0+0.0,if(lt(N,5),N*0.5+1.5,N*1.0-1.0))/TB/FR"
     speeds = [(chunk[3] - chunk[2]) / (chunk[1] - chunk[0]) for chunk in chunks]
     assert speeds == pytest.approx([1.0, 0.5, 1.0])
+
+
+def test_get_tree_expression_uses_escaped_separator() -> None:
+    """A filter-graph separator must replace every argument comma."""
+
+    chunks = [
+        [0, 3, 0, 3],
+        [3, 5, 3, 4],
+        [5, 6, 4, 5],
+    ]
+
+    expression = get_tree_expression(chunks, separator="\\,")
+
+    assert expression == get_tree_expression(chunks).replace(",", "\\,")
+    assert "," not in expression.replace("\\,", "")
@@ -26,7 +26,11 @@ def _http_server() -> tuple[str, int]:
     server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
     host, port = server.server_address
 
-    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    # A short poll interval lets ``shutdown`` return promptly instead of waiting
+    # out the default half-second ``serve_forever`` tick.
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
     thread.start()
 
     try:
@@ -48,7 +52,9 @@ def test_probe_host_detects_running_instance() -> None:
 def test_discover_servers_handles_missing_hosts() -> None:
     """Scanning an unreachable host should return an empty result list."""
 
-    results = discovery.discover_servers(port=65500, hosts=["192.0.2.123"])
+    results = discovery.discover_servers(
+        port=65500, hosts=["192.0.2.123"], timeout=0.05
+    )
     assert results == []
 
 
@@ -95,6 +101,28 @@ def test_discover_servers_filters_default_candidates() -> None:
     assert results == ["http://192.0.2.99:8080/"]
 
 
+def test_discover_servers_returns_hosts_in_candidate_order() -> None:
+    """Results follow host order, not completion or URL string order."""
+
+    later_host_done = threading.Event()
+
+    def fake_probe(host: str, port: int, timeout: float) -> str:
+        if host == "10.0.0.1":
+            # Finish after 10.0.0.10 so completion order disagrees with host order.
+            assert later_host_done.wait(timeout=5)
+        else:
+            later_host_done.set()
+        return f"http://{host}:{port}/"
+
+    results = discovery.discover_servers(
+        port=9005,
+        hosts=["10.0.0.10", "10.0.0.1"],
+        probe_host=fake_probe,
+    )
+
+    assert results == ["http://10.0.0.1:9005/", "http://10.0.0.10:9005/"]
+
+
 def test_discover_servers_reports_progress() -> None:
     """Discovery should surface progress updates as hosts are scanned."""
 
@@ -112,6 +140,33 @@ def test_discover_servers_reports_progress() -> None:
     assert progress_updates == [(0, 2), (1, 2), (2, 2)]
 
 
+def test_discover_servers_reports_progress_as_probes_finish() -> None:
+    """A slow host should not hold back progress for hosts that already finished."""
+
+    released = threading.Event()
+    waits: list[bool] = []
+
+    def probe(host: str, port: int, timeout: float) -> str | None:
+        if host == "192.0.2.10":
+            waits.append(released.wait(timeout=2))
+            return f"http://{host}:{port}/"
+        return None
+
+    def on_progress(current: int, total: int) -> None:
+        if current == 1:
+            released.set()
+
+    results = discovery.discover_servers(
+        port=9005,
+        hosts=["192.0.2.10", "192.0.2.11"],
+        progress_callback=on_progress,
+        probe_host=probe,
+    )
+
+    assert waits == [True]
+    assert results == ["http://192.0.2.10:9005/"]
+
+
 def test_iter_local_ipv4_addresses_uses_custom_sources() -> None:
     """Custom address sources should feed the local address iterator."""
 
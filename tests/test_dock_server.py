@@ -10,6 +10,10 @@ import pytest
 
 from talks_reducer import cli, dock_server
 
+# Poll quickly so ``shutdown()`` returns without waiting out the default 0.5 s
+# ``serve_forever`` tick after every end-to-end test.
+_SERVE_KWARGS = {"poll_interval": 0.01}
+
 
 def test_build_args_matches_dock_options() -> None:
     """Dock options translate into the same flags the Node.js server produced."""
@@ -106,7 +110,7 @@ def test_dock_server_serves_ui_and_rejects_bad_post(monkeypatch) -> None:
     monkeypatch.setattr(dock_server, "start_talks_reducer", lambda *args: None)
 
     httpd = dock_server.DockServer(("127.0.0.1", 0), dock_server.DEFAULT_EXE)
-    thread = Thread(target=httpd.serve_forever, daemon=True)
+    thread = Thread(target=httpd.serve_forever, kwargs=_SERVE_KWARGS, daemon=True)
     thread.start()
     try:
         port = httpd.server_address[1]
@@ -220,7 +224,7 @@ def test_get_presets_returns_store(monkeypatch) -> None:
     monkeypatch.setattr(presets_module, "load_presets", lambda *a, **k: sample)
 
     httpd = dock_server.DockServer(("127.0.0.1", 0), dock_server.DEFAULT_EXE)
-    thread = Thread(target=httpd.serve_forever, daemon=True)
+    thread = Thread(target=httpd.serve_forever, kwargs=_SERVE_KWARGS, daemon=True)
     thread.start()
     try:
         port = httpd.server_address[1]
@@ -257,7 +261,7 @@ def test_get_presets_serializes_sparse_preset(monkeypatch) -> None:
     monkeypatch.setattr(presets_module, "load_presets", lambda *a, **k: sample)
 
     httpd = dock_server.DockServer(("127.0.0.1", 0), dock_server.DEFAULT_EXE)
-    thread = Thread(target=httpd.serve_forever, daemon=True)
+    thread = Thread(target=httpd.serve_forever, kwargs=_SERVE_KWARGS, daemon=True)
     thread.start()
     try:
         port = httpd.server_address[1]
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import io
 import sys
+import time
 from types import SimpleNamespace
 from typing import List, Optional
 
@@ -20,14 +21,10 @@ def stub_static_ffmpeg(monkeypatch):
     monkeypatch.setitem(sys.modules, "static_ffmpeg", stub)
     monkeypatch.setattr(ffmpeg, "_ENCODER_LISTING", {}, raising=False)
     monkeypatch.setattr(ffmpeg, "_ENCODER_OPTIONS", {}, raising=False)
-    monkeypatch.setattr(
-        ffmpeg, "_FFMPEG_PATH_CACHE", {False: None, True: None}, raising=False
-    )
-    monkeypatch.setattr(
-        ffmpeg, "_FFPROBE_PATH_CACHE", {False: None, True: None}, raising=False
-    )
-    monkeypatch.setattr(ffmpeg, "_GLOBAL_FFMPEG_AVAILABLE", None, raising=False)
+    monkeypatch.setattr(ffmpeg, "_HWACCEL_LISTING", {}, raising=False)
+    ffmpeg._clear_ffmpeg_path_cache()
     yield
+    ffmpeg._clear_ffmpeg_path_cache()
     sys.modules.pop("static_ffmpeg", None)
 
 
@@ -205,6 +202,24 @@ def test_get_ffmpeg_path_caches(monkeypatch):
     assert calls == ["bundled", "global"]
 
 
+def test_clear_ffmpeg_path_cache_forces_new_lookup(monkeypatch):
+    calls: List[str] = []
+
+    def fake_resolve(*, prefer_global: bool = False) -> str:
+        calls.append("ffmpeg")
+        return "ffmpeg"
+
+    monkeypatch.setattr(ffmpeg, "_resolve_ffmpeg_path", fake_resolve)
+
+    ffmpeg.get_ffmpeg_path()
+    ffmpeg.get_ffmpeg_path()
+    ffmpeg._clear_ffmpeg_path_cache()
+    ffmpeg.get_ffmpeg_path()
+
+    assert calls == ["ffmpeg", "ffmpeg"]
+    assert ffmpeg._GLOBAL_FFMPEG_AVAILABLE is None
+
+
 def test_get_ffprobe_path_caches(monkeypatch):
     calls: List[str] = []
 
@@ -324,6 +339,27 @@ def test_check_cuda_available_requires_cuda_hwaccel(monkeypatch):
     assert not ffmpeg.check_cuda_available()
 
 
+def test_check_cuda_available_probes_ffmpeg_once(monkeypatch):
+    monkeypatch.setattr(ffmpeg, "get_ffmpeg_path", lambda: "/usr/bin/ffmpeg")
+    probes: List[str] = []
+
+    def fake_run(args, **kwargs):
+        probes.append(args[-1])
+        if "-hwaccels" in args:
+            return SimpleNamespace(stdout="cuda\n", returncode=0)
+        return SimpleNamespace(stdout="encoder h264_nvenc", returncode=0)
+
+    monkeypatch.setattr(ffmpeg.subprocess, "run", fake_run)
+
+    assert ffmpeg.check_cuda_available()
+    assert ffmpeg.check_cuda_available()
+    assert probes == ["-hwaccels", "-encoders"]
+
+    ffmpeg._clear_hardware_probe_cache()
+    assert ffmpeg.check_cuda_available()
+    assert probes == ["-hwaccels", "-encoders"] * 2
+
+
 def test_check_cuda_available_handles_errors(monkeypatch):
     monkeypatch.setattr(ffmpeg, "get_ffmpeg_path", lambda: "/usr/bin/ffmpeg")
 
@@ -633,6 +669,25 @@ def test_build_extract_audio_command(monkeypatch):
     assert command == expected
 
 
+def test_build_extract_audio_pipe_command(monkeypatch):
+    monkeypatch.setattr(ffmpeg, "get_ffmpeg_path", lambda: "/usr/bin/ffmpeg")
+
+    command = ffmpeg.build_extract_audio_pipe_command(
+        "input.mp4",
+        48000,
+        hwaccel=["-hwaccel", "cuda"],
+        cut_start_seconds=10.0,
+        cut_end_seconds=60.0,
+    )
+
+    expected = (
+        '"/usr/bin/ffmpeg" -hwaccel cuda -ss 10 -t 50 -i "input.mp4" '
+        "-ac 2 -ar 48000 -vn -f s16le -acodec pcm_s16le pipe:1 "
+        "-hide_banner -loglevel warning -stats"
+    )
+    assert command == expected
+
+
 def test_build_audio_only_command_uses_processed_wav(monkeypatch):
     monkeypatch.setattr(ffmpeg, "get_ffmpeg_path", lambda: "/usr/bin/ffmpeg")
 
@@ -857,6 +912,31 @@ def test_build_video_commands_keep_input_audio(monkeypatch):
     assert command.count('-i "') == 1
 
 
+def test_build_video_commands_reads_audio_from_stdin(monkeypatch):
+    """Raw processed audio can be piped in place of an intermediate WAV."""
+
+    monkeypatch.setattr(ffmpeg, "get_ffmpeg_path", lambda: "/usr/bin/ffmpeg")
+
+    raw_args = ffmpeg.build_raw_audio_input_args("f32le", 48000, 2)
+    command, _fallback, _use_cuda = ffmpeg.build_video_commands(
+        "input.mp4",
+        None,
+        "filter.txt",
+        "output.mp4",
+        cuda_available=False,
+        optimize=True,
+        small=False,
+        frame_rate=30.0,
+        audio_stdin_format=raw_args,
+    )
+
+    assert raw_args == "-f f32le -ar 48000 -ac 2"
+    assert '-i "input.mp4" -f f32le -ar 48000 -ac 2 -i pipe:0' in command
+    assert "-map 0:v:0 -map 1:a" in command
+    assert "-c:a aac" in command
+    assert "-an" not in command
+
+
 def test_build_video_commands_small_cuda(monkeypatch):
     monkeypatch.setattr(ffmpeg, "get_ffmpeg_path", lambda: "/usr/bin/ffmpeg")
     monkeypatch.setattr(
@@ -1264,6 +1344,117 @@ def test_run_timed_ffmpeg_command_reports_progress(monkeypatch):
     assert "frame=" in fake_stderr.getvalue()
 
 
+def test_run_timed_ffmpeg_command_reports_last_output_time(monkeypatch):
+    """The final ``time=`` position is handed to ``duration_callback``."""
+
+    fake_lines = [
+        "frame=   10 fps=30.0 time=00:00:00.33 bitrate=N/A\n",
+        "frame=   95 fps=30.0 time=00:01:02.50 bitrate=N/A\n",
+        "size=N/A time=N/A bitrate=N/A\n",
+    ]
+
+    monkeypatch.setattr(
+        ffmpeg.subprocess, "Popen", lambda args, **kwargs: FakeProcess(fake_lines)
+    )
+    monkeypatch.setattr(ffmpeg.sys, "stderr", io.StringIO())
+
+    durations: List[float] = []
+    ffmpeg.run_timed_ffmpeg_command(
+        "ffmpeg -i input.mp4",
+        reporter=DummyProgressReporter(),
+        duration_callback=durations.append,
+    )
+
+    assert durations == [pytest.approx(62.5)]
+
+
+def test_parse_ffmpeg_time_handles_missing_values():
+    assert ffmpeg._parse_ffmpeg_time("time=01:00:01.25 speed=2x") == 3601.25
+    assert ffmpeg._parse_ffmpeg_time("time=-00:00:00.04") == pytest.approx(-0.04)
+    assert ffmpeg._parse_ffmpeg_time("time=N/A") is None
+    assert ffmpeg._parse_ffmpeg_time("frame=1") is None
+
+
+def test_run_timed_ffmpeg_command_feeds_stdin_chunks(monkeypatch):
+    """Stdin chunks are written in order and the pipe is closed afterwards."""
+
+    captured_kwargs = {}
+
+    class StdinProcess:
+        def __init__(self) -> None:
+            self.stdin = io.BytesIO()
+            self.stdin.close = lambda: setattr(self, "stdin_closed", True)
+            self.stdin_closed = False
+            self.stderr = io.BytesIO(b"frame=   5 fps=30.0\n")
+            self.stdout = io.BytesIO(b"")
+            self.returncode = 0
+
+        def wait(self) -> None:
+            self.returncode = 0
+
+    processes: List[StdinProcess] = []
+
+    def fake_popen(args, **kwargs):
+        captured_kwargs.update(kwargs)
+        processes.append(StdinProcess())
+        return processes[-1]
+
+    monkeypatch.setattr(ffmpeg.subprocess, "Popen", fake_popen)
+    monkeypatch.setattr(ffmpeg.sys, "stderr", io.StringIO())
+
+    ffmpeg.run_timed_ffmpeg_command(
+        "ffmpeg -f f32le -i pipe:0 out.mp4",
+        reporter=DummyProgressReporter(),
+        stdin_chunks=iter([b"abc", b"def"]),
+    )
+
+    for _ in range(100):
+        if processes[0].stdin_closed:
+            break
+        time.sleep(0.01)
+
+    assert captured_kwargs["stdin"] is ffmpeg.subprocess.PIPE
+    assert "universal_newlines" not in captured_kwargs
+    assert processes[0].stdin.getvalue() == b"abcdef"
+    assert processes[0].stdin_closed
+
+
+def test_run_timed_ffmpeg_command_captures_binary_stdout(monkeypatch):
+    """Piped output is returned as bytes while stderr still drives progress."""
+
+    reporter = DummyProgressReporter()
+    payload = bytes(range(256)) * 4
+    captured_kwargs = {}
+
+    class BinaryProcess:
+        def __init__(self) -> None:
+            self.stderr = io.BytesIO(b"frame=   5 fps=30.0\r\nwarning: odd\n")
+            self.stdout = io.BytesIO(payload)
+            self.returncode = 0
+
+        def wait(self) -> None:
+            self.returncode = 0
+
+    def fake_popen(args, **kwargs):
+        captured_kwargs.update(kwargs)
+        return BinaryProcess()
+
+    monkeypatch.setattr(ffmpeg.subprocess, "Popen", fake_popen)
+    monkeypatch.setattr(ffmpeg.sys, "stderr", io.StringIO())
+
+    result = ffmpeg.run_timed_ffmpeg_command(
+        "ffmpeg -i input.mp4 -f s16le pipe:1",
+        reporter=reporter,
+        total=10,
+        capture_stdout=True,
+    )
+
+    assert result == payload
+    assert "universal_newlines" not in captured_kwargs
+    assert reporter.tasks[0].current == 5
+    assert any("warning" in log for log in reporter.logs)
+
+
 class StallingStream:
     """A fake stderr stream that produces one line then blocks forever."""
 
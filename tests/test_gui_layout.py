@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 from types import SimpleNamespace
-from unittest.mock import Mock
+from unittest.mock import Mock, NonCallableMock
 
 import pytest
 
@@ -49,18 +49,16 @@ def _stub_preset_store(monkeypatch):
 class DummyVar:
     def __init__(self, value: float):
         self._value = value
-        self.set_calls: list[float] = []
-        self.traces: list[tuple[str, object]] = []
+        self.last_trace: tuple[str, object] | None = None
 
     def get(self) -> float:
         return self._value
 
     def set(self, value: float) -> None:
         self._value = value
-        self.set_calls.append(value)
 
     def trace_add(self, mode: str, callback):
-        self.traces.append((mode, callback))
+        self.last_trace = (mode, callback)
 
 
 class VarStub:
@@ -202,14 +200,27 @@ class RootStub:
         return 0
 
 
-def make_widget_mock() -> Mock:
-    widget = Mock()
-    widget.grid = Mock()
-    widget.grid_remove = Mock()
-    widget.pack = Mock()
-    widget.pack_forget = Mock()
-    widget.configure = Mock()
-    return widget
+_ROOT_SPEC = [
+    "iconbitmap",
+    "iconphoto",
+    "update_idletasks",
+    "minsize",
+    "geometry",
+    "winfo_width",
+    "winfo_height",
+]
+
+
+def make_widget_mock() -> NonCallableMock:
+    """Return a widget stub that only records geometry and configure calls.
+
+    ``spec_set`` stops the mock from synthesising arbitrary child attributes,
+    so a layout change that touches another widget method fails loudly.
+    """
+
+    return NonCallableMock(
+        spec_set=["grid", "grid_remove", "pack", "pack_forget", "configure"]
+    )
 
 
 def _make_layout_gui(**overrides) -> SimpleNamespace:
@@ -342,12 +353,22 @@ def test_format_activity_line_tolerates_missing_fields():
     assert line == "--:--:--  unknown"
 
 
-def test_build_layout_shows_activity_log_in_managed_mode(monkeypatch):
-    monkeypatch.setattr(layout, "add_segmented", Mock())
-    monkeypatch.setattr(layout, "add_entry", Mock())
-    monkeypatch.setattr(layout, "update_basic_reset_state", Mock())
+@pytest.fixture
+def stub_layout_builders(monkeypatch):
+    """Replace the per-row builders so build_layout tests only see the frame."""
+
+    stubs = SimpleNamespace(
+        add_segmented=Mock(),
+        add_entry=Mock(),
+        update_basic_reset_state=Mock(),
+    )
+    for name, stub in vars(stubs).items():
+        monkeypatch.setattr(layout, name, stub)
     monkeypatch.setattr(layout, "default_temp_folder", lambda: Path("/tmp/mock"))
+    return stubs
+
 
+def test_build_layout_shows_activity_log_in_managed_mode(stub_layout_builders):
     gui = _make_layout_gui(server_managed=True, local_server_url="http://x:9005/")
 
     layout.build_layout(gui)
@@ -357,12 +378,7 @@ def test_build_layout_shows_activity_log_in_managed_mode(monkeypatch):
     assert not gui.activity_frame.grid_remove_calls
 
 
-def test_build_layout_hides_activity_log_in_standalone_mode(monkeypatch):
-    monkeypatch.setattr(layout, "add_segmented", Mock())
-    monkeypatch.setattr(layout, "add_entry", Mock())
-    monkeypatch.setattr(layout, "update_basic_reset_state", Mock())
-    monkeypatch.setattr(layout, "default_temp_folder", lambda: Path("/tmp/mock"))
-
+def test_build_layout_hides_activity_log_in_standalone_mode(stub_layout_builders):
     gui = _make_layout_gui(server_managed=False)
 
     layout.build_layout(gui)
@@ -371,12 +387,7 @@ def test_build_layout_hides_activity_log_in_standalone_mode(monkeypatch):
     assert gui.activity_frame.grid_remove_calls
 
 
-def test_build_layout_shows_local_server_url_in_managed_mode(monkeypatch):
-    monkeypatch.setattr(layout, "add_segmented", Mock())
-    monkeypatch.setattr(layout, "add_entry", Mock())
-    monkeypatch.setattr(layout, "update_basic_reset_state", Mock())
-    monkeypatch.setattr(layout, "default_temp_folder", lambda: Path("/tmp/mock"))
-
+def test_build_layout_shows_local_server_url_in_managed_mode(stub_layout_builders):
     gui = _make_layout_gui(
         server_managed=True,
         local_server_url="http://192.168.1.5:9005/",
@@ -392,12 +403,7 @@ def test_build_layout_shows_local_server_url_in_managed_mode(monkeypatch):
     assert not label.grid_remove_calls
 
 
-def test_build_layout_hides_local_server_url_in_standalone_mode(monkeypatch):
-    monkeypatch.setattr(layout, "add_segmented", Mock())
-    monkeypatch.setattr(layout, "add_entry", Mock())
-    monkeypatch.setattr(layout, "update_basic_reset_state", Mock())
-    monkeypatch.setattr(layout, "default_temp_folder", lambda: Path("/tmp/mock"))
-
+def test_build_layout_hides_local_server_url_in_standalone_mode(stub_layout_builders):
     gui = _make_layout_gui(server_managed=False, local_server_url=None)
 
     layout.build_layout(gui)
@@ -409,12 +415,7 @@ def test_build_layout_hides_local_server_url_in_standalone_mode(monkeypatch):
     assert label.grid_remove_calls
 
 
-def test_build_layout_creates_watch_widgets(monkeypatch):
-    monkeypatch.setattr(layout, "add_segmented", Mock())
-    monkeypatch.setattr(layout, "add_entry", Mock())
-    monkeypatch.setattr(layout, "update_basic_reset_state", Mock())
-    monkeypatch.setattr(layout, "default_temp_folder", lambda: Path("/tmp/mock"))
-
+def test_build_layout_creates_watch_widgets(stub_layout_builders):
     gui = _make_layout_gui()
 
     layout.build_layout(gui)
@@ -425,12 +426,7 @@ def test_build_layout_creates_watch_widgets(monkeypatch):
     assert hasattr(gui, "watch_browse_button")
 
 
-def test_build_layout_adds_optimize_tooltip(monkeypatch):
-    monkeypatch.setattr(layout, "add_segmented", Mock())
-    monkeypatch.setattr(layout, "add_entry", Mock())
-    monkeypatch.setattr(layout, "update_basic_reset_state", Mock())
-    monkeypatch.setattr(layout, "default_temp_folder", lambda: Path("/tmp/mock"))
-
+def test_build_layout_adds_optimize_tooltip(stub_layout_builders):
     gui = _make_layout_gui()
 
     layout.build_layout(gui)
@@ -440,12 +436,7 @@ def test_build_layout_adds_optimize_tooltip(monkeypatch):
     assert "<Leave>" in bound_events
 
 
-def test_build_layout_aligns_server_entry_and_discover_button(monkeypatch):
-    monkeypatch.setattr(layout, "add_segmented", Mock())
-    monkeypatch.setattr(layout, "add_entry", Mock())
-    monkeypatch.setattr(layout, "update_basic_reset_state", Mock())
-    monkeypatch.setattr(layout, "default_temp_folder", lambda: Path("/tmp/mock"))
-
+def test_build_layout_aligns_server_entry_and_discover_button(stub_layout_builders):
     gui = _make_layout_gui()
 
     layout.build_layout(gui)
@@ -626,11 +617,9 @@ def test_build_layout_initializes_widgets(monkeypatch):
     )
 
 
-def test_build_layout_adds_macos_update_button_under_advanced(monkeypatch):
-    monkeypatch.setattr(layout, "add_segmented", Mock())
-    monkeypatch.setattr(layout, "add_entry", Mock())
-    monkeypatch.setattr(layout, "update_basic_reset_state", Mock())
-    monkeypatch.setattr(layout, "default_temp_folder", lambda: Path("/tmp/mock"))
+def test_build_layout_adds_macos_update_button_under_advanced(
+    monkeypatch, stub_layout_builders
+):
     monkeypatch.setattr(layout, "sys", SimpleNamespace(platform="darwin"))
 
     gui = _make_layout_gui()
@@ -656,11 +645,7 @@ def test_build_layout_adds_macos_update_button_under_advanced(monkeypatch):
     )
 
 
-def test_build_layout_omits_update_button_on_linux(monkeypatch):
-    monkeypatch.setattr(layout, "add_segmented", Mock())
-    monkeypatch.setattr(layout, "add_entry", Mock())
-    monkeypatch.setattr(layout, "update_basic_reset_state", Mock())
-    monkeypatch.setattr(layout, "default_temp_folder", lambda: Path("/tmp/mock"))
+def test_build_layout_omits_update_button_on_linux(monkeypatch, stub_layout_builders):
     monkeypatch.setattr(layout, "sys", SimpleNamespace(platform="linux"))
 
     gui = _make_layout_gui()
@@ -671,12 +656,7 @@ def test_build_layout_omits_update_button_on_linux(monkeypatch):
     assert not hasattr(gui, "update_status_label")
 
 
-def _build_layout_with_cut(monkeypatch, *, cut_enabled: bool):
-    monkeypatch.setattr(layout, "add_segmented", Mock())
-    monkeypatch.setattr(layout, "add_entry", Mock())
-    monkeypatch.setattr(layout, "update_basic_reset_state", Mock())
-    monkeypatch.setattr(layout, "default_temp_folder", lambda: Path("/tmp/mock"))
-
+def _build_layout_with_cut(*, cut_enabled: bool):
     gui = _make_layout_gui(cut_enabled_var=BooleanVarStub(value=cut_enabled))
     layout.build_layout(gui)
     return gui
@@ -716,8 +696,8 @@ def test_simple_mode_open_output_and_cut_share_one_row():
     )
 
 
-def test_build_cut_panel_constructs_widgets(monkeypatch):
-    gui = _build_layout_with_cut(monkeypatch, cut_enabled=True)
+def test_build_cut_panel_constructs_widgets(stub_layout_builders):
+    gui = _build_layout_with_cut(cut_enabled=True)
 
     assert isinstance(gui.cut_check, WidgetStub)
     assert gui.cut_check.kwargs["variable"] is gui.cut_enabled_var
@@ -743,16 +723,16 @@ def test_build_cut_panel_constructs_widgets(monkeypatch):
     assert not gui.cut_panel.grid_remove_calls
 
 
-def test_build_cut_panel_hidden_when_disabled(monkeypatch):
-    gui = _build_layout_with_cut(monkeypatch, cut_enabled=False)
+def test_build_cut_panel_hidden_when_disabled(stub_layout_builders):
+    gui = _build_layout_with_cut(cut_enabled=False)
 
     assert isinstance(gui.cut_panel, WidgetStub)
     # Hidden because the checkbox is off: grid_remove() called after creation.
     assert gui.cut_panel.grid_remove_calls
 
 
-def test_build_cut_panel_sliders_forward_to_handler(monkeypatch):
-    gui = _build_layout_with_cut(monkeypatch, cut_enabled=True)
+def test_build_cut_panel_sliders_forward_to_handler(stub_layout_builders):
+    gui = _build_layout_with_cut(cut_enabled=True)
 
     gui.cut_start_slider.kwargs["command"]("0")
     gui.cut_end_slider.kwargs["command"]("0")
@@ -761,12 +741,7 @@ def test_build_cut_panel_sliders_forward_to_handler(monkeypatch):
     assert gui._on_cut_slider_change.call_args_list[1].args == ("end",)
 
 
-def test_build_layout_disables_global_ffmpeg_when_unavailable(monkeypatch):
-    monkeypatch.setattr(layout, "add_segmented", Mock())
-    monkeypatch.setattr(layout, "add_entry", Mock())
-    monkeypatch.setattr(layout, "update_basic_reset_state", Mock())
-    monkeypatch.setattr(layout, "default_temp_folder", lambda: Path("/tmp/mock"))
-
+def test_build_layout_disables_global_ffmpeg_when_unavailable(stub_layout_builders):
     ttk = SimpleNamespace(
         Frame=WidgetFactory("Frame"),
         Checkbutton=WidgetFactory("Checkbutton"),
@@ -862,9 +837,9 @@ def test_build_layout_disables_global_ffmpeg_when_unavailable(monkeypatch):
 
 
 def test_add_entry_with_browse(monkeypatch):
-    label_widget = Mock()
-    entry_widget = Mock()
-    button_widget = Mock()
+    label_widget = Mock(spec_set=["grid"])
+    entry_widget = Mock(spec_set=["grid"])
+    button_widget = Mock(spec_set=["grid"])
 
     ttk = SimpleNamespace(
         Label=Mock(return_value=label_widget),
@@ -893,8 +868,8 @@ def test_add_entry_with_browse(monkeypatch):
 
 
 def test_add_entry_without_browse():
-    label_widget = Mock()
-    entry_widget = Mock()
+    label_widget = Mock(spec_set=["grid"])
+    entry_widget = Mock(spec_set=["grid"])
 
     ttk = SimpleNamespace(
         Label=Mock(return_value=label_widget),
@@ -957,7 +932,8 @@ def test_add_segmented_registers_updater_and_persists_on_change(monkeypatch):
     assert gui._slider_updaters["silent_speed"] is not control.set_value
     assert gui._basic_defaults["silent_speed"] == 5.0
     assert gui._basic_variables["silent_speed"] is variable
-    assert variable.traces and variable.traces[-1][0] == "write"
+    assert variable.last_trace is not None
+    assert variable.last_trace[0] == "write"
 
     # Clicking the "10" button both writes the variable and persists/refreshes
     # the reset state, mirroring what the old slider's ``command`` callback did.
@@ -1319,47 +1295,37 @@ def test_editing_the_server_url_does_not_hide_the_row():
     assert not gui.server_url_row.pack_forget_calls
 
 
-def test_apply_window_icon_prefers_windows_ico(monkeypatch):
-    icon_path = Path("C:/app.ico")
-    monkeypatch.setattr(layout, "sys", SimpleNamespace(platform="win32"))
-    monkeypatch.setattr(layout, "find_icon_path", Mock(return_value=icon_path))
-
-    gui = SimpleNamespace(
-        root=Mock(),
-        tk=SimpleNamespace(PhotoImage=Mock(), TclError=Exception),
-    )
-
-    layout.apply_window_icon(gui)
-    gui.root.iconbitmap.assert_called_once_with(str(icon_path))
-    gui.root.iconphoto.assert_not_called()
-
-
-def test_apply_window_icon_uses_photoimage_for_png(monkeypatch):
-    icon_path = Path("/tmp/app.png")
-    monkeypatch.setattr(layout, "sys", SimpleNamespace(platform="linux"))
+@pytest.mark.parametrize(
+    ("platform", "icon_path", "expected"),
+    [
+        ("win32", Path("C:/app.ico"), "iconbitmap"),
+        ("linux", Path("/tmp/app.png"), "iconphoto"),
+        ("linux", None, None),
+    ],
+    ids=["windows-ico", "photoimage-png", "no-icon"],
+)
+def test_apply_window_icon(monkeypatch, platform, icon_path, expected):
+    monkeypatch.setattr(layout, "sys", SimpleNamespace(platform=platform))
     monkeypatch.setattr(layout, "find_icon_path", Mock(return_value=icon_path))
 
     photo_image = Mock()
     tk = SimpleNamespace(PhotoImage=Mock(return_value=photo_image), TclError=Exception)
-    gui = SimpleNamespace(root=Mock(), tk=tk)
+    gui = SimpleNamespace(root=Mock(spec_set=_ROOT_SPEC), tk=tk)
 
     layout.apply_window_icon(gui)
 
-    tk.PhotoImage.assert_called_once_with(file=str(icon_path))
-    gui.root.iconphoto.assert_called_once_with(False, photo_image)
-
-
-def test_apply_window_icon_no_path_noop(monkeypatch):
-    monkeypatch.setattr(layout, "find_icon_path", Mock(return_value=None))
-    monkeypatch.setattr(layout, "sys", SimpleNamespace(platform="linux"))
-
-    gui = SimpleNamespace(
-        root=Mock(), tk=SimpleNamespace(PhotoImage=Mock(), TclError=Exception)
-    )
-    layout.apply_window_icon(gui)
-
-    gui.root.iconphoto.assert_not_called()
-    gui.root.iconbitmap.assert_not_called()
+    expected_args = {
+        "iconbitmap": (str(icon_path),),
+        "iconphoto": (False, photo_image),
+    }
+    for method, args in expected_args.items():
+        recorder = getattr(gui.root, method)
+        if method == expected:
+            recorder.assert_called_once_with(*args)
+        else:
+            recorder.assert_not_called()
+    if expected == "iconphoto":
+        tk.PhotoImage.assert_called_once_with(file=str(icon_path))
 
 
 def test_apply_window_size_simple_sets_geometry():
@@ -1401,13 +1367,21 @@ def test_apply_window_size_full_only_expands():
     root.geometry.assert_not_called()
 
 
-def test_apply_simple_mode_simple_branch(monkeypatch):
+@pytest.fixture
+def apply_size(monkeypatch):
     apply_size = Mock()
     monkeypatch.setattr(layout, "apply_window_size", apply_size)
+    return apply_size
 
-    gui = SimpleNamespace(
+
+def make_simple_mode_gui(
+    *, simple: bool, advanced_visible: bool, **overrides: object
+) -> SimpleNamespace:
+    """Return a GUI stub with every widget :func:`apply_simple_mode` toggles."""
+
+    attrs = dict(
         tk=SimpleNamespace(LEFT="left", RIGHT="right"),
-        simple_mode_var=SimpleNamespace(get=lambda: True),
+        simple_mode_var=SimpleNamespace(get=lambda: simple),
         basic_options_frame=make_widget_mock(),
         advanced_preset_frame=make_widget_mock(),
         log_frame=make_widget_mock(),
@@ -1416,7 +1390,7 @@ def test_apply_simple_mode_simple_branch(monkeypatch):
         button_frame=make_widget_mock(),
         advanced_frame=make_widget_mock(),
         run_after_drop_var=SimpleNamespace(set=Mock()),
-        advanced_visible=SimpleNamespace(get=lambda: False),
+        advanced_visible=SimpleNamespace(get=lambda: advanced_visible),
         _simple_presets=list(_TEST_PRESETS),
         open_output_check=make_widget_mock(),
         cut_check=make_widget_mock(),
@@ -1424,6 +1398,12 @@ def test_apply_simple_mode_simple_branch(monkeypatch):
         cut_enabled_var=SimpleNamespace(get=lambda: True),
         drop_zone=Mock(),
     )
+    attrs.update(overrides)
+    return SimpleNamespace(**attrs)
+
+
+def test_apply_simple_mode_simple_branch(apply_size):
+    gui = make_simple_mode_gui(simple=True, advanced_visible=False)
 
     layout.apply_simple_mode(gui, initial=True)
 
@@ -1446,31 +1426,10 @@ def test_apply_simple_mode_simple_branch(monkeypatch):
     gui.drop_zone.focus_set.assert_called_once()
 
 
-def test_apply_simple_mode_simple_branch_keeps_checkboxes_without_presets(monkeypatch):
+def test_apply_simple_mode_simple_branch_keeps_checkboxes_without_presets(apply_size):
     """With no presets the resolution checkboxes stay visible in Simple mode."""
 
-    apply_size = Mock()
-    monkeypatch.setattr(layout, "apply_window_size", apply_size)
-
-    gui = SimpleNamespace(
-        tk=SimpleNamespace(LEFT="left", RIGHT="right"),
-        simple_mode_var=SimpleNamespace(get=lambda: True),
-        basic_options_frame=make_widget_mock(),
-        advanced_preset_frame=make_widget_mock(),
-        log_frame=make_widget_mock(),
-        activity_frame=make_widget_mock(),
-        server_managed=True,
-        button_frame=make_widget_mock(),
-        advanced_frame=make_widget_mock(),
-        run_after_drop_var=SimpleNamespace(set=Mock()),
-        advanced_visible=SimpleNamespace(get=lambda: False),
-        _simple_presets=[],
-        open_output_check=make_widget_mock(),
-        cut_check=make_widget_mock(),
-        cut_panel=make_widget_mock(),
-        cut_enabled_var=SimpleNamespace(get=lambda: True),
-        drop_zone=Mock(),
-    )
+    gui = make_simple_mode_gui(simple=True, advanced_visible=False, _simple_presets=[])
 
     layout.apply_simple_mode(gui, initial=True)
 
@@ -1482,28 +1441,8 @@ def test_apply_simple_mode_simple_branch_keeps_checkboxes_without_presets(monkey
     )
 
 
-def test_apply_simple_mode_full_branch(monkeypatch):
-    apply_size = Mock()
-    monkeypatch.setattr(layout, "apply_window_size", apply_size)
-
-    gui = SimpleNamespace(
-        simple_mode_var=SimpleNamespace(get=lambda: False),
-        basic_options_frame=make_widget_mock(),
-        advanced_preset_frame=make_widget_mock(),
-        log_frame=make_widget_mock(),
-        activity_frame=make_widget_mock(),
-        server_managed=True,
-        button_frame=make_widget_mock(),
-        advanced_frame=make_widget_mock(),
-        run_after_drop_var=SimpleNamespace(set=Mock()),
-        advanced_visible=SimpleNamespace(get=lambda: True),
-        open_output_check=make_widget_mock(),
-        cut_check=make_widget_mock(),
-        cut_panel=make_widget_mock(),
-        cut_enabled_var=SimpleNamespace(get=lambda: True),
-        tk=SimpleNamespace(LEFT="left", RIGHT="right"),
-        drop_zone=Mock(),
-    )
+def test_apply_simple_mode_full_branch(apply_size):
+    gui = make_simple_mode_gui(simple=False, advanced_visible=True)
 
     layout.apply_simple_mode(gui)
 
@@ -1525,25 +1464,12 @@ def test_apply_simple_mode_full_branch(monkeypatch):
     gui.run_after_drop_var.set.assert_not_called()
 
 
-def test_apply_simple_mode_full_branch_hides_activity_when_standalone(monkeypatch):
-    apply_size = Mock()
-    monkeypatch.setattr(layout, "apply_window_size", apply_size)
-
-    gui = SimpleNamespace(
-        simple_mode_var=SimpleNamespace(get=lambda: False),
-        basic_options_frame=make_widget_mock(),
-        log_frame=make_widget_mock(),
-        activity_frame=make_widget_mock(),
+def test_apply_simple_mode_full_branch_hides_activity_when_standalone(apply_size):
+    gui = make_simple_mode_gui(
+        simple=False,
+        advanced_visible=True,
         server_managed=False,
-        button_frame=make_widget_mock(),
-        advanced_frame=make_widget_mock(),
-        run_after_drop_var=SimpleNamespace(set=Mock()),
-        advanced_visible=SimpleNamespace(get=lambda: True),
-        cut_check=make_widget_mock(),
-        cut_panel=make_widget_mock(),
         cut_enabled_var=SimpleNamespace(get=lambda: False),
-        tk=SimpleNamespace(LEFT="left", RIGHT="right"),
-        drop_zone=Mock(),
     )
 
     layout.apply_simple_mode(gui)
@@ -1553,10 +1479,8 @@ def test_apply_simple_mode_full_branch_hides_activity_when_standalone(monkeypatc
     gui.activity_frame.grid_remove.assert_called_once()
 
 
-def test_apply_simple_mode_full_branch_hides_advanced_when_not_visible(monkeypatch):
-    apply_size = Mock()
-    monkeypatch.setattr(layout, "apply_window_size", apply_size)
-
+def test_apply_simple_mode_full_branch_hides_advanced_when_not_visible(apply_size):
+    # Deliberately sparse: the full branch must tolerate missing optional widgets.
     gui = SimpleNamespace(
         simple_mode_var=SimpleNamespace(get=lambda: False),
         basic_options_frame=make_widget_mock(),
@@ -1757,12 +1681,7 @@ def test_apply_preset_to_gui_persists_through_real_segmented_updater(monkeypatch
     gui.preferences.update.assert_any_call("silent_speed", 10.0)
 
 
-def test_build_layout_populates_preset_dropdown(monkeypatch):
-    monkeypatch.setattr(layout, "add_segmented", Mock())
-    monkeypatch.setattr(layout, "add_entry", Mock())
-    monkeypatch.setattr(layout, "update_basic_reset_state", Mock())
-    monkeypatch.setattr(layout, "default_temp_folder", lambda: Path("/tmp/mock"))
-
+def test_build_layout_populates_preset_dropdown(stub_layout_builders):
     gui = _make_layout_gui()
 
     layout.build_layout(gui)
@@ -1776,11 +1695,9 @@ def test_build_layout_populates_preset_dropdown(monkeypatch):
     assert not gui.simple_preset_frame.grid_remove_calls
 
 
-def test_build_layout_hides_preset_selector_when_empty(monkeypatch):
-    monkeypatch.setattr(layout, "add_segmented", Mock())
-    monkeypatch.setattr(layout, "add_entry", Mock())
-    monkeypatch.setattr(layout, "update_basic_reset_state", Mock())
-    monkeypatch.setattr(layout, "default_temp_folder", lambda: Path("/tmp/mock"))
+def test_build_layout_hides_preset_selector_when_empty(
+    monkeypatch, stub_layout_builders
+):
     monkeypatch.setattr(layout.presets, "load_presets", lambda *a, **k: [])
 
     gui = _make_layout_gui()
@@ -2251,12 +2168,7 @@ def test_delete_advanced_preset_removes_selection(monkeypatch):
     assert gui.advanced_preset_var.get() == layout.presets.CUSTOM_LABEL
 
 
-def test_build_layout_creates_advanced_preset_strip(monkeypatch):
-    monkeypatch.setattr(layout, "add_segmented", Mock())
-    monkeypatch.setattr(layout, "add_entry", Mock())
-    monkeypatch.setattr(layout, "update_basic_reset_state", Mock())
-    monkeypatch.setattr(layout, "default_temp_folder", lambda: Path("/tmp/mock"))
-
+def test_build_layout_creates_advanced_preset_strip(stub_layout_builders):
     gui = _make_layout_gui()
 
     layout.build_layout(gui)
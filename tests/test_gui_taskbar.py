@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import ctypes
 import sys
 
 import pytest
@@ -50,6 +51,15 @@ def test_set_value_clamps_to_the_zero_to_hundred_range(progress, backend):
     assert backend.calls == [("value", 0.0), ("value", 42.5), ("value", 100.0)]
 
 
+def test_set_value_maps_nan_to_a_full_bar(progress, backend):
+    progress.begin()
+    backend.calls.clear()
+
+    progress.set_value(float("nan"))
+
+    assert backend.calls == [("value", 100.0)]
+
+
 def test_set_value_is_ignored_before_a_run_begins(progress, backend):
     progress.set_value(50)
 
@@ -194,6 +204,76 @@ def test_create_taskbar_progress_uses_the_win32_backend(monkeypatch):
     assert progress._backend is sentinel
 
 
+def _recording_win32_backend() -> tuple[taskbar._Win32Backend, list]:
+    """Return a Win32 backend whose COM methods are replaced by recorders."""
+
+    calls: list[tuple[str, object]] = []
+    backend = taskbar._Win32Backend.__new__(taskbar._Win32Backend)
+    backend._hwnd = 1
+    backend._hwnd_arg = None
+    backend._ptr = None
+    backend._last_value = None
+    backend._last_flags = None
+    backend._set_progress_value = lambda _ptr, _hwnd, value, _total: calls.append(
+        ("value", value)
+    )
+    backend._set_progress_state = lambda _ptr, _hwnd, flags: calls.append(
+        ("state", flags)
+    )
+    return backend, calls
+
+
+def test_win32_backend_skips_updates_that_do_not_change_the_bar():
+    backend, calls = _recording_win32_backend()
+
+    backend.set_state("normal")
+    backend.set_state("normal")
+    backend.set_value(10.2)
+    backend.set_value(9.8)
+    backend.set_value(11)
+
+    assert calls == [
+        ("state", taskbar._TBPF_NORMAL),
+        ("value", 10),
+        ("value", 11),
+    ]
+
+
+def test_win32_backend_resends_the_value_after_a_state_change():
+    backend, calls = _recording_win32_backend()
+
+    backend.set_value(50)
+    backend.set_state("none")
+    backend.set_state("normal")
+    backend.set_value(50)
+
+    assert calls == [
+        ("value", 50),
+        ("state", taskbar._TBPF_NOPROGRESS),
+        ("state", taskbar._TBPF_NORMAL),
+        ("value", 50),
+    ]
+
+
+def test_com_ready_results_use_signed_hresults():
+    assert taskbar._COM_READY_RESULTS == (0, 1, -2147417850)
+
+
+def test_vtable_entry_reads_the_slot_address():
+    slots = (ctypes.c_void_p * 4)(11, 22, 33, 44)
+    com_object = ctypes.c_void_p(ctypes.addressof(slots))
+    backend = taskbar._Win32Backend.__new__(taskbar._Win32Backend)
+    backend._ptr = ctypes.c_void_p(ctypes.addressof(com_object))
+
+    assert backend._vtable_entry(2, lambda address: address) == 33
+
+
+def test_progress_and_backends_use_slots(progress):
+    assert not hasattr(progress, "__dict__")
+    assert not hasattr(taskbar._NullBackend(), "__dict__")
+    assert not hasattr(_recording_win32_backend()[0], "__dict__")
+
+
 def test_guid_parses_the_taskbar_class_identifier():
     guid = taskbar._GUID.from_string(taskbar._CLSID_TASKBAR_LIST)
 
@@ -203,6 +283,13 @@ def test_guid_parses_the_taskbar_class_identifier():
     assert list(guid.Data4) == [0x95, 0x8A, 0x00, 0x60, 0x97, 0xC9, 0xA0, 0x90]
 
 
+def test_interface_guids_are_parsed_once_at_import():
+    assert bytes(taskbar._CLSID_TASKBAR_LIST_GUID) == bytes(
+        taskbar._GUID.from_string(taskbar._CLSID_TASKBAR_LIST)
+    )
+    assert taskbar._IID_ITASKBAR_LIST3_GUID.Data1 == 0xEA1AFB91
+
+
 @pytest.mark.skipif(sys.platform == "win32", reason="ctypes.windll exists on Windows")
 def test_module_imports_without_windows_com_symbols():
     assert not hasattr(taskbar.ctypes, "windll")
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import json
 import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -16,6 +19,22 @@ from talks_reducer.models import ProcessingOptions
 from talks_reducer.progress import NullProgressReporter
 
 
+@pytest.fixture
+def _extract_audio_to_wav(monkeypatch):
+    """Force the ``audio.wav`` extraction path for tests that stub ``wavfile``."""
+
+    monkeypatch.setattr(pipeline, "_PIPE_AUDIO_MAX_BYTES", 0)
+
+
+@pytest.fixture(params=["wav", "pipe"])
+def audio_extraction_path(request, monkeypatch):
+    """Run a test on both the ``audio.wav`` and the piped PCM extraction path."""
+
+    if request.param == "wav":
+        monkeypatch.setattr(pipeline, "_PIPE_AUDIO_MAX_BYTES", 0)
+    return request.param
+
+
 @pytest.mark.parametrize(
     "filename, small, small_target_height, add_codec_suffix, video_codec, silent_speed, sounded_speed, expected",
     [
@@ -29,6 +48,26 @@ from talks_reducer.progress import NullProgressReporter
             None,
             Path("video_speedup.mp4"),
         ),
+        (
+            Path("talk.2024.final.mkv"),
+            False,
+            None,
+            False,
+            "hevc",
+            None,
+            None,
+            Path("talk.2024.final_speedup.mp4"),
+        ),
+        (
+            Path("recording"),
+            False,
+            None,
+            False,
+            "hevc",
+            None,
+            None,
+            Path("recording_speedup.mp4"),
+        ),
         (
             Path("video.mp4"),
             True,
@@ -314,45 +353,47 @@ def test_input_to_output_filename_clean_name_ignores_video_codecs(
     assert output == tmp_path / "video_speedup.mp4"
 
 
-def test_extract_video_metadata_uses_ffprobe(monkeypatch) -> None:
-    """Metadata should be parsed from ffprobe output for the demo asset."""
+_DEMO_FFPROBE_STDOUT = json.dumps(
+    {
+        "programs": [],
+        "streams": [
+            {
+                "avg_frame_rate": "25/1",
+                "nb_frames": "125",
+                "width": 1920,
+                "height": 1080,
+            }
+        ],
+        "format": {"duration": "5.000000"},
+    }
+)
 
-    demo_path = Path("docs/assets/demo.mp4").resolve()
 
-    monkeypatch.setattr(ffmpeg_module, "_FFPROBE_PATH", None, raising=False)
+def _fake_ffprobe_run(monkeypatch, captured_commands: list[list[str]]) -> None:
+    """Route ffprobe through a stub that reports the demo asset as JSON."""
+
+    monkeypatch.setattr(pipeline, "_VIDEO_METADATA_CACHE", {})
     monkeypatch.setattr(ffmpeg_module, "get_ffprobe_path", lambda: "ffprobe")
 
-    captured_commands: list[list[str]] = []
+    def fake_run(command, *args, **kwargs):
+        captured_commands.append(list(command))
+        return SimpleNamespace(returncode=0, stderr="", stdout=_DEMO_FFPROBE_STDOUT)
 
-    class DummyProcess:
-        def communicate(self) -> tuple[str, str]:
-            return (
-                "\n".join(
-                    [
-                        "[STREAM]",
-                        "avg_frame_rate=25/1",
-                        "nb_frames=125",
-                        "width=1920",
-                        "height=1080",
-                        "[/STREAM]",
-                        "[FORMAT]",
-                        "duration=5.0",
-                        "[/FORMAT]",
-                    ]
-                ),
-                "",
-            )
+    monkeypatch.setattr(pipeline.subprocess, "run", fake_run)
 
-    def fake_popen(command, *args, **kwargs):
-        captured_commands.append(list(command))
-        assert os.fspath(demo_path) in command
-        return DummyProcess()
 
-    monkeypatch.setattr(pipeline.subprocess, "Popen", fake_popen)
+def test_extract_video_metadata_uses_ffprobe(monkeypatch) -> None:
+    """Metadata should be parsed from ffprobe output for the demo asset."""
+
+    demo_path = Path("docs/assets/demo.mp4").resolve()
+    captured_commands: list[list[str]] = []
+    _fake_ffprobe_run(monkeypatch, captured_commands)
 
     metadata = pipeline._extract_video_metadata(demo_path, frame_rate=30.0)
 
     assert captured_commands, "ffprobe should be invoked"
+    assert os.fspath(demo_path) in captured_commands[0]
+    assert captured_commands[0][-2:] == ["-of", "json"]
     assert metadata["frame_rate"] == pytest.approx(25.0)
     assert metadata["duration"] == pytest.approx(5.0)
     assert metadata["frame_count"] == 125
@@ -360,6 +401,163 @@ def test_extract_video_metadata_uses_ffprobe(monkeypatch) -> None:
     assert metadata["height"] == pytest.approx(1080.0)
 
 
+def test_extract_video_metadata_caches_unchanged_files(monkeypatch, tmp_path) -> None:
+    """A second probe of an unchanged file must not spawn ffprobe again."""
+
+    video = tmp_path / "video.mp4"
+    video.write_bytes(b"fake")
+    captured_commands: list[list[str]] = []
+    _fake_ffprobe_run(monkeypatch, captured_commands)
+
+    first = pipeline._extract_video_metadata(video, frame_rate=30.0)
+    second = pipeline._extract_video_metadata(video, frame_rate=30.0)
+    assert len(captured_commands) == 1
+    assert first == second
+
+    video.write_bytes(b"rewritten")
+    pipeline._extract_video_metadata(video, frame_rate=30.0)
+    assert len(captured_commands) == 2
+
+
+def test_extract_video_metadata_cache_evicts_least_recently_used(
+    monkeypatch, tmp_path
+) -> None:
+    """The probe cache stays bounded and drops the least recently used file."""
+
+    captured_commands: list[list[str]] = []
+    _fake_ffprobe_run(monkeypatch, captured_commands)
+    monkeypatch.setattr(pipeline, "_VIDEO_METADATA_CACHE_SIZE", 2)
+
+    first, second, third = (tmp_path / f"{name}.mp4" for name in "abc")
+    for video in (first, second, third):
+        video.write_bytes(b"fake")
+
+    pipeline._extract_video_metadata(first, frame_rate=30.0)
+    pipeline._extract_video_metadata(second, frame_rate=30.0)
+    pipeline._extract_video_metadata(first, frame_rate=30.0)  # refresh ``first``
+    pipeline._extract_video_metadata(third, frame_rate=30.0)  # evicts ``second``
+    assert len(captured_commands) == 3
+    assert len(pipeline._VIDEO_METADATA_CACHE) == 2
+
+    pipeline._extract_video_metadata(first, frame_rate=30.0)
+    assert len(captured_commands) == 3
+    pipeline._extract_video_metadata(second, frame_rate=30.0)
+    assert len(captured_commands) == 4
+
+
+def test_extract_video_metadata_cache_is_thread_safe(monkeypatch, tmp_path) -> None:
+    """Concurrent probes keep the shared cache bounded and consistent."""
+
+    captured_commands: list[list[str]] = []
+    _fake_ffprobe_run(monkeypatch, captured_commands)
+    monkeypatch.setattr(pipeline, "_VIDEO_METADATA_CACHE_SIZE", 2)
+
+    videos = [tmp_path / f"clip{index}.mp4" for index in range(6)]
+    for video in videos:
+        video.write_bytes(b"fake")
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        results = list(
+            executor.map(
+                lambda video: pipeline._extract_video_metadata(video, 30.0),
+                videos * 20,
+            )
+        )
+
+    assert all(result == results[0] for result in results)
+    assert len(pipeline._VIDEO_METADATA_CACHE) <= 2
+
+
+def test_extract_video_metadata_falls_back_without_video_stream(
+    monkeypatch, tmp_path
+) -> None:
+    """Audio-only files report no stream, so the caller's frame rate is kept."""
+
+    audio = tmp_path / "audio.mp3"
+    audio.write_bytes(b"fake")
+    monkeypatch.setattr(pipeline, "_VIDEO_METADATA_CACHE", {})
+    monkeypatch.setattr(ffmpeg_module, "get_ffprobe_path", lambda: "ffprobe")
+
+    stdout = json.dumps({"streams": [], "format": {"duration": "12.5"}})
+    monkeypatch.setattr(
+        pipeline.subprocess,
+        "run",
+        lambda *args, **kwargs: SimpleNamespace(returncode=0, stdout=stdout, stderr=""),
+    )
+
+    metadata = pipeline._extract_video_metadata(audio, frame_rate=30.0)
+
+    assert metadata["frame_rate"] == pytest.approx(30.0)
+    assert metadata["duration"] == pytest.approx(12.5)
+    assert metadata["frame_count"] == 0
+    assert metadata["width"] == 0.0
+
+
+def test_extract_video_metadata_reports_ffprobe_errors(
+    monkeypatch, tmp_path, capsys
+) -> None:
+    """A failing ffprobe is echoed to stderr and not cached."""
+
+    broken = tmp_path / "broken.mp4"
+    broken.write_bytes(b"fake")
+    monkeypatch.setattr(pipeline, "_VIDEO_METADATA_CACHE", {})
+    monkeypatch.setattr(ffmpeg_module, "get_ffprobe_path", lambda: "ffprobe")
+    monkeypatch.setattr(
+        pipeline.subprocess,
+        "run",
+        lambda *args, **kwargs: SimpleNamespace(
+            returncode=1, stdout="", stderr="moov atom not found\n"
+        ),
+    )
+
+    metadata = pipeline._extract_video_metadata(broken, frame_rate=30.0)
+
+    assert metadata["duration"] == 0.0
+    assert metadata["frame_rate"] == pytest.approx(30.0)
+    assert "moov atom not found" in capsys.readouterr().err
+    assert pipeline._VIDEO_METADATA_CACHE == {}
+
+
+def test_delete_path_returns_without_polling_on_posix(monkeypatch, tmp_path) -> None:
+    """POSIX ``rmtree`` is synchronous, so no existence polling is needed."""
+
+    import time
+
+    target = tmp_path / "job"
+    (target / "nested").mkdir(parents=True)
+    monkeypatch.setattr(pipeline.os, "name", "posix")
+    monkeypatch.setattr(
+        time, "sleep", lambda _s: pytest.fail("sleep must not run on POSIX")
+    )
+
+    pipeline._delete_path(target)
+
+    assert not target.exists()
+
+
+def test_delete_path_waits_for_windows_handles(monkeypatch, tmp_path) -> None:
+    """On Windows the folder may linger briefly, so existence is re-checked."""
+
+    import shutil
+    import time
+
+    target = tmp_path / "job"
+    target.mkdir()
+    sleeps: list[float] = []
+
+    def lingering_rmtree(path, ignore_errors=False):
+        # Simulate a handle that keeps the folder visible for one more check.
+        monkeypatch.setattr(time, "sleep", lambda s: (sleeps.append(s), path.rmdir()))
+
+    monkeypatch.setattr(pipeline.os, "name", "nt")
+    monkeypatch.setattr(shutil, "rmtree", lingering_rmtree)
+
+    pipeline._delete_path(target)
+
+    assert sleeps == [0.0]
+    assert not target.exists()
+
+
 def test_stop_requested_handles_callable_and_bool() -> None:
     """The stop helper should respect both callable and boolean flags."""
 
@@ -420,17 +618,6 @@ def test_ensure_two_dimensional_expands_mono_audio() -> None:
     np.testing.assert_allclose(result[:, 0], mono_audio)
 
 
-def test_prepare_output_audio_squeezes_single_channel() -> None:
-    """Two-dimensional mono audio should be flattened for writing."""
-
-    mono_audio = np.array([[0.5], [-0.5], [1.0]], dtype=np.float32)
-
-    result = pipeline._prepare_output_audio(mono_audio)
-
-    assert result.ndim == 1
-    np.testing.assert_allclose(result, mono_audio[:, 0])
-
-
 def test_resolve_trim_no_trim_returns_original() -> None:
     """With both bounds at zero the source duration/frame count pass through."""
 
@@ -730,7 +917,9 @@ def test_speed_up_video_mp3_uses_audio_only_command(tmp_path, monkeypatch) -> No
     assert result.used_gpu is False
 
 
-def test_speed_up_video_mp3_uses_processed_wav(tmp_path, monkeypatch) -> None:
+def test_speed_up_video_mp3_uses_processed_wav(
+    tmp_path, monkeypatch, audio_extraction_path
+) -> None:
     """Non-neutral speeds feed the processed ``audioNew.wav`` to the builder."""
 
     input_file = tmp_path / "input.mp4"
@@ -754,7 +943,7 @@ def test_speed_up_video_mp3_uses_processed_wav(tmp_path, monkeypatch) -> None:
     monkeypatch.setattr(
         pipeline.wavfile,
         "read",
-        lambda path: (48000, np.zeros((48000, 2), dtype=np.int16)),
+        lambda path, mmap=False: (48000, np.zeros((48000, 2), dtype=np.int16)),
     )
     monkeypatch.setattr(
         pipeline.wavfile,
@@ -776,7 +965,9 @@ def test_speed_up_video_mp3_uses_processed_wav(tmp_path, monkeypatch) -> None:
         lambda *args, **kwargs: (np.zeros((10, 2)), [[0, 30, 1, 30]]),
     )
     monkeypatch.setattr(
-        pipeline.chunk_utils, "get_tree_expression", lambda chunks: "0/TB/FR"
+        pipeline.chunk_utils,
+        "get_tree_expression",
+        lambda chunks, separator=",": "0/TB/FR",
     )
 
     audio_args = {}
@@ -796,6 +987,7 @@ def test_speed_up_video_mp3_uses_processed_wav(tmp_path, monkeypatch) -> None:
         get_ffmpeg_path=lambda prefer_global=False: "ffmpeg",
         check_cuda_available=lambda ffmpeg_path: False,
         build_extract_audio_command=lambda *args, **kwargs: "extract-command",
+        build_extract_audio_pipe_command=lambda *args, **kwargs: "extract-command",
         build_video_commands=fail_build_video_commands,
         build_audio_only_command=fake_build_audio_only,
         run_timed_ffmpeg_command=lambda command, **kwargs: commands_run.append(command),
@@ -822,6 +1014,91 @@ def test_speed_up_video_mp3_uses_processed_wav(tmp_path, monkeypatch) -> None:
     assert result.output_file == output_file
 
 
+@pytest.mark.usefixtures("_extract_audio_to_wav")
+def test_speed_up_video_releases_audio_before_abort_cleanup(
+    tmp_path, monkeypatch
+) -> None:
+    """A stop during audio processing drops the samples before deleting temp.
+
+    Windows cannot delete a memory-mapped ``audio.wav``, so the temp folder must
+    only be removed once the source array is gone.
+    """
+
+    input_file = tmp_path / "input.mp4"
+    input_file.write_bytes(b"fake")
+    metadata = {
+        "frame_rate": 30.0,
+        "duration": 10.0,
+        "frame_count": 300,
+        "width": 1920.0,
+        "height": 1080.0,
+    }
+    monkeypatch.setattr(
+        pipeline, "_extract_video_metadata", lambda path, frame_rate: dict(metadata)
+    )
+    monkeypatch.setattr(audio_module, "has_audio_stream", lambda path: True)
+
+    source_refs: list[weakref.ref] = []
+
+    def fake_read(path, mmap=False):
+        samples = np.zeros((48000, 2), dtype=np.int16)
+        source_refs.append(weakref.ref(samples))
+        return 48000, samples
+
+    monkeypatch.setattr(pipeline.wavfile, "read", fake_read)
+    monkeypatch.setattr(audio_module, "get_max_volume", lambda data: 1.0)
+    monkeypatch.setattr(
+        pipeline.chunk_utils, "detect_loud_frames", lambda *args, **kwargs: [True]
+    )
+    monkeypatch.setattr(
+        pipeline.chunk_utils,
+        "build_chunks",
+        lambda *args, **kwargs: ([[0, 1, 1]], None),
+    )
+
+    class StopDuringAudio(NullProgressReporter):
+        stopping = False
+
+        def stop_requested(self) -> bool:
+            return self.stopping
+
+    reporter = StopDuringAudio()
+
+    def fake_process(*args, check_stop=None, **kwargs):
+        reporter.stopping = True
+        check_stop()
+        raise AssertionError("check_stop should have aborted")  # pragma: no cover
+
+    monkeypatch.setattr(audio_module, "process_audio_chunks", fake_process)
+
+    deleted: list[tuple[Path, bool]] = []
+
+    def record_delete(path: Path) -> None:
+        deleted.append((path, source_refs[0]() is None))
+
+    dependencies = pipeline.PipelineDependencies(
+        get_ffmpeg_path=lambda prefer_global=False: "ffmpeg",
+        check_cuda_available=lambda ffmpeg_path: False,
+        build_extract_audio_command=lambda *args, **kwargs: "extract-command",
+        build_video_commands=lambda *args, **kwargs: ("render", None, False),
+        run_timed_ffmpeg_command=lambda command, **kwargs: None,
+        delete_path=record_delete,
+    )
+    options = ProcessingOptions(
+        input_file=input_file,
+        output_file=tmp_path / "output.mp4",
+        temp_folder=tmp_path / "temp",
+        silent_speed=5.0,
+        sounded_speed=1.5,
+    )
+
+    with pytest.raises(pipeline.ProcessingAborted):
+        pipeline.speed_up_video(options, reporter=reporter, dependencies=dependencies)
+
+    assert deleted, "the temp folder should be removed on abort"
+    assert all(released for _path, released in deleted)
+
+
 def test_speed_up_video_mp3_without_audio_raises(tmp_path, monkeypatch) -> None:
     """Requesting mp3 output on a file without audio raises a clear error."""
 
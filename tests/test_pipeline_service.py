@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import subprocess
+import threading
 from contextlib import AbstractContextManager
 from pathlib import Path
 from typing import List, Optional
@@ -10,6 +11,7 @@ from typing import List, Optional
 import numpy as np
 import pytest
 
+from talks_reducer import pipeline
 from talks_reducer.models import ProcessingOptions
 from talks_reducer.pipeline import (
     PipelineDependencies,
@@ -20,6 +22,22 @@ from talks_reducer.pipeline import (
 from talks_reducer.progress import NullProgressReporter
 
 
+@pytest.fixture
+def _extract_audio_to_wav(monkeypatch):
+    """Force the ``audio.wav`` extraction path for tests that stub ``wavfile``."""
+
+    monkeypatch.setattr(pipeline, "_PIPE_AUDIO_MAX_BYTES", 0)
+
+
+@pytest.fixture(params=["wav", "pipe"])
+def audio_extraction_path(request, monkeypatch):
+    """Run a test on both the ``audio.wav`` and the piped PCM extraction path."""
+
+    if request.param == "wav":
+        monkeypatch.setattr(pipeline, "_PIPE_AUDIO_MAX_BYTES", 0)
+    return request.param
+
+
 class DummyReporter(NullProgressReporter):
     """Collects log messages for assertions without printing them."""
 
@@ -96,7 +114,7 @@ def test_speed_up_video_returns_result(monkeypatch, tmp_path):
         lambda _path: True,
     )
 
-    def fake_read(_path):
+    def fake_read(_path, mmap=False):
         audio = np.zeros((30, 1), dtype=np.int16)
         return 48000, audio
 
@@ -125,7 +143,8 @@ def test_speed_up_video_returns_result(monkeypatch, tmp_path):
         lambda *_args, **_kwargs: ([[0, 10, 0]], np.array([True] * 10)),
     )
     monkeypatch.setattr(
-        "talks_reducer.pipeline.chunk_utils.get_tree_expression", lambda _chunks: "X"
+        "talks_reducer.pipeline.chunk_utils.get_tree_expression",
+        lambda _chunks, separator=",": "X",
     )
 
     def fake_run(command, *args, **kwargs):
@@ -159,7 +178,95 @@ def test_speed_up_video_returns_result(monkeypatch, tmp_path):
     assert ffmpeg_calls == [options.prefer_global_ffmpeg]
 
 
-def test_speed_up_video_reports_audio_processing_progress(monkeypatch, tmp_path):
+def test_speed_up_video_pipes_short_audio_into_memory(monkeypatch, tmp_path):
+    """Short inputs decode PCM from FFmpeg's stdout instead of ``audio.wav``."""
+
+    monkeypatch.setattr(pipeline, "_PIPE_AUDIO_MAX_BYTES", 256 * 1024 * 1024)
+
+    input_path = tmp_path / "input.mp4"
+    input_path.write_bytes(b"fake")
+    options = ProcessingOptions(
+        input_file=input_path,
+        temp_folder=tmp_path / "temp",
+        output_file=tmp_path / "output.mp4",
+    )
+
+    monkeypatch.setattr(
+        "talks_reducer.pipeline._extract_video_metadata",
+        lambda _input, _frame_rate: {
+            "frame_rate": 30.0,
+            "duration": 2.0,
+            "width": 1920.0,
+            "height": 1080.0,
+        },
+    )
+    monkeypatch.setattr(
+        "talks_reducer.pipeline.audio_utils.has_audio_stream", lambda _path: True
+    )
+
+    def fail_read(*_args, **_kwargs):  # pragma: no cover - must not run
+        raise AssertionError("piped audio must not be read from audio.wav")
+
+    monkeypatch.setattr("talks_reducer.pipeline.wavfile.read", fail_read)
+    monkeypatch.setattr(
+        "talks_reducer.pipeline.wavfile.write",
+        lambda path, sample_rate, data: Path(path).write_bytes(b"audio"),
+    )
+
+    seen_audio: List[np.ndarray] = []
+
+    def fake_detect(audio_data, *args, **kwargs):
+        seen_audio.append(audio_data)
+        return np.array([True] * 10)
+
+    monkeypatch.setattr(
+        "talks_reducer.pipeline.chunk_utils.detect_loud_frames", fake_detect
+    )
+    monkeypatch.setattr(
+        "talks_reducer.pipeline.audio_utils.process_audio_chunks",
+        lambda *args, **kwargs: (np.zeros((10, 2)), [[0, 10, 0, 10]]),
+    )
+    monkeypatch.setattr(
+        "talks_reducer.pipeline.chunk_utils.build_chunks",
+        lambda *_args, **_kwargs: ([[0, 10, 0]], np.array([True] * 10)),
+    )
+    monkeypatch.setattr(
+        "talks_reducer.pipeline.chunk_utils.get_tree_expression",
+        lambda _chunks, separator=",": "X",
+    )
+
+    pcm = np.array([[1, -1], [300, -300], [2000, 5]], dtype="<i2")
+    run_calls: List[tuple] = []
+
+    def fake_run(command, *args, **kwargs):
+        run_calls.append((command, kwargs.get("capture_stdout")))
+        if command == "pipe":
+            # A trailing partial frame must be dropped, not break the reshape.
+            return pcm.tobytes() + b"\x01"
+        if command == "render":
+            options.output_file.write_bytes(b"fake")
+        return None
+
+    dependencies = PipelineDependencies(
+        get_ffmpeg_path=lambda prefer_global=False: "ffmpeg",
+        check_cuda_available=lambda _path: False,
+        check_videotoolbox_available=lambda _path: False,
+        build_extract_audio_command=lambda *args, **kwargs: "extract",
+        build_extract_audio_pipe_command=lambda *args, **kwargs: "pipe",
+        build_video_commands=lambda *args, **kwargs: ("render", None, False),
+        run_timed_ffmpeg_command=fake_run,
+    )
+
+    speed_up_video(options, reporter=DummyReporter(), dependencies=dependencies)
+
+    assert run_calls[0] == ("pipe", True)
+    assert ("render", None) in run_calls
+    np.testing.assert_array_equal(seen_audio[0], pcm)
+
+
+def test_speed_up_video_reports_audio_processing_progress(
+    monkeypatch, tmp_path, audio_extraction_path
+):
     """The pipeline should open an ``Audio processing:`` task and advance it."""
 
     input_path = tmp_path / "input.mp4"
@@ -187,7 +294,7 @@ def test_speed_up_video_reports_audio_processing_progress(monkeypatch, tmp_path)
         lambda _path: True,
     )
 
-    def fake_read(_path):
+    def fake_read(_path, mmap=False):
         return 48000, np.zeros((30, 1), dtype=np.int16)
 
     monkeypatch.setattr("talks_reducer.pipeline.wavfile.read", fake_read)
@@ -217,12 +324,16 @@ def test_speed_up_video_reports_audio_processing_progress(monkeypatch, tmp_path)
         lambda *_args, **_kwargs: ([[0, 10, 0]], np.array([True] * 10)),
     )
     monkeypatch.setattr(
-        "talks_reducer.pipeline.chunk_utils.get_tree_expression", lambda _chunks: "X"
+        "talks_reducer.pipeline.chunk_utils.get_tree_expression",
+        lambda _chunks, separator=",": "X",
     )
 
-    def fake_run(command, *args, **kwargs):
+    def fake_run(command, *args, capture_stdout=False, **kwargs):
         if command == "render":
             options.output_file.write_bytes(b"fake")
+        if capture_stdout:
+            # Same 30 samples the ``audio.wav`` stub reports, as stereo s16le.
+            return np.zeros((30, 2), dtype="<i2").tobytes()
         return None
 
     dependencies = PipelineDependencies(
@@ -230,6 +341,7 @@ def test_speed_up_video_reports_audio_processing_progress(monkeypatch, tmp_path)
         check_cuda_available=lambda _path: False,
         check_videotoolbox_available=lambda _path: False,
         build_extract_audio_command=lambda *args, **kwargs: "extract",
+        build_extract_audio_pipe_command=lambda *args, **kwargs: "extract",
         build_video_commands=lambda *args, **kwargs: ("render", None, False),
         run_timed_ffmpeg_command=fake_run,
     )
@@ -243,7 +355,7 @@ def test_speed_up_video_reports_audio_processing_progress(monkeypatch, tmp_path)
     ]
 
 
-def test_speed_up_video_falls_back_to_cpu(monkeypatch, tmp_path):
+def test_speed_up_video_falls_back_to_cpu(monkeypatch, tmp_path, audio_extraction_path):
     input_path = tmp_path / "input.mp4"
     input_path.write_bytes(b"input")
 
@@ -279,7 +391,7 @@ def test_speed_up_video_falls_back_to_cpu(monkeypatch, tmp_path):
         lambda _path: True,
     )
 
-    def fake_read(_path):
+    def fake_read(_path, mmap=False):
         audio = np.zeros((48, 1), dtype=np.int16)
         return 48000, audio
 
@@ -308,7 +420,8 @@ def test_speed_up_video_falls_back_to_cpu(monkeypatch, tmp_path):
         lambda *_args, **_kwargs: ([[0, 10, 0]], np.array([True] * 10)),
     )
     monkeypatch.setattr(
-        "talks_reducer.pipeline.chunk_utils.get_tree_expression", lambda _chunks: "X"
+        "talks_reducer.pipeline.chunk_utils.get_tree_expression",
+        lambda _chunks, separator=",": "X",
     )
 
     commands: List[str] = []
@@ -334,6 +447,7 @@ def test_speed_up_video_falls_back_to_cpu(monkeypatch, tmp_path):
         check_cuda_available=lambda _path: True,
         check_videotoolbox_available=lambda _path: False,
         build_extract_audio_command=lambda *args, **kwargs: "extract",
+        build_extract_audio_pipe_command=lambda *args, **kwargs: "extract",
         build_video_commands=lambda *args, **kwargs: ("render", "render-cpu", True),
         run_timed_ffmpeg_command=fake_run,
     )
@@ -346,7 +460,9 @@ def test_speed_up_video_falls_back_to_cpu(monkeypatch, tmp_path):
     assert ffmpeg_calls == [options.prefer_global_ffmpeg]
 
 
-def test_speed_up_video_falls_back_without_cuda(monkeypatch, tmp_path):
+def test_speed_up_video_falls_back_without_cuda(
+    monkeypatch, tmp_path, audio_extraction_path
+):
     input_path = tmp_path / "input.mp4"
     input_path.write_bytes(b"input")
 
@@ -373,7 +489,7 @@ def test_speed_up_video_falls_back_without_cuda(monkeypatch, tmp_path):
     )
     monkeypatch.setattr(
         "talks_reducer.pipeline.wavfile.read",
-        lambda _path: (48000, np.zeros((60, 1), dtype=np.int16)),
+        lambda _path, mmap=False: (48000, np.zeros((60, 1), dtype=np.int16)),
     )
     monkeypatch.setattr(
         "talks_reducer.pipeline.wavfile.write",
@@ -396,7 +512,7 @@ def test_speed_up_video_falls_back_without_cuda(monkeypatch, tmp_path):
     )
     monkeypatch.setattr(
         "talks_reducer.pipeline.chunk_utils.get_tree_expression",
-        lambda _chunks: "X",
+        lambda _chunks, separator=",": "X",
     )
 
     commands: List[str] = []
@@ -416,6 +532,7 @@ def test_speed_up_video_falls_back_without_cuda(monkeypatch, tmp_path):
         check_cuda_available=lambda _path: False,
         check_videotoolbox_available=lambda _path: False,
         build_extract_audio_command=lambda *args, **kwargs: "extract",
+        build_extract_audio_pipe_command=lambda *args, **kwargs: "extract",
         build_video_commands=lambda *args, **kwargs: (
             "render-fast",
             "render-cpu",
@@ -436,6 +553,7 @@ class ImmediateStopReporter(DummyReporter):
         return True
 
 
+@pytest.mark.usefixtures("_extract_audio_to_wav")
 def test_speed_up_video_cleans_temp_on_abort(monkeypatch, tmp_path):
     input_path = tmp_path / "input.mp4"
     input_path.write_bytes(b"input")
@@ -483,6 +601,7 @@ def test_speed_up_video_cleans_temp_on_abort(monkeypatch, tmp_path):
     assert ffmpeg_calls == [options.prefer_global_ffmpeg]
 
 
+@pytest.mark.usefixtures("_extract_audio_to_wav")
 def test_speed_up_video_computes_ratios(monkeypatch, tmp_path):
     input_path = tmp_path / "input.mp4"
     input_path.write_bytes(b"i" * 1000)
@@ -516,7 +635,7 @@ def test_speed_up_video_computes_ratios(monkeypatch, tmp_path):
 
     monkeypatch.setattr("talks_reducer.pipeline._extract_video_metadata", fake_metadata)
 
-    def fake_read(_path):
+    def fake_read(_path, mmap=False):
         audio = np.zeros((50, 1), dtype=np.int16)
         return 48000, audio
 
@@ -545,7 +664,8 @@ def test_speed_up_video_computes_ratios(monkeypatch, tmp_path):
         lambda *_args, **_kwargs: ([[0, 10, 0]], np.array([True] * 10)),
     )
     monkeypatch.setattr(
-        "talks_reducer.pipeline.chunk_utils.get_tree_expression", lambda _chunks: "X"
+        "talks_reducer.pipeline.chunk_utils.get_tree_expression",
+        lambda _chunks, separator=",": "X",
     )
 
     def fake_run(command, *args, **kwargs):
@@ -568,6 +688,190 @@ def test_speed_up_video_computes_ratios(monkeypatch, tmp_path):
     assert result.size_ratio == pytest.approx(0.4)
 
 
+def _stub_single_chunk_audio(monkeypatch, probed: List[Path]):
+    """Stub metadata and audio stages so only the final encode remains."""
+
+    def fake_metadata(path, _frame_rate):
+        probed.append(Path(path))
+        return {
+            "frame_rate": 25.0,
+            "duration": 5.0,
+            "frame_count": 125,
+            "width": 1920.0,
+            "height": 1080.0,
+        }
+
+    monkeypatch.setattr("talks_reducer.pipeline._extract_video_metadata", fake_metadata)
+    monkeypatch.setattr(
+        "talks_reducer.pipeline.audio_utils.has_audio_stream", lambda _path: True
+    )
+    monkeypatch.setattr(
+        "talks_reducer.pipeline.wavfile.read",
+        lambda _path, mmap=False: (48000, np.zeros((50, 2), dtype=np.int16)),
+    )
+    monkeypatch.setattr(
+        "talks_reducer.pipeline.wavfile.write",
+        lambda path, _rate, _data: Path(path).write_bytes(b"audio"),
+    )
+    monkeypatch.setattr(
+        "talks_reducer.pipeline.audio_utils.get_max_volume", lambda _data: 1.0
+    )
+    monkeypatch.setattr(
+        "talks_reducer.pipeline.audio_utils.process_audio_chunks",
+        lambda *args, **kwargs: (np.zeros((10, 2)), [[0, 10, 0, 50]]),
+    )
+    monkeypatch.setattr(
+        "talks_reducer.pipeline.chunk_utils.detect_loud_frames",
+        lambda *args, **kwargs: np.array([True] * 10),
+    )
+    monkeypatch.setattr(
+        "talks_reducer.pipeline.chunk_utils.build_chunks",
+        lambda *_args, **_kwargs: ([[0, 10, 0]], np.array([True] * 10)),
+    )
+    monkeypatch.setattr(
+        "talks_reducer.pipeline.chunk_utils.get_tree_expression",
+        lambda _chunks, separator=",": "X",
+    )
+
+
+def test_speed_up_video_uses_encoder_reported_duration(monkeypatch, tmp_path):
+    """The final encode's reported duration replaces the output ffprobe run."""
+
+    input_path = tmp_path / "input.mp4"
+    input_path.write_bytes(b"i" * 1000)
+
+    options = ProcessingOptions(
+        input_file=input_path,
+        temp_folder=tmp_path / "temp",
+        output_file=tmp_path / "output.mp4",
+    )
+
+    probed: List[Path] = []
+    _stub_single_chunk_audio(monkeypatch, probed)
+
+    def fake_run(command, *args, duration_callback=None, **kwargs):
+        if command == "render":
+            options.output_file.write_bytes(b"o" * 400)
+            duration_callback(2.0)
+        return None
+
+    dependencies = PipelineDependencies(
+        get_ffmpeg_path=lambda prefer=False: "ffmpeg",
+        check_cuda_available=lambda _path: False,
+        check_videotoolbox_available=lambda _path: False,
+        build_extract_audio_command=lambda *args, **kwargs: "extract",
+        build_video_commands=lambda *args, **kwargs: ("render", None, False),
+        run_timed_ffmpeg_command=fake_run,
+    )
+
+    result = speed_up_video(
+        options, reporter=DummyReporter(), dependencies=dependencies
+    )
+
+    assert result.output_duration == pytest.approx(2.0)
+    assert result.time_ratio == pytest.approx(0.4)
+    assert probed == [input_path]
+
+
+def test_speed_up_video_cleans_temp_in_background_after_encode(monkeypatch, tmp_path):
+    """Temp cleanup overlaps the output probe and finishes before returning."""
+
+    input_path = tmp_path / "input.mp4"
+    input_path.write_bytes(b"i" * 1000)
+
+    options = ProcessingOptions(
+        input_file=input_path,
+        temp_folder=tmp_path / "temp",
+        output_file=tmp_path / "output.mp4",
+    )
+
+    probed: List[Path] = []
+    _stub_single_chunk_audio(monkeypatch, probed)
+
+    cleanup_started = threading.Event()
+    cleanup_threads: List[threading.Thread] = []
+
+    def recording_delete(path: Path) -> None:
+        cleanup_threads.append(threading.current_thread())
+        cleanup_started.set()
+        pipeline._delete_path(path)
+
+    def fake_run(command, *args, **kwargs):
+        if command == "render":
+            options.output_file.write_bytes(b"o" * 400)
+        return None
+
+    dependencies = PipelineDependencies(
+        get_ffmpeg_path=lambda prefer=False: "ffmpeg",
+        check_cuda_available=lambda _path: False,
+        check_videotoolbox_available=lambda _path: False,
+        build_extract_audio_command=lambda *args, **kwargs: "extract",
+        build_video_commands=lambda *args, **kwargs: ("render", None, False),
+        run_timed_ffmpeg_command=fake_run,
+        delete_path=recording_delete,
+    )
+
+    speed_up_video(options, reporter=DummyReporter(), dependencies=dependencies)
+
+    assert cleanup_started.is_set()
+    assert cleanup_threads[-1] is not threading.main_thread()
+    assert not cleanup_threads[-1].is_alive()
+    assert probed == [input_path, options.output_file]
+    assert list(options.temp_folder.iterdir()) == []
+
+
+def test_speed_up_video_pipes_processed_audio_into_encode(monkeypatch, tmp_path):
+    """Video renders stream processed audio to the encoder instead of a WAV."""
+
+    input_path = tmp_path / "input.mp4"
+    input_path.write_bytes(b"i" * 1000)
+
+    options = ProcessingOptions(
+        input_file=input_path,
+        temp_folder=tmp_path / "temp",
+        output_file=tmp_path / "output.mp4",
+    )
+
+    _stub_single_chunk_audio(monkeypatch, [])
+    processed = np.arange(20, dtype=np.float64).reshape(10, 2) / 10
+    monkeypatch.setattr(
+        "talks_reducer.pipeline.audio_utils.process_audio_chunks",
+        lambda *args, **kwargs: (processed, [[0, 10, 0, 50]]),
+    )
+    monkeypatch.setattr(
+        "talks_reducer.pipeline.wavfile.write",
+        lambda *args: pytest.fail("video renders must not write audioNew.wav"),
+    )
+
+    build_calls: List[tuple] = []
+
+    def fake_build(input_file, audio_file, filter_script, output_file, **kwargs):
+        build_calls.append((audio_file, kwargs.get("audio_stdin_format")))
+        return "render", None, False
+
+    piped: List[bytes] = []
+
+    def fake_run(command, *args, stdin_chunks=None, **kwargs):
+        if command == "render":
+            piped.append(b"".join(bytes(chunk) for chunk in stdin_chunks))
+            options.output_file.write_bytes(b"o" * 400)
+        return None
+
+    dependencies = PipelineDependencies(
+        get_ffmpeg_path=lambda prefer=False: "ffmpeg",
+        check_cuda_available=lambda _path: False,
+        check_videotoolbox_available=lambda _path: False,
+        build_extract_audio_command=lambda *args, **kwargs: "extract",
+        build_video_commands=fake_build,
+        run_timed_ffmpeg_command=fake_run,
+    )
+
+    speed_up_video(options, reporter=DummyReporter(), dependencies=dependencies)
+
+    assert build_calls == [(None, f"-f f32le -ar {options.sample_rate} -ac 2")]
+    assert piped == [processed.astype("<f4").tobytes()]
+
+
 def test_small_mode_preserves_lower_resolution(monkeypatch, tmp_path):
     """When original video height is less than target, it should not be scaled up."""
 
@@ -608,7 +912,7 @@ def test_small_mode_preserves_lower_resolution(monkeypatch, tmp_path):
         lambda _path: True,
     )
 
-    def fake_read(_path):
+    def fake_read(_path, mmap=False):
         audio = np.zeros((60, 1), dtype=np.int16)
         return 48000, audio
 
@@ -635,7 +939,8 @@ def test_small_mode_preserves_lower_resolution(monkeypatch, tmp_path):
         lambda *_args, **_kwargs: ([[0, 10, 0]], np.array([True] * 10)),
     )
     monkeypatch.setattr(
-        "talks_reducer.pipeline.chunk_utils.get_tree_expression", lambda _chunks: "X"
+        "talks_reducer.pipeline.chunk_utils.get_tree_expression",
+        lambda _chunks, separator=",": "X",
     )
 
     def fake_run(command, *args, **kwargs):
@@ -674,6 +979,7 @@ def test_small_mode_preserves_lower_resolution(monkeypatch, tmp_path):
     assert "scale=" not in filter_graph
 
 
+@pytest.mark.usefixtures("_extract_audio_to_wav")
 def test_small_mode_scales_down_when_larger(monkeypatch, tmp_path):
     """When original video height is greater than target, it should scale down."""
 
@@ -710,7 +1016,7 @@ def test_small_mode_scales_down_when_larger(monkeypatch, tmp_path):
 
     monkeypatch.setattr("talks_reducer.pipeline._extract_video_metadata", fake_metadata)
 
-    def fake_read(_path):
+    def fake_read(_path, mmap=False):
         audio = np.zeros((60, 1), dtype=np.int16)
         return 48000, audio
 
@@ -737,7 +1043,8 @@ def test_small_mode_scales_down_when_larger(monkeypatch, tmp_path):
         lambda *_args, **_kwargs: ([[0, 10, 0]], np.array([True] * 10)),
     )
     monkeypatch.setattr(
-        "talks_reducer.pipeline.chunk_utils.get_tree_expression", lambda _chunks: "X"
+        "talks_reducer.pipeline.chunk_utils.get_tree_expression",
+        lambda _chunks, separator=",": "X",
     )
 
     def fake_run(command, *args, **kwargs):
@@ -791,7 +1098,7 @@ def _stub_pipeline_externals(monkeypatch, options):
         "talks_reducer.pipeline.audio_utils.has_audio_stream", lambda _path: True
     )
 
-    def fake_read(_path):
+    def fake_read(_path, mmap=False):
         return 48000, np.zeros((30, 1), dtype=np.int16)
 
     monkeypatch.setattr("talks_reducer.pipeline.wavfile.read", fake_read)
@@ -816,7 +1123,8 @@ def _stub_pipeline_externals(monkeypatch, options):
         lambda *_args, **_kwargs: ([[0, 10, 0]], np.array([True] * 10)),
     )
     monkeypatch.setattr(
-        "talks_reducer.pipeline.chunk_utils.get_tree_expression", lambda _chunks: "X"
+        "talks_reducer.pipeline.chunk_utils.get_tree_expression",
+        lambda _chunks, separator=",": "X",
     )
 
     def fake_run(command, *args, **kwargs):
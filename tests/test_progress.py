@@ -85,6 +85,19 @@ def test_tqdm_progress_handle_lifecycle(monkeypatch: pytest.MonkeyPatch) -> None
     assert recorded["bar"].closed is True
 
 
+def test_tqdm_progress_handle_binds_update_once() -> None:
+    bar = _FakeBar(total=None)
+    handle = progress._TqdmProgressHandle(bar)
+
+    handle.advance(2)
+    handle.advance(0)
+    handle.ensure_total(5)
+    handle.ensure_total(3)
+
+    assert bar.update_calls == [2]
+    assert bar.total == 5
+
+
 def test_tqdm_progress_reporter_log_uses_tqdm_write(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -226,15 +226,15 @@ def test_describe_server_host_handles_lookup_errors(
     assert server._describe_server_host() == "unknown"
 
 
-def test_build_output_path_mirrors_cli_naming(tmp_path: Path) -> None:
-    workspace = tmp_path / "workspace"
-    workspace.mkdir()
-
-    output_path = server._build_output_path(Path("video.mp4"), workspace, small=False)
-    small_output = server._build_output_path(Path("video.mp4"), workspace, small=True)
+@pytest.mark.parametrize(
+    ("small", "suffix"), [(False, "_speedup.mp4"), (True, "_speedup_small.mp4")]
+)
+def test_build_output_path_mirrors_cli_naming(
+    tmp_path: Path, small: bool, suffix: str
+) -> None:
+    output_path = server._build_output_path(Path("video.mp4"), tmp_path, small=small)
 
-    assert output_path.name.endswith("_speedup.mp4")
-    assert small_output.name.endswith("_speedup_small.mp4")
+    assert output_path.name.endswith(suffix)
 
 
 def test_build_output_path_includes_codec_suffix(tmp_path: Path) -> None:
@@ -268,9 +268,11 @@ def test_build_output_path_without_speedup_forces_codec(tmp_path: Path) -> None:
     assert output_path.name == "video_h264.mp4"
 
 
-def test_format_duration_handles_hours_minutes_seconds() -> None:
-    assert server._format_duration(3665) == "1h 1m 5s"
-    assert server._format_duration(0) == "0s"
+@pytest.mark.parametrize(("seconds", "expected"), [(3665, "1h 1m 5s"), (0, "0s")])
+def test_format_duration_handles_hours_minutes_seconds(
+    seconds: float, expected: str
+) -> None:
+    assert server._format_duration(seconds) == expected
 
 
 def test_format_summary_includes_ratios() -> None:
@@ -295,11 +297,12 @@ def test_format_summary_includes_ratios() -> None:
     assert "Chunks merged" in summary
 
 
-def test_format_duration_compact_has_no_spaces() -> None:
-    assert server._format_duration_compact(0) == "0s"
-    assert server._format_duration_compact(12) == "12s"
-    assert server._format_duration_compact(3574) == "59m34s"
-    assert server._format_duration_compact(4332) == "1h12m12s"
+@pytest.mark.parametrize(
+    ("seconds", "expected"),
+    [(0, "0s"), (12, "12s"), (3574, "59m34s"), (4332, "1h12m12s")],
+)
+def test_format_duration_compact_has_no_spaces(seconds: float, expected: str) -> None:
+    assert server._format_duration_compact(seconds) == expected
 
 
 def test_format_size_compact() -> None:
@@ -1087,33 +1090,37 @@ def test_guess_local_url_uses_loopback_for_wildcard() -> None:
     )
 
 
-def test_iter_icon_candidates_covers_packaged_roots(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
-) -> None:
-    """The icon discovery should probe project, frozen, and dist roots."""
+@pytest.fixture(scope="session")
+def packaged_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the project, frozen and dist icon layouts once per session.
 
-    module_dir = tmp_path / "pkg" / "talks_reducer"
+    The tree is only probed, never modified, so tests can share it.
+    """
+
+    root = tmp_path_factory.mktemp("packaged")
+    module_dir = root / "pkg" / "talks_reducer"
     module_dir.mkdir(parents=True)
-    module_file = module_dir / "server_tray.py"
-    module_file.write_text("# dummy module")
+    (module_dir / "server_tray.py").write_text("# dummy module")
 
-    project_docs_icon = module_dir.parent / "docs" / "assets" / "icon.png"
-    project_docs_icon.parent.mkdir(parents=True)
-    project_docs_icon.write_bytes(b"\x89PNG\r\n\x1a\n")
+    for icon in (
+        root / "pkg" / "docs" / "assets" / "icon.png",
+        root / "frozen" / "docs" / "assets" / "icon.png",
+        root / "dist" / "docs" / "assets" / "icon.png",
+        root / "dist" / "_internal" / "docs" / "assets" / "icon.png",
+    ):
+        icon.parent.mkdir(parents=True)
+        icon.write_bytes(b"PNG")
+    return root
 
-    frozen_root = tmp_path / "frozen"
-    frozen_icon = frozen_root / "docs" / "assets" / "icon.png"
-    frozen_icon.parent.mkdir(parents=True)
-    frozen_icon.write_bytes(b"PNG")
 
-    dist_root = tmp_path / "dist"
-    dist_icon = dist_root / "docs" / "assets" / "icon.png"
-    dist_icon.parent.mkdir(parents=True)
-    dist_icon.write_bytes(b"PNG")
+def test_iter_icon_candidates_covers_packaged_roots(
+    monkeypatch: pytest.MonkeyPatch, packaged_tree: Path
+) -> None:
+    """The icon discovery should probe project, frozen, and dist roots."""
 
-    internal_icon = dist_root / "_internal" / "docs" / "assets" / "icon.png"
-    internal_icon.parent.mkdir(parents=True)
-    internal_icon.write_bytes(b"PNG")
+    module_file = packaged_tree / "pkg" / "talks_reducer" / "server_tray.py"
+    frozen_root = packaged_tree / "frozen"
+    dist_root = packaged_tree / "dist"
 
     monkeypatch.setattr(server_tray, "__file__", str(module_file))
     monkeypatch.setattr(server_tray.sys, "_MEIPASS", str(frozen_root), raising=False)
@@ -1132,10 +1139,13 @@ def test_iter_icon_candidates_covers_packaged_roots(
 
     candidates = list(server_tray._iter_icon_candidates())
 
-    assert project_docs_icon.resolve() in candidates
-    assert frozen_icon.resolve() in candidates
-    assert dist_icon.resolve() in candidates
-    assert internal_icon.resolve() in candidates
+    for root in (
+        packaged_tree / "pkg",
+        frozen_root,
+        dist_root,
+        dist_root / "_internal",
+    ):
+        assert (root / "docs" / "assets" / "icon.png").resolve() in candidates
 
 
 def test_iter_icon_candidates_includes_package_resources(
@@ -1172,21 +1182,29 @@ def test_iter_icon_candidates_includes_package_resources(
     assert icon_path.resolve() in candidates
 
 
+@pytest.fixture(scope="session")
+def shared_icon_png(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Encode a small RGBA icon once and share it across tests."""
+
+    icon_path = tmp_path_factory.mktemp("icons") / "icon.png"
+    Image.new("RGBA", (3, 5), color=(10, 20, 30, 255)).save(icon_path)
+    return icon_path
+
+
 def test_load_icon_uses_first_existing_candidate(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch, shared_icon_png: Path
 ) -> None:
     """The loader should return the first resolvable candidate image."""
 
-    icon_path = tmp_path / "icon.png"
-    Image.new("RGBA", (3, 5), color=(10, 20, 30, 255)).save(icon_path)
-
     monkeypatch.setattr(
         server_tray,
         "_iter_icon_candidates",
-        lambda: iter([icon_path]),
+        lambda: iter([shared_icon_png]),
     )
+    server_tray._load_icon.cache_clear()
 
     icon = server_tray._load_icon()
+    server_tray._load_icon.cache_clear()
 
     assert icon.size == (3, 5)
 
@@ -1197,8 +1215,10 @@ def test_load_icon_falls_back_to_embedded_asset(
     """Missing filesystem icons should be handled by the embedded fallback."""
 
     monkeypatch.setattr(server_tray, "_iter_icon_candidates", lambda: iter(()))
+    server_tray._load_icon.cache_clear()
 
     icon = server_tray._load_icon()
+    server_tray._load_icon.cache_clear()
 
     assert icon.size == (64, 64)
     colors = icon.getcolors(maxcolors=256)
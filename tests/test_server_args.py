@@ -0,0 +1,34 @@
+"""Tests for the shared server argument parser."""
+
+from __future__ import annotations
+
+import argparse
+
+from talks_reducer.server_args import build_server_parser
+
+
+def test_build_server_parser_returns_independent_parsers() -> None:
+    first = build_server_parser(description="Server", default_open_browser=True)
+    second = build_server_parser(description="Server", default_open_browser=True)
+    other = build_server_parser(description="Server", default_open_browser=False)
+
+    first.add_argument("--debug", action="store_true")
+
+    assert first is not second
+    assert second.parse_args([]) == argparse.Namespace(
+        host="0.0.0.0", port=9005, share=False, concurrency=1, open_browser=True
+    )
+    assert other.parse_args([]).open_browser is False
+
+
+def test_build_server_parser_can_be_extended_as_parent() -> None:
+    base = build_server_parser(description="Tray", default_open_browser=False)
+
+    for _ in range(2):
+        parser = argparse.ArgumentParser(parents=[base], add_help=False)
+        parser.add_argument("--debug", action="store_true")
+        args = parser.parse_args(["--port", "9100", "--debug"])
+
+        assert args.port == 9100
+        assert args.debug is True
+        assert args.open_browser is False
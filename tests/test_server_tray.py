@@ -109,16 +109,7 @@ class DummyURL:
         return f"DummyURL({self._value!r})"
 
 
-@pytest.fixture()
-def fast_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Patch ``server_tray.time.sleep`` to avoid slow polling in tests."""
-
-    monkeypatch.setattr(server_tray.time, "sleep", lambda _seconds: None)
-
-
-def test_headless_mode_runs_and_opens_browser(
-    monkeypatch: pytest.MonkeyPatch, fast_sleep: None
-) -> None:
+def test_headless_mode_runs_and_opens_browser(monkeypatch: pytest.MonkeyPatch) -> None:
     open_calls: List[str] = []
     launch_calls: List[dict] = []
     backend = DummyTrayBackend()
@@ -175,7 +166,7 @@ def test_headless_mode_runs_and_opens_browser(
 
 
 def test_headless_mode_uses_stringified_share_url(
-    monkeypatch: pytest.MonkeyPatch, fast_sleep: None
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     open_calls: List[str] = []
     backend = DummyTrayBackend()
@@ -212,9 +203,87 @@ def test_headless_mode_uses_stringified_share_url(
     assert not runner.is_alive()
 
 
-def test_pystray_detached_mode_stops_icon(
-    monkeypatch: pytest.MonkeyPatch, fast_sleep: None
+def test_handle_open_webui_opens_off_thread_and_coalesces_clicks() -> None:
+    opened = threading.Event()
+    open_calls: List[Any] = []
+
+    def _open(url: str) -> None:
+        open_calls.append((url, threading.current_thread()))
+        opened.set()
+
+    app = server_tray._ServerTrayApplication(
+        host="127.0.0.1",
+        port=9005,
+        share=False,
+        open_browser=False,
+        tray_mode="headless",
+        tray_backend=DummyTrayBackend(),
+        build_interface=lambda: None,
+        open_browser_callback=_open,
+    )
+    app._local_url = "http://127.0.0.1:9005/"
+
+    app._handle_open_webui()
+    app._handle_open_webui()
+
+    assert opened.wait(timeout=1.0)
+    assert len(open_calls) == 1
+    assert open_calls[0][0] == "http://127.0.0.1:9005/"
+    assert open_calls[0][1] is not threading.current_thread()
+
+
+def test_launch_server_waits_for_late_share_url(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The share URL is picked up once published and the watcher then exits."""
+
+    monkeypatch.setattr(server_tray, "_SHARE_URL_INITIAL_BACKOFF", 0.01)
+    server = DummyServer(DummyURL("http://127.0.0.1:9005/"))
+    app = server_tray._ServerTrayApplication(
+        host="127.0.0.1",
+        port=9005,
+        share=True,
+        open_browser=False,
+        tray_mode="headless",
+        tray_backend=DummyTrayBackend(),
+        build_interface=lambda: DummyDemo(server, []),
+        open_browser_callback=lambda _url: None,
+    )
+
+    launcher = threading.Thread(target=app._launch_server, daemon=True)
+    launcher.start()
+    assert app._server_ready_event.wait(timeout=1.0)
+    assert app._share_url is None
+
+    server.share_url = DummyURL("https://late.example.test/")
+    launcher.join(timeout=2.0)
+
+    assert not launcher.is_alive()
+    assert app._share_url == "https://late.example.test/"
+
+
+def test_launch_server_returns_immediately_without_share(
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
+    server = DummyServer(DummyURL("http://127.0.0.1:9005/"))
+    app = server_tray._ServerTrayApplication(
+        host="127.0.0.1",
+        port=9005,
+        share=False,
+        open_browser=False,
+        tray_mode="headless",
+        tray_backend=DummyTrayBackend(),
+        build_interface=lambda: DummyDemo(server, []),
+        open_browser_callback=lambda _url: None,
+    )
+
+    app._launch_server()
+
+    assert app._server_ready_event.is_set()
+    assert app._share_url is None
+
+
+def test_pystray_detached_mode_stops_icon(monkeypatch: pytest.MonkeyPatch) -> None:
     backend = DummyTrayBackend()
     server = DummyServer("http://127.0.0.1:9005/")
     demo = DummyDemo(server, [])
@@ -468,12 +537,33 @@ def test_load_icon_applies_monochrome_only_on_macos(
     monkeypatch.setattr(server_tray, "_make_macos_template_icon", _record)
 
     monkeypatch.setattr(server_tray.sys, "platform", "linux")
+    server_tray._load_icon.cache_clear()
     server_tray._load_icon()
     assert calls == []
 
     monkeypatch.setattr(server_tray.sys, "platform", "darwin")
+    server_tray._load_icon.cache_clear()
     server_tray._load_icon()
     assert len(calls) == 1
+    server_tray._load_icon.cache_clear()
+
+
+def test_load_icon_is_memoized(monkeypatch: pytest.MonkeyPatch) -> None:
+    scans: List[int] = []
+
+    def _candidates() -> Any:
+        scans.append(1)
+        return iter(())
+
+    monkeypatch.setattr(server_tray, "_iter_icon_candidates", _candidates)
+    server_tray._load_icon.cache_clear()
+
+    first = server_tray._load_icon()
+    second = server_tray._load_icon()
+
+    assert first is second
+    assert len(scans) == 1
+    server_tray._load_icon.cache_clear()
 
 
 def test_apply_macos_template_image_sets_template_flag() -> None:
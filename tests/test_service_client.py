@@ -1,29 +1,25 @@
 import asyncio
 import io
+from pathlib import Path
 from types import SimpleNamespace
 from typing import Optional
 
+import httpx
 import pytest
 
 from talks_reducer import service_client
 
 
 class DummyJob:
+    """Yield every output but the last, which :meth:`result` returns."""
+
     communicator = None
 
     def __init__(self, outputs):
         self._outputs = list(outputs)
-        self._index = 0
 
     def __iter__(self):
-        return self
-
-    def __next__(self):
-        if self._index >= max(len(self._outputs) - 1, 0):
-            raise StopIteration()
-        value = self._outputs[self._index]
-        self._index += 1
-        return value
+        return iter(self._outputs[:-1])
 
     def result(self):
         return self._outputs[-1]
@@ -74,6 +70,30 @@ class DummyClient:
         return DummyJob(self.job_outputs)
 
 
+@pytest.fixture
+def media_files(tmp_path):
+    """Write the input upload and the server's processed output into ``tmp_path``."""
+
+    input_file = tmp_path / "input.mp4"
+    input_file.write_bytes(b"input")
+    server_file = tmp_path / "server_output.mp4"
+    server_file.write_bytes(b"processed")
+    return input_file, server_file
+
+
+@pytest.fixture
+def patched_service_client(monkeypatch):
+    """Return a hook that routes ``Client`` and ``gradio_file`` to test doubles."""
+
+    def install(client_instance):
+        monkeypatch.setattr(service_client, "Client", lambda url: client_instance)
+        monkeypatch.setattr(
+            service_client, "gradio_file", lambda path: SimpleNamespace(path=path)
+        )
+
+    return install
+
+
 def test_pump_job_updates_emits_logs_and_progress():
     status_update = SimpleNamespace(
         type="status",
@@ -147,7 +167,7 @@ def test_emit_progress_update_uses_fractional_progress():
     assert events == [("Encode", 4, 8, "frames")]
 
 
-def test_send_video_emits_upload_progress(monkeypatch, tmp_path):
+def test_send_video_emits_upload_progress(patched_service_client, tmp_path):
     """``send_video`` should emit start/complete ``Uploading:`` progress events."""
 
     input_file = tmp_path / "input.mp4"
@@ -160,10 +180,7 @@ def test_send_video_emits_upload_progress(monkeypatch, tmp_path):
         (str(server_file), "log", "summary", str(server_file))
     ]
 
-    monkeypatch.setattr(service_client, "Client", lambda url: client_instance)
-    monkeypatch.setattr(
-        service_client, "gradio_file", lambda path: SimpleNamespace(path=path)
-    )
+    patched_service_client(client_instance)
 
     progress_events: list[tuple[str, Optional[int], Optional[int], str]] = []
     service_client.send_video(
@@ -178,8 +195,228 @@ def test_send_video_emits_upload_progress(monkeypatch, tmp_path):
     assert ("Uploading:", upload_total, upload_total, "bytes") in progress_events
 
 
-def test_send_video_without_callback_skips_upload_progress(monkeypatch, tmp_path):
-    """Callers without a ``progress_callback`` should behave exactly as before."""
+def test_link_or_copy_hardlinks_and_replaces_existing(tmp_path):
+    source = tmp_path / "server_output.mp4"
+    source.write_bytes(b"processed")
+    destination = tmp_path / "output.mp4"
+    destination.write_bytes(b"stale")
+
+    service_client._link_or_copy(source, destination)
+
+    assert destination.read_bytes() == b"processed"
+    assert destination.stat().st_ino == source.stat().st_ino
+
+
+def test_link_or_copy_falls_back_to_copy(monkeypatch, tmp_path):
+    source = tmp_path / "server_output.mp4"
+    source.write_bytes(b"processed")
+    destination = tmp_path / "output.mp4"
+
+    def _cross_device(src, dst):
+        raise OSError(18, "Invalid cross-device link")
+
+    monkeypatch.setattr(service_client.os, "link", _cross_device)
+
+    service_client._link_or_copy(source, destination)
+
+    assert destination.read_bytes() == b"processed"
+    assert destination.stat().st_ino != source.stat().st_ino
+
+
+def test_link_or_copy_keeps_destination_when_copy_fails(monkeypatch, tmp_path):
+    source = tmp_path / "server_output.mp4"
+    source.write_bytes(b"processed")
+    destination = tmp_path / "output.mp4"
+    destination.write_bytes(b"previous")
+
+    def _cross_device(src, dst):
+        raise OSError(18, "Invalid cross-device link")
+
+    def _disk_full(src, dst):
+        Path(dst).write_bytes(b"partial")
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(service_client.os, "link", _cross_device)
+    monkeypatch.setattr(service_client.shutil, "copy2", _disk_full)
+
+    with pytest.raises(OSError):
+        service_client._link_or_copy(source, destination)
+
+    assert destination.read_bytes() == b"previous"
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "output.mp4",
+        "server_output.mp4",
+    ]
+
+
+def test_send_video_reuses_pooled_client(monkeypatch, tmp_path):
+    """Repeated calls to one server should only build a single client."""
+
+    input_file = tmp_path / "input.mp4"
+    input_file.write_bytes(b"input-bytes")
+    server_file = tmp_path / "server_output.mp4"
+    server_file.write_bytes(b"processed")
+
+    built: list[DummyClient] = []
+
+    def _build(url):
+        client = DummyClient(url)
+        client.job_outputs = [(str(server_file), "log", "summary", str(server_file))]
+        built.append(client)
+        return client
+
+    monkeypatch.setattr(service_client, "Client", _build)
+    monkeypatch.setattr(service_client, "_CLIENT_CACHE", {})
+    monkeypatch.setattr(
+        service_client, "gradio_file", lambda path: SimpleNamespace(path=path)
+    )
+
+    for index in range(3):
+        service_client.send_video(
+            input_path=input_file,
+            output_path=tmp_path / f"output{index}.mp4",
+            server_url="http://localhost:9005/",
+        )
+
+    assert len(built) == 1
+    assert len(built[0].submissions) == 3
+
+
+class StaleDummyClient(DummyClient):
+    """Client whose server went away: every submit fails to connect."""
+
+    def submit(self, *args, **kwargs):
+        self.submissions.append((args, kwargs))
+        raise httpx.ConnectError("connection refused")
+
+
+def test_send_video_retries_stale_pooled_client(monkeypatch, media_files, tmp_path):
+    """A pooled client that lost its server is dropped and replaced once."""
+
+    input_file, server_file = media_files
+    stale = StaleDummyClient("http://localhost:9005/")
+    built: list[DummyClient] = []
+
+    def _build(url):
+        client = DummyClient(url)
+        client.job_outputs = [(str(server_file), "log", "summary", str(server_file))]
+        built.append(client)
+        return client
+
+    monkeypatch.setattr(service_client, "Client", _build)
+    monkeypatch.setattr(
+        service_client, "_CLIENT_CACHE", {(_build, "http://localhost:9005/"): [stale]}
+    )
+    monkeypatch.setattr(
+        service_client, "gradio_file", lambda path: SimpleNamespace(path=path)
+    )
+
+    destination, summary, _ = service_client.send_video(
+        input_path=input_file,
+        output_path=tmp_path / "output.mp4",
+        server_url="http://localhost:9005/",
+    )
+
+    assert summary == "summary"
+    assert destination.read_bytes() == b"processed"
+    assert len(stale.submissions) == 1
+    assert len(built) == 1
+    assert service_client._CLIENT_CACHE == {
+        (_build, "http://localhost:9005/"): [built[0]]
+    }
+
+
+class DroppedResultJob(DummyJob):
+    """Job the server accepted whose result connection then broke."""
+
+    def result(self):
+        raise httpx.ReadError("connection reset while polling")
+
+
+def test_send_video_does_not_retry_after_job_was_accepted(
+    monkeypatch, media_files, tmp_path
+):
+    """Errors after the server took the job must not upload the video again."""
+
+    input_file, _ = media_files
+    pooled = DummyClient("http://localhost:9005/")
+    pooled.submit = lambda *args, **kwargs: (
+        pooled.submissions.append((args, kwargs)) or DroppedResultJob([])
+    )
+    built: list[DummyClient] = []
+
+    def _build(url):  # pragma: no cover - failure path
+        built.append(DummyClient(url))
+        return built[-1]
+
+    monkeypatch.setattr(service_client, "Client", _build)
+    monkeypatch.setattr(
+        service_client,
+        "_CLIENT_CACHE",
+        {(_build, "http://localhost:9005/"): [pooled]},
+    )
+    monkeypatch.setattr(
+        service_client, "gradio_file", lambda path: SimpleNamespace(path=path)
+    )
+
+    with pytest.raises(httpx.ReadError):
+        service_client.send_video(
+            input_path=input_file,
+            output_path=tmp_path / "output.mp4",
+            server_url="http://localhost:9005/",
+        )
+
+    assert len(pooled.submissions) == 1
+    assert built == []
+
+
+def test_send_video_does_not_retry_fresh_client(monkeypatch, media_files, tmp_path):
+    """Connection errors on a newly built client are the caller's to handle."""
+
+    input_file, _ = media_files
+    built: list[DummyClient] = []
+
+    def _build(url):
+        built.append(StaleDummyClient(url))
+        return built[-1]
+
+    monkeypatch.setattr(service_client, "Client", _build)
+    monkeypatch.setattr(service_client, "_CLIENT_CACHE", {})
+    monkeypatch.setattr(
+        service_client, "gradio_file", lambda path: SimpleNamespace(path=path)
+    )
+
+    with pytest.raises(httpx.ConnectError):
+        service_client.send_video(
+            input_path=input_file,
+            output_path=tmp_path / "output.mp4",
+            server_url="http://localhost:9005/",
+        )
+
+    assert len(built) == 1
+    assert service_client._CLIENT_CACHE == {}
+
+
+def test_release_cached_client_caps_idle_clients_and_servers(monkeypatch):
+    monkeypatch.setattr(service_client, "_CLIENT_CACHE", {})
+    monkeypatch.setattr(service_client, "_CLIENT_CACHE_MAX_IDLE", 2)
+    monkeypatch.setattr(service_client, "_CLIENT_CACHE_MAX_SERVERS", 2)
+
+    for name in "abc":
+        service_client._release_cached_client(DummyClient, "http://one/", name)
+    service_client._release_cached_client(DummyClient, "http://two/", "d")
+    # Touching ``one`` again makes ``two`` the least recently used server.
+    service_client._release_cached_client(DummyClient, "http://one/", "e")
+    service_client._release_cached_client(DummyClient, "http://three/", "f")
+
+    assert service_client._CLIENT_CACHE == {
+        (DummyClient, "http://one/"): ["a", "b"],
+        (DummyClient, "http://three/"): ["f"],
+    }
+
+
+def test_send_video_uses_injected_client(monkeypatch, tmp_path):
+    """An explicit ``client`` should be used without building a new one."""
 
     input_file = tmp_path / "input.mp4"
     input_file.write_bytes(b"input-bytes")
@@ -191,11 +428,43 @@ def test_send_video_without_callback_skips_upload_progress(monkeypatch, tmp_path
         (str(server_file), "log", "summary", str(server_file))
     ]
 
-    monkeypatch.setattr(service_client, "Client", lambda url: client_instance)
+    def _unexpected(url):  # pragma: no cover - failure path
+        raise AssertionError("Client should not be constructed")
+
+    monkeypatch.setattr(service_client, "Client", _unexpected)
+    monkeypatch.setattr(service_client, "_CLIENT_CACHE", {})
     monkeypatch.setattr(
         service_client, "gradio_file", lambda path: SimpleNamespace(path=path)
     )
 
+    service_client.send_video(
+        input_path=input_file,
+        output_path=tmp_path / "output.mp4",
+        server_url="http://localhost:9005/",
+        client=client_instance,
+    )
+
+    assert len(client_instance.submissions) == 1
+    assert service_client._CLIENT_CACHE == {}
+
+
+def test_send_video_without_callback_skips_upload_progress(
+    patched_service_client, tmp_path
+):
+    """Callers without a ``progress_callback`` should behave exactly as before."""
+
+    input_file = tmp_path / "input.mp4"
+    input_file.write_bytes(b"input-bytes")
+    server_file = tmp_path / "server_output.mp4"
+    server_file.write_bytes(b"processed")
+
+    client_instance = DummyClient("http://localhost:9005/")
+    client_instance.job_outputs = [
+        (str(server_file), "log", "summary", str(server_file))
+    ]
+
+    patched_service_client(client_instance)
+
     destination, summary, log_text = service_client.send_video(
         input_path=input_file,
         output_path=tmp_path / "output.mp4",
@@ -329,21 +598,15 @@ def test_stream_job_updates_propagates_cancellation(monkeypatch):
         service_client._stream_job_updates(streaming_job, lambda _msg: None)
 
 
-def test_send_video_downloads_file(monkeypatch, tmp_path):
-    input_file = tmp_path / "input.mp4"
-    input_file.write_bytes(b"input")
-    server_file = tmp_path / "server_output.mp4"
-    server_file.write_bytes(b"processed")
+def test_send_video_downloads_file(patched_service_client, tmp_path, media_files):
+    input_file, server_file = media_files
 
     client_instance = DummyClient("http://localhost:9005/")
     client_instance.job_outputs = [
         (str(server_file), "log", "summary", str(server_file))
     ]
 
-    monkeypatch.setattr(service_client, "Client", lambda url: client_instance)
-    monkeypatch.setattr(
-        service_client, "gradio_file", lambda path: SimpleNamespace(path=path)
-    )
+    patched_service_client(client_instance)
 
     destination, summary, log_text = service_client.send_video(
         input_path=input_file,
@@ -368,11 +631,8 @@ def test_send_video_downloads_file(monkeypatch, tmp_path):
     assert submission_kwargs.get("api_name") == "/process_video"
 
 
-def test_send_video_streams_logs(monkeypatch, tmp_path):
-    input_file = tmp_path / "input.mp4"
-    input_file.write_bytes(b"input")
-    server_file = tmp_path / "server_output.mp4"
-    server_file.write_bytes(b"processed")
+def test_send_video_streams_logs(patched_service_client, media_files):
+    input_file, server_file = media_files
 
     client_instance = DummyClient("http://localhost:9005/")
     client_instance.job_outputs = [
@@ -381,10 +641,7 @@ def test_send_video_streams_logs(monkeypatch, tmp_path):
         (str(server_file), "first\nsecond\nthird", "summary", str(server_file)),
     ]
 
-    monkeypatch.setattr(service_client, "Client", lambda url: client_instance)
-    monkeypatch.setattr(
-        service_client, "gradio_file", lambda path: SimpleNamespace(path=path)
-    )
+    patched_service_client(client_instance)
 
     streamed_lines = []
     destination, summary, log_text = service_client.send_video(
@@ -400,22 +657,42 @@ def test_send_video_streams_logs(monkeypatch, tmp_path):
     assert destination.name == server_file.name
 
 
-def test_send_video_stream_flag(monkeypatch, tmp_path):
-    input_file = tmp_path / "input.mp4"
-    input_file.write_bytes(b"input")
-    server_file = tmp_path / "server_output.mp4"
-    server_file.write_bytes(b"processed")
+def test_send_video_streams_only_new_log_text(patched_service_client, media_files):
+    """Growing partial lines and split ``\\r\\n`` endings are reported once."""
+
+    input_file, server_file = media_files
 
     client_instance = DummyClient("http://localhost:9005/")
     client_instance.job_outputs = [
-        (str(server_file), "first\nsecond", "summary", str(server_file))
+        (None, "fir", None, None),
+        (None, "first\r", None, None),
+        (None, "first\r\nsec", None, None),
+        (str(server_file), "first\r\nsecond\nthird", "summary", str(server_file)),
     ]
 
-    monkeypatch.setattr(service_client, "Client", lambda url: client_instance)
-    monkeypatch.setattr(
-        service_client, "gradio_file", lambda path: SimpleNamespace(path=path)
+    patched_service_client(client_instance)
+
+    streamed_lines: list[str] = []
+    service_client.send_video(
+        input_path=input_file,
+        output_path=None,
+        server_url="http://localhost:9005/",
+        log_callback=streamed_lines.append,
     )
 
+    assert streamed_lines == ["fir", "sec", "third"]
+
+
+def test_send_video_stream_flag(monkeypatch, patched_service_client, media_files):
+    input_file, server_file = media_files
+
+    client_instance = DummyClient("http://localhost:9005/")
+    client_instance.job_outputs = [
+        (str(server_file), "first\nsecond", "summary", str(server_file))
+    ]
+
+    patched_service_client(client_instance)
+
     stream_calls = []
 
     def _fake_stream(job, emit_log, *, progress_callback=None):
@@ -453,21 +730,15 @@ def test_send_video_stream_flag(monkeypatch, tmp_path):
 
 
 @pytest.mark.parametrize("codec", ["av1", "hevc", "mp3"])
-def test_send_video_forwards_custom_options(monkeypatch, tmp_path, codec):
-    input_file = tmp_path / "input.mp4"
-    input_file.write_bytes(b"input")
-    server_file = tmp_path / "server_output.mp4"
-    server_file.write_bytes(b"processed")
+def test_send_video_forwards_custom_options(patched_service_client, codec, media_files):
+    input_file, server_file = media_files
 
     client_instance = DummyClient("http://localhost:9005/")
     client_instance.job_outputs = [
         (str(server_file), "log", "summary", str(server_file))
     ]
 
-    monkeypatch.setattr(service_client, "Client", lambda url: client_instance)
-    monkeypatch.setattr(
-        service_client, "gradio_file", lambda path: SimpleNamespace(path=path)
-    )
+    patched_service_client(client_instance)
 
     destination, summary, log_text = service_client.send_video(
         input_path=input_file,
@@ -495,23 +766,17 @@ def test_send_video_forwards_custom_options(monkeypatch, tmp_path, codec):
     assert submission_args[10:13] == (False, None, None)
 
 
-def test_send_video_forwards_cut_range(monkeypatch, tmp_path):
+def test_send_video_forwards_cut_range(patched_service_client, media_files):
     """The keep-range trim values must reach the server in positional order."""
 
-    input_file = tmp_path / "input.mp4"
-    input_file.write_bytes(b"input")
-    server_file = tmp_path / "server_output.mp4"
-    server_file.write_bytes(b"processed")
+    input_file, server_file = media_files
 
     client_instance = DummyClient("http://localhost:9005/")
     client_instance.job_outputs = [
         (str(server_file), "log", "summary", str(server_file))
     ]
 
-    monkeypatch.setattr(service_client, "Client", lambda url: client_instance)
-    monkeypatch.setattr(
-        service_client, "gradio_file", lambda path: SimpleNamespace(path=path)
-    )
+    patched_service_client(client_instance)
 
     service_client.send_video(
         input_path=input_file,
@@ -528,21 +793,15 @@ def test_send_video_forwards_cut_range(monkeypatch, tmp_path):
     assert submission_args[12] == 60.0
 
 
-def test_send_video_honors_add_codec_suffix(monkeypatch, tmp_path):
-    input_file = tmp_path / "input.mp4"
-    input_file.write_bytes(b"input")
-    server_file = tmp_path / "server_output.mp4"
-    server_file.write_bytes(b"processed")
+def test_send_video_honors_add_codec_suffix(patched_service_client, media_files):
+    input_file, server_file = media_files
 
     client_instance = DummyClient("http://localhost:9005/")
     client_instance.job_outputs = [
         (str(server_file), "log", "summary", str(server_file))
     ]
 
-    monkeypatch.setattr(service_client, "Client", lambda url: client_instance)
-    monkeypatch.setattr(
-        service_client, "gradio_file", lambda path: SimpleNamespace(path=path)
-    )
+    patched_service_client(client_instance)
 
     destination, *_ = service_client.send_video(
         input_path=input_file,
@@ -557,21 +816,17 @@ def test_send_video_honors_add_codec_suffix(monkeypatch, tmp_path):
     assert submission_args[5] is True
 
 
-def test_send_video_defaults_to_current_directory(monkeypatch, tmp_path, cwd_tmp_path):
-    input_file = tmp_path / "input.mp4"
-    input_file.write_bytes(b"input")
-    server_file = tmp_path / "server_output.mp4"
-    server_file.write_bytes(b"processed")
+def test_send_video_defaults_to_current_directory(
+    patched_service_client, tmp_path, cwd_tmp_path, media_files
+):
+    input_file, server_file = media_files
 
     client_instance = DummyClient("http://localhost:9005/")
     client_instance.job_outputs = [
         (str(server_file), "log", "summary", str(server_file))
     ]
 
-    monkeypatch.setattr(service_client, "Client", lambda url: client_instance)
-    monkeypatch.setattr(
-        service_client, "gradio_file", lambda path: SimpleNamespace(path=path)
-    )
+    patched_service_client(client_instance)
 
     destination, _, _ = service_client.send_video(
         input_path=input_file,
@@ -1052,6 +1307,30 @@ def test_install_transfer_progress_streams_upload_and_download(monkeypatch, tmp_
     assert service_client_module.httpx.stream is fake_stream
 
 
+def test_install_transfer_progress_does_not_stack_on_reused_client():
+    """Reinstalling on a pooled client should wrap the original endpoint."""
+
+    class FakeEndpoint:
+        def _upload_file(self, file_obj, data_index=0):  # pragma: no cover
+            return {"path": "/server/input.mp4"}
+
+        def _download_file(self, payload):  # pragma: no cover - unused
+            return b""
+
+    endpoint = FakeEndpoint()
+    original_upload = endpoint._upload_file
+    client = SimpleNamespace(
+        endpoints={0: endpoint}, _infer_fn_index=lambda api_name, fn_index: 0
+    )
+
+    for _ in range(2):
+        assert service_client._install_transfer_progress(
+            client, "/process_video", 10, lambda *args: None
+        )
+
+    assert endpoint._upload_file.__wrapped__ == original_upload
+
+
 def test_install_transfer_progress_restores_httpx_on_error(monkeypatch, tmp_path):
     """A failing upload/download still restores the patched httpx globals."""
 
@@ -1430,13 +1709,12 @@ def test_send_video_downloads_remote_path_over_http(monkeypatch, tmp_path):
     assert captured["url"] == "http://server:9005/file=" + remote_path
 
 
-def test_send_video_falls_back_when_download_files_unsupported(monkeypatch, tmp_path):
+def test_send_video_falls_back_when_download_files_unsupported(
+    monkeypatch, tmp_path, media_files
+):
     """A factory rejecting ``download_files`` keeps the legacy copy path."""
 
-    input_file = tmp_path / "input.mp4"
-    input_file.write_bytes(b"input")
-    server_file = tmp_path / "server_output.mp4"
-    server_file.write_bytes(b"processed")
+    input_file, server_file = media_files
 
     def factory(server_url, **kwargs):
         if kwargs:
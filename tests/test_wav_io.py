@@ -64,3 +64,31 @@ def test_round_trip_float64(tmp_path):
 
     assert rate == 48000
     np.testing.assert_array_equal(restored, data)
+
+
+def test_read_mmap_matches_regular_read(tmp_path):
+    """A memory-mapped read must expose the same samples as a full load."""
+
+    data = (np.random.default_rng(30).standard_normal((400, 2)) * 3000).astype(np.int16)
+    path = tmp_path / "mapped.wav"
+    wav_io.write(str(path), 48000, data)
+
+    rate, mapped = wav_io.read(str(path), mmap=True)
+
+    assert rate == 48000
+    assert isinstance(mapped, np.memmap)
+    assert not mapped.flags.writeable
+    np.testing.assert_array_equal(mapped, data)
+
+
+def test_read_mmap_rejects_empty_data(tmp_path):
+    """Empty audio cannot be mapped, so callers get a ``ValueError`` to fall back."""
+
+    path = tmp_path / "empty.wav"
+    wav_io.write(str(path), 48000, np.zeros((0, 2), dtype=np.int16))
+
+    with pytest.raises(ValueError):
+        wav_io.read(str(path), mmap=True)
+    rate, data = wav_io.read(str(path))
+    assert rate == 48000
+    assert data.size == 0